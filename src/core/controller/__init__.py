@@ -7,6 +7,7 @@ from .investments import (
     investment_plan_instances_router
 )
 from .export_import import transactions_export_router, subscriptions_export_router
+from .reports import reports_router
 
 __all__ = [
     "categories_router",
@@ -20,6 +21,7 @@ __all__ = [
     "investment_plan_instances_router",
     "transactions_export_router",
     "subscriptions_export_router",
+    "reports_router",
 ]
 
 # Made with Bob
\ No newline at end of file
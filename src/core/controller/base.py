@@ -1,15 +1,45 @@
+import sqlite3
+from datetime import date
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, Any
-from fastapi import HTTPException, status
+from functools import partial
+from typing import TypeVar, Generic, Optional, Any, Callable
+from fastapi import HTTPException, Response, status
 from pydantic import BaseModel
+from core.domain import BatchRequest, BatchItemResult, BatchResponse
 from core.repositories.base import IRepository
+from core.repositories.references import ReferenceChecker
+from core.storage.init_db import transaction, savepoint
 from core.utils import generate_uid
-from core.utils.exceptions import DuplicateEntityError
+from core.utils.exceptions import DuplicateEntityError, ForeignKeyViolationError, InvalidCursorError
 
 T = TypeVar(name='T')  # Entity type
 TModel = TypeVar(name='TModel', bound=BaseModel)  # Model type
 TResponse = TypeVar(name='TResponse', bound=BaseModel)  # Response type
 
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+
+
+MAX_GENERATION_YEARS: int = 10
+
+
+def validate_horizon(start: date, until: date) -> None:
+    """Reject instance generation windows that are inverted or span more than MAX_GENERATION_YEARS"""
+    if start > until:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after until")
+    if until.year - start.year > MAX_GENERATION_YEARS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"until must be within {MAX_GENERATION_YEARS} years of start"
+        )
+
+
+def validate_date_range(date_from: Optional[date], date_to: Optional[date]) -> None:
+    """Reject an inverted date filter with 400"""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="date_from must not be after date_to")
+
 
 class BaseController(ABC, Generic[T, TModel, TResponse]):
     """Base controller with common CRUD logic"""
@@ -36,19 +66,52 @@ class BaseController(ABC, Generic[T, TModel, TResponse]):
         """Convert entity to response model"""
         pass
     
+    reference_checker: ReferenceChecker = ReferenceChecker()
+    
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        """Map foreign key fields of the model to (table, entity name); override to validate them"""
+        return {}
+    
+    def collect_references(self, model: TModel) -> dict[str, set[str]]:
+        """Group the foreign key values of a model by referenced table"""
+        collected: dict[str, set[str]] = {}
+        for field_name, (table, _) in self.references.items():
+            value: Optional[str] = getattr(model, field_name)
+            if value is not None:
+                collected.setdefault(table, set()).add(value)
+        return collected
+    
     def validate_dependencies(self, model: TModel) -> None:
-        """Override to validate foreign key dependencies before create/update"""
-        pass
+        """Raise 404 for the first referenced entity that does not exist, checked in one query"""
+        if not self.references:
+            return
+        missing: dict[str, set[str]] = self.reference_checker.find_missing(
+            references=self.collect_references(model=model)
+        )
+        for field_name, (table, name) in self.references.items():
+            value: Optional[str] = getattr(model, field_name)
+            if value is not None and value in missing.get(table, set()):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{name} not found")
+    
+    def reference_error(self, model: TModel) -> HTTPException:
+        """Explain a foreign key violation; only queried after the database rejected a write"""
+        try:
+            self.validate_dependencies(model=model)
+        except HTTPException as e:
+            return e
+        # The referenced row reappeared between the failed write and this check
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Referenced entity changed, retry")
     
     def create(self, data: TModel) -> TResponse:
-        """Create entity"""
-        self.validate_dependencies(model=data)
-        
+        """Create entity; foreign keys are enforced by the database"""
         uid: str = generate_uid()
         entity: T = self.model_to_entity(uid, model=data)
         
         try:
             self.repository.create(entity=entity)
+        except ForeignKeyViolationError:
+            raise self.reference_error(model=data)
         except DuplicateEntityError as e:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
         
@@ -64,39 +127,103 @@ class BaseController(ABC, Generic[T, TModel, TResponse]):
             )
         return self.entity_to_response(entity)
     
-    def get_all(self) -> list[TResponse]:
-        """Get all entities"""
-        entities: list[T] = self.repository.get_all()
-        return [self.entity_to_response(entity) for entity in entities]
+    def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                response: Optional[Response] = None) -> list[TResponse]:
+        """Get all entities, or one keyset page when limit or cursor is given"""
+        if limit is None and cursor is None:
+            entities: list[T] = self.repository.get_all()
+            return [self.entity_to_response(entity) for entity in entities]
+        return self.paginate(fetch=self.repository.get_page, limit=limit, cursor=cursor, response=response)
     
-    def update(self, uid: str, data: TModel) -> TResponse:
-        """Update entity"""
-        existing: Optional[T] = self.repository.get_by_id(uid=uid)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"{self.entity_name} not found"
-            )
-        
-        self.validate_dependencies(model=data)
+    def fetch_matching(self, fetch: Callable[..., tuple[list[Any], Optional[str]]], limit: Optional[int],
+                       cursor: Optional[str], response: Optional[Response],
+                       convert: Optional[Callable[[Any], BaseModel]] = None) -> list[Any]:
+        """Fetch every match via fetch() when neither limit nor cursor is given, else one page"""
+        convert = convert or self.entity_to_response
+        if limit is None and cursor is None:
+            entities, _ = fetch()
+            return [convert(entity) for entity in entities]
+        return self.paginate(fetch=fetch, limit=limit, cursor=cursor, response=response, convert=convert)
+    
+    def paginate(self, fetch: Callable[..., tuple[list[Any], Optional[str]]], limit: Optional[int],
+                 cursor: Optional[str], response: Optional[Response],
+                 convert: Optional[Callable[[Any], BaseModel]] = None) -> list[Any]:
+        """Fetch one page via fetch(limit=, cursor=) and expose its next cursor as a header"""
+        convert = convert or self.entity_to_response
+        try:
+            entities, next_cursor = fetch(limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
+        if response is not None and next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return [convert(entity) for entity in entities]
+    
+    def update(self, uid: str, data: TModel) -> TResponse:
+        """Update entity; a missing uid updates no row and is reported as 404"""
         entity: T = self.model_to_entity(uid, model=data)
         
         try:
             success: bool = self.repository.update(entity=entity)
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Update failed"
-                )
+        except ForeignKeyViolationError:
+            raise self.reference_error(model=data)
         except DuplicateEntityError as e:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
         
+        if not success:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{self.entity_name} not found"
+            )
         return self.entity_to_response(entity)
     
+    def batch(self, data: BatchRequest[TModel]) -> BatchResponse[TResponse]:
+        """Apply creates, updates and deletes in one transaction with a result per item"""
+        results: list[BatchItemResult[TResponse]] = []
+        with transaction() as connection:
+            for index, model in enumerate(data.create):
+                results.append(self._run_batch_item(
+                    connection, operation="create", index=index, uid=None,
+                    action=partial(self.create, data=model), success_code=status.HTTP_201_CREATED
+                ))
+            for index, item in enumerate(data.update):
+                results.append(self._run_batch_item(
+                    connection, operation="update", index=index, uid=item.uid,
+                    action=partial(self.update, item.uid, data=item.data), success_code=status.HTTP_200_OK
+                ))
+            for index, uid in enumerate(data.delete):
+                results.append(self._run_batch_item(
+                    connection, operation="delete", index=index, uid=uid,
+                    action=partial(self.delete, uid), success_code=status.HTTP_204_NO_CONTENT
+                ))
+        
+        succeeded: int = sum(1 for result in results if result.detail is None)
+        return BatchResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+    
+    def _run_batch_item(self, connection: sqlite3.Connection, operation: str, index: int,
+                        uid: Optional[str], action: Callable[[], Optional[TResponse]],
+                        success_code: int) -> BatchItemResult[TResponse]:
+        """Run one batch item under a savepoint so a failure only undoes that item"""
+        try:
+            with savepoint(connection=connection):
+                response: Optional[TResponse] = action()
+        except HTTPException as e:
+            return BatchItemResult(operation=operation, index=index, uid=uid,
+                                   status_code=e.status_code, detail=str(e.detail))
+        
+        result_uid: Optional[str] = getattr(response, "uid", uid)
+        return BatchItemResult(operation=operation, index=index, uid=result_uid,
+                               status_code=success_code, data=response)
+    
     def delete(self, uid: str) -> None:
-        """Delete entity"""
-        success: bool = self.repository.delete(uid=uid)
+        """Delete entity; 409 while other rows still reference it"""
+        try:
+            success: bool = self.repository.delete(uid=uid)
+        except ForeignKeyViolationError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"{self.entity_name} is still referenced"
+            )
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
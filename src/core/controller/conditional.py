@@ -0,0 +1,59 @@
+from collections.abc import Callable
+from datetime import date, datetime, timezone
+from email.utils import format_datetime
+from typing import Optional
+from fastapi import HTTPException, Request, Response, status
+from core.repositories import TableVersion, get_table_versions, observe_table_versions
+
+
+def make_etag(versions: list[TableVersion], as_of: Optional[date] = None) -> str:
+    """Weak ETag naming the change counter of every table behind a response, and the day it
+    was computed for when that is not in the URL"""
+    tags: str = "-".join(f"{version.table_name}.{version.version}" for version in versions)
+    if as_of is not None:
+        tags += f"-as_of.{as_of.isoformat()}"
+    return f'W/"{tags}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag (RFC 9110 13.1.2)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque: str = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def conditional_get(*tables: str, today_param: Optional[str] = None) -> Callable[[Request, Response], None]:
+    """Router dependency validating GET responses against the change counters of tables.
+
+    Sets ETag and Last-Modified on every GET and answers 304 Not Modified
+    when If-None-Match still matches, before the route reads any rows.
+    Routes joining other tables add their own dependency listing all of
+    them; it runs after the router's and its ETag replaces the router's.
+    The versions read are handed to the table caches, so a cached body is
+    never older than the ETag sent with it.
+    today_param names a date query parameter the route resolves to today
+    when omitted; today's date is then part of the ETag, so the answer
+    changes at midnight even if no table did.
+    """
+    def dependency(request: Request, response: Response) -> None:
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        versions: list[TableVersion] = get_table_versions(tables=list(tables))
+        observe_table_versions(versions=versions)
+        as_of: Optional[date] = None
+        if today_param is not None and request.query_params.get(today_param) is None:
+            as_of = date.today()
+        headers: dict[str, str] = {"ETag": make_etag(versions=versions, as_of=as_of), "Cache-Control": "no-cache"}
+        modified: list[datetime] = [version.updated_at for version in versions if version.updated_at is not None]
+        if modified:
+            last_modified: datetime = max(modified).astimezone(tz=timezone.utc)
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        if_none_match: Optional[str] = request.headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match=if_none_match, etag=headers["ETag"]):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, status, Body, Response
+from fastapi.responses import StreamingResponse
 from typing import Any
 from core.services import TransactionService, SubscriptionService
 
@@ -12,12 +13,11 @@ subscriptions_export_router = APIRouter(prefix="/subscriptions/export", tags=["s
 
 
 # Transaction Export/Import Routes
-@transactions_export_router.get("/csv", response_class=Response)
-def export_transactions_csv() -> Response:
-    """Export all transactions to CSV"""
-    csv_content: str = transaction_service.export_to_csv()
-    return Response(
-        content=csv_content,
+@transactions_export_router.get("/csv", response_class=StreamingResponse)
+def export_transactions_csv() -> StreamingResponse:
+    """Export all transactions to CSV, streamed in batches"""
+    return StreamingResponse(
+        content=transaction_service.stream_csv(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=transactions.csv"}
     )
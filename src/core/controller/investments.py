@@ -1,19 +1,29 @@
-from typing import Optional
-from fastapi import APIRouter, status, HTTPException
+from datetime import date
+from functools import partial
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
 from core.repositories import (
     InvestmentRepository,
     InvestmentValueSnapshotRepository,
+    InvestmentSnapshotFilter,
     InvestmentPlanRepository,
     InvestmentPlanInstanceRepository
 )
-from core.domain import Investment, InvestmentValueSnapshot, InvestmentPlan, InvestmentPlanInstance
+from core.domain import Investment, InvestmentValueSnapshot, InvestmentValueSnapshotView, InvestmentPlan, InvestmentPlanInstance
+from core.domain import Portfolio
 from core.domain import (
     InvestmentSchema, InvestmentResponse,
-    InvestmentValueSnapshotSchema, InvestmentValueSnapshotResponse,
+    InvestmentValueSnapshotSchema, InvestmentValueSnapshotResponse, InvestmentValueSnapshotViewResponse,
     InvestmentPlanSchema, InvestmentPlanResponse,
-    InvestmentPlanInstanceSchema, InvestmentPlanInstanceResponse
+    InvestmentPlanInstanceSchema, InvestmentPlanInstanceResponse,
+    InstanceGenerationResponse, InvestmentPerformanceResponse, PortfolioResponse
 )
-from core.controller.base import BaseController
+from core.domain import BatchRequest, BatchResponse
+from core.domain.base import OnDelete
+from core.controller.base import BaseController, MAX_PAGE_SIZE, validate_date_range, validate_horizon
+from core.controller.conditional import conditional_get
+from core.services import InvestmentPlanService, InvestmentPerformanceService, GenerationResult
+from core.storage.init_db import transaction
 
 
 # Investment Controller
@@ -22,6 +32,8 @@ class InvestmentController(BaseController[Investment, InvestmentSchema, Investme
     
     def __init__(self) -> None:
         self._repository = InvestmentRepository()
+        self.snapshot_repository = InvestmentValueSnapshotRepository()
+        self.performance_service = InvestmentPerformanceService()
     
     @property
     def repository(self) -> InvestmentRepository:
@@ -46,6 +58,17 @@ class InvestmentController(BaseController[Investment, InvestmentSchema, Investme
             start_date=entity.start_date,
             status=entity.status
         )
+    
+    def portfolio(self, as_of: Optional[date] = None) -> PortfolioResponse:
+        """Latest snapshot value of each investment on or before as_of and their total"""
+        holdings: list[InvestmentValueSnapshotView] = self.snapshot_repository.latest_views(as_of=as_of)
+        total: float = sum(holding.current_value for holding in holdings)
+        return PortfolioResponse.model_validate(Portfolio(total_value=total, holdings=holdings))
+    
+    def performance(self, as_of: Optional[date] = None) -> list[InvestmentPerformanceResponse]:
+        """Gain, time-weighted return and XIRR of every investment up to as_of"""
+        return [InvestmentPerformanceResponse.model_validate(performance)
+                for performance in self.performance_service.performance(as_of=as_of)]
 
 
 # Investment Snapshot Controller
@@ -54,7 +77,6 @@ class InvestmentSnapshotController(BaseController[InvestmentValueSnapshot, Inves
     
     def __init__(self) -> None:
         self._repository = InvestmentValueSnapshotRepository()
-        self.investment_repo = InvestmentRepository()
     
     @property
     def repository(self) -> InvestmentValueSnapshotRepository:
@@ -64,11 +86,9 @@ class InvestmentSnapshotController(BaseController[InvestmentValueSnapshot, Inves
     def entity_name(self) -> str:
         return "Investment snapshot"
     
-    def validate_dependencies(self, model: InvestmentValueSnapshotSchema) -> None:
-        """Validate investment exists"""
-        investment: Optional[Investment] = self.investment_repo.get_by_id(uid=model.investment_id)
-        if not investment:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Investment not found")
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        return {"investment_id": ("investments", "Investment")}
     
     def model_to_entity(self, uid: str, model: InvestmentValueSnapshotSchema) -> InvestmentValueSnapshot:
         return InvestmentValueSnapshot(
@@ -85,6 +105,15 @@ class InvestmentSnapshotController(BaseController[InvestmentValueSnapshot, Inves
             date=entity.date,
             current_value=entity.current_value
         )
+    
+    def search_view(self, filters: InvestmentSnapshotFilter, limit: Optional[int] = None,
+                    cursor: Optional[str] = None, descending: bool = False,
+                    response: Optional[Response] = None) -> list[InvestmentValueSnapshotViewResponse]:
+        """Find snapshots with investment names, paginated when limit or cursor is given"""
+        validate_date_range(date_from=filters.date_from, date_to=filters.date_to)
+        fetch = partial(self.repository.find_view, filters=filters, descending=descending)
+        return self.fetch_matching(fetch=fetch, limit=limit, cursor=cursor, response=response,
+                                   convert=InvestmentValueSnapshotViewResponse.model_validate)
 
 
 # Investment Plan Controller
@@ -93,7 +122,8 @@ class InvestmentPlanController(BaseController[InvestmentPlan, InvestmentPlanSche
     
     def __init__(self) -> None:
         self._repository = InvestmentPlanRepository()
-        self.investment_repo = InvestmentRepository()
+        self.instance_repo = InvestmentPlanInstanceRepository()
+        self.service = InvestmentPlanService()
     
     @property
     def repository(self) -> InvestmentPlanRepository:
@@ -103,11 +133,30 @@ class InvestmentPlanController(BaseController[InvestmentPlan, InvestmentPlanSche
     def entity_name(self) -> str:
         return "Investment plan"
     
-    def validate_dependencies(self, model: InvestmentPlanSchema) -> None:
-        """Validate investment exists"""
-        investment: Optional[Investment] = self.investment_repo.get_by_id(uid=model.investment_id)
-        if not investment:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Investment not found")
+    def delete(self, uid: str, on_delete: OnDelete = OnDelete.RESTRICT) -> None:
+        """Delete investment plan; with CASCADE its instances are deleted in the same transaction"""
+        if on_delete is OnDelete.RESTRICT:
+            return super().delete(uid)
+        with transaction():
+            self.instance_repo.delete_by_plan(investment_plan_id=uid)
+            super().delete(uid)
+    
+    def generate(self, until: date, start: Optional[date] = None, uid: Optional[str] = None) -> InstanceGenerationResponse:
+        """Materialize missing planned instances up to until, for one plan or every active one"""
+        start = start or date.today()
+        validate_horizon(start=start, until=until)
+        plans: Optional[list[InvestmentPlan]] = None
+        if uid is not None:
+            plan: Optional[InvestmentPlan] = self.repository.get_by_id(uid=uid)
+            if plan is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Investment plan not found")
+            plans = [plan]
+        result: GenerationResult = self.service.generate_instances(until=until, start=start, plans=plans)
+        return InstanceGenerationResponse(created=result.created, skipped=result.skipped, schedules=result.schedules)
+    
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        return {"investment_id": ("investments", "Investment")}
     
     def model_to_entity(self, uid: str, model: InvestmentPlanSchema) -> InvestmentPlan:
         return InvestmentPlan(
@@ -140,7 +189,6 @@ class InvestmentPlanInstanceController(BaseController[InvestmentPlanInstance, In
     
     def __init__(self) -> None:
         self._repository = InvestmentPlanInstanceRepository()
-        self.plan_repo = InvestmentPlanRepository()
     
     @property
     def repository(self) -> InvestmentPlanInstanceRepository:
@@ -150,11 +198,9 @@ class InvestmentPlanInstanceController(BaseController[InvestmentPlanInstance, In
     def entity_name(self) -> str:
         return "Investment plan instance"
     
-    def validate_dependencies(self, model: InvestmentPlanInstanceSchema) -> None:
-        """Validate investment plan exists"""
-        plan: Optional[InvestmentPlan] = self.plan_repo.get_by_id(uid=model.investment_plan_id)
-        if not plan:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Investment plan not found")
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        return {"investment_plan_id": ("investment_plans", "Investment plan"), "transaction_id": ("transactions", "Transaction")}
     
     def model_to_entity(self, uid: str, model: InvestmentPlanInstanceSchema) -> InvestmentPlanInstance:
         return InvestmentPlanInstance(
@@ -179,16 +225,28 @@ class InvestmentPlanInstanceController(BaseController[InvestmentPlanInstance, In
 
 # Initialize controllers and routers
 investment_controller: InvestmentController = InvestmentController()
-investments_router: APIRouter = APIRouter(prefix="/investments", tags=["investments"])
+investments_router: APIRouter = APIRouter(
+    prefix="/investments", tags=["investments"],
+    dependencies=[Depends(conditional_get("investments"))]
+)
 
 investment_snapshot_controller: InvestmentSnapshotController = InvestmentSnapshotController()
-investment_snapshots_router:APIRouter = APIRouter(prefix="/investment-snapshots", tags=["investment-snapshots"])
+investment_snapshots_router:APIRouter = APIRouter(
+    prefix="/investment-snapshots", tags=["investment-snapshots"],
+    dependencies=[Depends(conditional_get("investment_value_snapshots"))]
+)
 
 investment_plan_controller: InvestmentPlanController = InvestmentPlanController()
-investment_plans_router: APIRouter = APIRouter(prefix="/investment-plans", tags=["investment-plans"])
+investment_plans_router: APIRouter = APIRouter(
+    prefix="/investment-plans", tags=["investment-plans"],
+    dependencies=[Depends(conditional_get("investment_plans"))]
+)
 
 investment_plan_instance_controller: InvestmentPlanInstanceController = InvestmentPlanInstanceController()
-investment_plan_instances_router: APIRouter = APIRouter(prefix="/investment-plan-instances", tags=["investment-plan-instances"])
+investment_plan_instances_router: APIRouter = APIRouter(
+    prefix="/investment-plan-instances", tags=["investment-plan-instances"],
+    dependencies=[Depends(conditional_get("investment_plan_instances"))]
+)
 
 
 # Investment Routes
@@ -198,6 +256,32 @@ def create_investment(investment_data: InvestmentSchema) -> InvestmentResponse:
     return investment_controller.create(data=investment_data)
 
 
+@investments_router.post("/batch", response_model=BatchResponse[InvestmentResponse])
+def batch_investments(batch_data: BatchRequest[InvestmentSchema]) -> BatchResponse[InvestmentResponse]:
+    """Create, update and delete investments in one transaction"""
+    return investment_controller.batch(data=batch_data)
+
+
+@investments_router.get(
+    "/portfolio", response_model=PortfolioResponse,
+    dependencies=[Depends(conditional_get("investments", "investment_value_snapshots"))]
+)
+def get_portfolio(as_of: Optional[date] = None) -> PortfolioResponse:
+    """Total and per-investment value from each investment's latest snapshot on or before as_of"""
+    return investment_controller.portfolio(as_of=as_of)
+
+
+@investments_router.get(
+    "/performance", response_model=list[InvestmentPerformanceResponse],
+    dependencies=[Depends(conditional_get(
+        "investments", "investment_value_snapshots", "investment_plans", "investment_plan_instances"
+    ))]
+)
+def get_investment_performance(as_of: Optional[date] = None) -> list[InvestmentPerformanceResponse]:
+    """Absolute gain, time-weighted return and XIRR per investment from snapshots and executed plan instances"""
+    return investment_controller.performance(as_of=as_of)
+
+
 @investments_router.get("/{uid}", response_model=InvestmentResponse)
 def get_investment(uid: str) -> InvestmentResponse:
     """Get investment by ID"""
@@ -205,9 +289,13 @@ def get_investment(uid: str) -> InvestmentResponse:
 
 
 @investments_router.get("/", response_model=list[InvestmentResponse])
-def get_all_investments() -> list[InvestmentResponse]:
+def get_all_investments(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[InvestmentResponse]:
     """Get all investments"""
-    return investment_controller.get_all()
+    return investment_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @investments_router.put("/{uid}", response_model=InvestmentResponse)
@@ -229,6 +317,36 @@ def create_snapshot(snapshot_data: InvestmentValueSnapshotSchema) -> InvestmentV
     return investment_snapshot_controller.create(data=snapshot_data)
 
 
+@investment_snapshots_router.post("/batch", response_model=BatchResponse[InvestmentValueSnapshotResponse])
+def batch_snapshots(batch_data: BatchRequest[InvestmentValueSnapshotSchema]) -> BatchResponse[InvestmentValueSnapshotResponse]:
+    """Create, update and delete investment value snapshots in one transaction"""
+    return investment_snapshot_controller.batch(data=batch_data)
+
+
+@investment_snapshots_router.get(
+    "/view", response_model=list[InvestmentValueSnapshotViewResponse],
+    dependencies=[Depends(conditional_get("investment_value_snapshots", "investments"))]
+)
+def get_snapshots_view(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    investment_id: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    sort: Literal["date", "-date"] = "date"
+) -> list[InvestmentValueSnapshotViewResponse]:
+    """Get investment snapshots with investment names, filtered by investment and date"""
+    filters: InvestmentSnapshotFilter = InvestmentSnapshotFilter(
+        investment_id=investment_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    return investment_snapshot_controller.search_view(
+        filters, limit=limit, cursor=cursor, descending=sort == "-date", response=response
+    )
+
+
 @investment_snapshots_router.get("/{uid}", response_model=InvestmentValueSnapshotResponse)
 def get_snapshot(uid: str) -> InvestmentValueSnapshotResponse:
     """Get investment value snapshot by ID"""
@@ -236,9 +354,13 @@ def get_snapshot(uid: str) -> InvestmentValueSnapshotResponse:
 
 
 @investment_snapshots_router.get("/", response_model=list[InvestmentValueSnapshotResponse])
-def get_all_snapshots() -> list[InvestmentValueSnapshotResponse]:
+def get_all_snapshots(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[InvestmentValueSnapshotResponse]:
     """Get all investment value snapshots"""
-    return investment_snapshot_controller.get_all()
+    return investment_snapshot_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @investment_snapshots_router.put("/{uid}", response_model=InvestmentValueSnapshotResponse)
@@ -260,6 +382,24 @@ def create_plan(plan_data: InvestmentPlanSchema) -> InvestmentPlanResponse:
     return investment_plan_controller.create(data=plan_data)
 
 
+@investment_plans_router.post("/batch", response_model=BatchResponse[InvestmentPlanResponse])
+def batch_plans(batch_data: BatchRequest[InvestmentPlanSchema]) -> BatchResponse[InvestmentPlanResponse]:
+    """Create, update and delete investment plans in one transaction"""
+    return investment_plan_controller.batch(data=batch_data)
+
+
+@investment_plans_router.post("/generate", response_model=InstanceGenerationResponse)
+def generate_all_plan_instances(until: date, start: Optional[date] = None) -> InstanceGenerationResponse:
+    """Create missing planned instances of every active plan from start (default today) to until"""
+    return investment_plan_controller.generate(until=until, start=start)
+
+
+@investment_plans_router.post("/{uid}/generate", response_model=InstanceGenerationResponse)
+def generate_plan_instances(uid: str, until: date, start: Optional[date] = None) -> InstanceGenerationResponse:
+    """Create missing planned instances of an investment plan from start (default today) to until"""
+    return investment_plan_controller.generate(until=until, start=start, uid=uid)
+
+
 @investment_plans_router.get("/{uid}", response_model=InvestmentPlanResponse)
 def get_plan(uid: str) -> InvestmentPlanResponse:
     """Get investment plan by ID"""
@@ -267,9 +407,13 @@ def get_plan(uid: str) -> InvestmentPlanResponse:
 
 
 @investment_plans_router.get("/", response_model=list[InvestmentPlanResponse])
-def get_all_plans() -> list[InvestmentPlanResponse]:
+def get_all_plans(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[InvestmentPlanResponse]:
     """Get all investment plans"""
-    return investment_plan_controller.get_all()
+    return investment_plan_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @investment_plans_router.put("/{uid}", response_model=InvestmentPlanResponse)
@@ -279,9 +423,9 @@ def update_plan(uid: str, plan_data: InvestmentPlanSchema) -> InvestmentPlanResp
 
 
 @investment_plans_router.delete("/{uid}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_plan(uid: str) -> None:
-    """Delete investment plan"""
-    investment_plan_controller.delete(uid)
+def delete_plan(uid: str, on_delete: OnDelete = OnDelete.RESTRICT) -> None:
+    """Delete investment plan; on_delete=cascade also deletes its instances"""
+    investment_plan_controller.delete(uid, on_delete=on_delete)
 
 
 # Investment Plan Instance Routes
@@ -291,6 +435,12 @@ def create_plan_instance(instance_data: InvestmentPlanInstanceSchema) -> Investm
     return investment_plan_instance_controller.create(data=instance_data)
 
 
+@investment_plan_instances_router.post("/batch", response_model=BatchResponse[InvestmentPlanInstanceResponse])
+def batch_plan_instances(batch_data: BatchRequest[InvestmentPlanInstanceSchema]) -> BatchResponse[InvestmentPlanInstanceResponse]:
+    """Create, update and delete investment plan instances in one transaction"""
+    return investment_plan_instance_controller.batch(data=batch_data)
+
+
 @investment_plan_instances_router.get("/{uid}", response_model=InvestmentPlanInstanceResponse)
 def get_plan_instance(uid: str) -> InvestmentPlanInstanceResponse:
     """Get investment plan instance by ID"""
@@ -298,9 +448,13 @@ def get_plan_instance(uid: str) -> InvestmentPlanInstanceResponse:
 
 
 @investment_plan_instances_router.get("/", response_model=list[InvestmentPlanInstanceResponse])
-def get_all_plan_instances() -> list[InvestmentPlanInstanceResponse]:
+def get_all_plan_instances(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[InvestmentPlanInstanceResponse]:
     """Get all investment plan instances"""
-    return investment_plan_instance_controller.get_all()
+    return investment_plan_instance_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @investment_plan_instances_router.put("/{uid}", response_model=InvestmentPlanInstanceResponse)
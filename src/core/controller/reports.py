@@ -0,0 +1,51 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from core.repositories import ReportRepository, TransactionFilter
+from core.domain import TransactionSummary, TransactionSummaryResponse
+from core.domain.base import SummaryGroup
+from core.controller.base import validate_date_range
+from core.controller.conditional import conditional_get
+
+
+class ReportController:
+    """Aggregate reports computed by the database"""
+    
+    def __init__(self) -> None:
+        self.repository = ReportRepository()
+    
+    def transaction_summary(self, group_by: list[SummaryGroup], filters: TransactionFilter) -> list[TransactionSummaryResponse]:
+        """Count and total per group, in group order"""
+        validate_date_range(date_from=filters.date_from, date_to=filters.date_to)
+        groups: list[SummaryGroup] = list(dict.fromkeys(group_by))
+        summaries: list[TransactionSummary] = self.repository.summarize_transactions(group_by=groups, filters=filters)
+        return [TransactionSummaryResponse.model_validate(summary) for summary in summaries]
+
+
+# Initialize controller and router
+report_controller: ReportController = ReportController()
+reports_router: APIRouter = APIRouter(prefix="/reports", tags=["reports"])
+
+
+# Report Routes
+@reports_router.get(
+    "/transactions/summary", response_model=list[TransactionSummaryResponse],
+    dependencies=[Depends(conditional_get("transactions", "accounts", "categories"))]
+)
+def get_transaction_summary(
+    group_by: list[SummaryGroup] = Query(default=[SummaryGroup.MONTH], min_length=1, max_length=4),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    account_id: Optional[str] = None,
+    category_id: Optional[str] = None
+) -> list[TransactionSummaryResponse]:
+    """Transaction count and total amount grouped by month, week (keyed by Monday), category_id and/or account_id"""
+    filters: TransactionFilter = TransactionFilter(
+        date_from=date_from,
+        date_to=date_to,
+        account_id=account_id,
+        category_id=category_id
+    )
+    return report_controller.transaction_summary(group_by=group_by, filters=filters)
+
+# Made with Bob
@@ -1,9 +1,17 @@
-from typing import Optional
-from fastapi import APIRouter, status, HTTPException
-from core.repositories import SubscriptionRepository, SubscriptionInstanceRepository
+from datetime import date
+from functools import partial
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
+from core.repositories import SubscriptionRepository, SubscriptionInstanceRepository, SubscriptionInstanceFilter
 from core.domain import Subscription, SubscriptionInstance
 from core.domain import SubscriptionSchema, SubscriptionResponse, SubscriptionInstanceSchema, SubscriptionInstanceResponse
-from core.controller.base import BaseController
+from core.domain import SubscriptionInstanceViewResponse, InstanceGenerationResponse
+from core.domain import BatchRequest, BatchResponse
+from core.domain.base import OnDelete, SubscriptionInstanceStatus
+from core.controller.base import BaseController, MAX_PAGE_SIZE, validate_date_range, validate_horizon
+from core.controller.conditional import conditional_get
+from core.services import SubscriptionService, GenerationResult
+from core.storage.init_db import transaction
 
 
 # Subscription Controller
@@ -12,6 +20,8 @@ class SubscriptionController(BaseController[Subscription, SubscriptionSchema, Su
     
     def __init__(self) -> None:
         self._repository = SubscriptionRepository()
+        self.instance_repo = SubscriptionInstanceRepository()
+        self.service = SubscriptionService()
     
     @property
     def repository(self) -> SubscriptionRepository:
@@ -21,6 +31,27 @@ class SubscriptionController(BaseController[Subscription, SubscriptionSchema, Su
     def entity_name(self) -> str:
         return "Subscription"
     
+    def delete(self, uid: str, on_delete: OnDelete = OnDelete.RESTRICT) -> None:
+        """Delete subscription; with CASCADE its instances are deleted in the same transaction"""
+        if on_delete is OnDelete.RESTRICT:
+            return super().delete(uid)
+        with transaction():
+            self.instance_repo.delete_by_subscription(subscription_id=uid)
+            super().delete(uid)
+    
+    def generate(self, until: date, start: Optional[date] = None, uid: Optional[str] = None) -> InstanceGenerationResponse:
+        """Materialize missing instances up to until, for one subscription or every active one"""
+        start = start or date.today()
+        validate_horizon(start=start, until=until)
+        subscriptions: Optional[list[Subscription]] = None
+        if uid is not None:
+            subscription: Optional[Subscription] = self.repository.get_by_id(uid=uid)
+            if subscription is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subscription not found")
+            subscriptions = [subscription]
+        result: GenerationResult = self.service.generate_instances(until=until, start=start, subscriptions=subscriptions)
+        return InstanceGenerationResponse(created=result.created, skipped=result.skipped, schedules=result.schedules)
+    
     def model_to_entity(self, uid: str, model: SubscriptionSchema) -> Subscription:
         return Subscription(
             uid=uid,
@@ -52,7 +83,6 @@ class SubscriptionInstanceController(BaseController[SubscriptionInstance, Subscr
     
     def __init__(self) -> None:
         self._repository = SubscriptionInstanceRepository()
-        self.subscription_repo = SubscriptionRepository()
     
     @property
     def repository(self) -> SubscriptionInstanceRepository:
@@ -62,11 +92,9 @@ class SubscriptionInstanceController(BaseController[SubscriptionInstance, Subscr
     def entity_name(self) -> str:
         return "Subscription instance"
     
-    def validate_dependencies(self, model: SubscriptionInstanceSchema) -> None:
-        """Validate subscription exists"""
-        subscription: Optional[Subscription] = self.subscription_repo.get_by_id(uid=model.subscription_id)
-        if not subscription:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subscription not found")
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        return {"subscription_id": ("subscriptions", "Subscription"), "transaction_id": ("transactions", "Transaction")}
     
     def model_to_entity(self, uid: str, model: SubscriptionInstanceSchema) -> SubscriptionInstance:
         return SubscriptionInstance(
@@ -87,14 +115,29 @@ class SubscriptionInstanceController(BaseController[SubscriptionInstance, Subscr
             transaction_id=entity.transaction_id,
             status=entity.status
         )
+    
+    def search_view(self, filters: SubscriptionInstanceFilter, limit: Optional[int] = None,
+                    cursor: Optional[str] = None, descending: bool = False,
+                    response: Optional[Response] = None) -> list[SubscriptionInstanceViewResponse]:
+        """Find instances with subscription and transaction names, paginated when limit or cursor is given"""
+        validate_date_range(date_from=filters.due_date_from, date_to=filters.due_date_to)
+        fetch = partial(self.repository.find_view, filters=filters, descending=descending)
+        return self.fetch_matching(fetch=fetch, limit=limit, cursor=cursor, response=response,
+                                   convert=SubscriptionInstanceViewResponse.model_validate)
 
 
 # Initialize controllers and routers
 subscription_controller: SubscriptionController = SubscriptionController()
-subscriptions_router: APIRouter = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
+subscriptions_router: APIRouter = APIRouter(
+    prefix="/subscriptions", tags=["subscriptions"],
+    dependencies=[Depends(conditional_get("subscriptions"))]
+)
 
 subscription_instance_controller: SubscriptionInstanceController = SubscriptionInstanceController()
-subscription_instances_router: APIRouter = APIRouter(prefix="/subscription-instances", tags=["subscription-instances"])
+subscription_instances_router: APIRouter = APIRouter(
+    prefix="/subscription-instances", tags=["subscription-instances"],
+    dependencies=[Depends(conditional_get("subscription_instances"))]
+)
 
 
 # Subscription Routes
@@ -104,6 +147,24 @@ def create_subscription(subscription_data: SubscriptionSchema) -> SubscriptionRe
     return subscription_controller.create(data=subscription_data)
 
 
+@subscriptions_router.post("/batch", response_model=BatchResponse[SubscriptionResponse])
+def batch_subscriptions(batch_data: BatchRequest[SubscriptionSchema]) -> BatchResponse[SubscriptionResponse]:
+    """Create, update and delete subscriptions in one transaction"""
+    return subscription_controller.batch(data=batch_data)
+
+
+@subscriptions_router.post("/generate", response_model=InstanceGenerationResponse)
+def generate_all_subscription_instances(until: date, start: Optional[date] = None) -> InstanceGenerationResponse:
+    """Create missing due instances of every active subscription from start (default today) to until"""
+    return subscription_controller.generate(until=until, start=start)
+
+
+@subscriptions_router.post("/{uid}/generate", response_model=InstanceGenerationResponse)
+def generate_subscription_instances(uid: str, until: date, start: Optional[date] = None) -> InstanceGenerationResponse:
+    """Create missing due instances of a subscription from start (default today) to until"""
+    return subscription_controller.generate(until=until, start=start, uid=uid)
+
+
 @subscriptions_router.get("/{uid}", response_model=SubscriptionResponse)
 def get_subscription(uid: str) -> SubscriptionResponse:
     """Get subscription by ID"""
@@ -111,9 +172,13 @@ def get_subscription(uid: str) -> SubscriptionResponse:
 
 
 @subscriptions_router.get("/", response_model=list[SubscriptionResponse])
-def get_all_subscriptions() -> list[SubscriptionResponse]:
+def get_all_subscriptions(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[SubscriptionResponse]:
     """Get all subscriptions"""
-    return subscription_controller.get_all()
+    return subscription_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @subscriptions_router.put("/{uid}", response_model=SubscriptionResponse)
@@ -123,9 +188,9 @@ def update_subscription(uid: str, subscription_data: SubscriptionSchema) -> Subs
 
 
 @subscriptions_router.delete("/{uid}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_subscription(uid: str) -> None:
-    """Delete subscription"""
-    subscription_controller.delete(uid)
+def delete_subscription(uid: str, on_delete: OnDelete = OnDelete.RESTRICT) -> None:
+    """Delete subscription; on_delete=cascade also deletes its instances"""
+    subscription_controller.delete(uid, on_delete=on_delete)
 
 
 # Subscription Instance Routes
@@ -135,6 +200,38 @@ def create_subscription_instance(instance_data: SubscriptionInstanceSchema) -> S
     return subscription_instance_controller.create(data=instance_data)
 
 
+@subscription_instances_router.post("/batch", response_model=BatchResponse[SubscriptionInstanceResponse])
+def batch_subscription_instances(batch_data: BatchRequest[SubscriptionInstanceSchema]) -> BatchResponse[SubscriptionInstanceResponse]:
+    """Create, update and delete subscription instances in one transaction"""
+    return subscription_instance_controller.batch(data=batch_data)
+
+
+@subscription_instances_router.get(
+    "/view", response_model=list[SubscriptionInstanceViewResponse],
+    dependencies=[Depends(conditional_get("subscription_instances", "subscriptions", "transactions"))]
+)
+def get_subscription_instances_view(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    subscription_id: Optional[str] = None,
+    status: Optional[SubscriptionInstanceStatus] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    sort: Literal["due_date", "-due_date"] = "due_date"
+) -> list[SubscriptionInstanceViewResponse]:
+    """Get subscription instances with subscription and transaction names, filtered by due date"""
+    filters: SubscriptionInstanceFilter = SubscriptionInstanceFilter(
+        subscription_id=subscription_id,
+        status=status,
+        due_date_from=date_from,
+        due_date_to=date_to
+    )
+    return subscription_instance_controller.search_view(
+        filters, limit=limit, cursor=cursor, descending=sort == "-due_date", response=response
+    )
+
+
 @subscription_instances_router.get("/{uid}", response_model=SubscriptionInstanceResponse)
 def get_subscription_instance(uid: str) -> SubscriptionInstanceResponse:
     """Get subscription instance by ID"""
@@ -142,9 +239,13 @@ def get_subscription_instance(uid: str) -> SubscriptionInstanceResponse:
 
 
 @subscription_instances_router.get("/", response_model=list[SubscriptionInstanceResponse])
-def get_all_subscription_instances() -> list[SubscriptionInstanceResponse]:
+def get_all_subscription_instances(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[SubscriptionInstanceResponse]:
     """Get all subscription instances"""
-    return subscription_instance_controller.get_all()
+    return subscription_instance_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @subscription_instances_router.put("/{uid}", response_model=SubscriptionInstanceResponse)
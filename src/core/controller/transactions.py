@@ -1,9 +1,14 @@
-from typing import Optional
-from fastapi import APIRouter, status, HTTPException
-from core.repositories import CategoryRepository, AccountRepository, TransactionRepository
+from datetime import date
+from functools import partial
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
+from core.repositories import CategoryRepository, AccountRepository, TransactionRepository, TransactionFilter, ReportRepository
 from core.domain import Category, Account, Transaction
 from core.domain import CategorySchema, CategoryResponse, AccountSchema, AccountResponse, TransactionSchema, TransactionResponse
-from core.controller.base import BaseController
+from core.domain import TransactionViewResponse, AccountBalanceResponse
+from core.domain import BatchRequest, BatchResponse
+from core.controller.base import BaseController, MAX_PAGE_SIZE, validate_date_range
+from core.controller.conditional import conditional_get
 
 
 # Category Controller
@@ -34,6 +39,7 @@ class AccountController(BaseController[Account, AccountSchema, AccountResponse])
     
     def __init__(self) -> None:
         self._repository = AccountRepository()
+        self.report_repository = ReportRepository()
     
     @property
     def repository(self) -> AccountRepository:
@@ -48,6 +54,12 @@ class AccountController(BaseController[Account, AccountSchema, AccountResponse])
     
     def entity_to_response(self, entity: Account) -> AccountResponse:
         return AccountResponse(uid=entity.uid, name=entity.name)
+    
+    def balance(self, uid: str, as_of: date) -> AccountBalanceResponse:
+        """Balance of the account at the end of as_of"""
+        if self.repository.get_by_id(uid=uid) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{self.entity_name} not found")
+        return AccountBalanceResponse.model_validate(self.report_repository.account_balance(account_id=uid, as_of=as_of))
 
 
 # Transaction Controller
@@ -56,8 +68,6 @@ class TransactionController(BaseController[Transaction, TransactionSchema, Trans
     
     def __init__(self) -> None:
         self._repository = TransactionRepository()
-        self.account_repo = AccountRepository()
-        self.category_repo = CategoryRepository()
     
     @property
     def repository(self) -> TransactionRepository:
@@ -67,15 +77,30 @@ class TransactionController(BaseController[Transaction, TransactionSchema, Trans
     def entity_name(self) -> str:
         return "Transaction"
     
-    def validate_dependencies(self, model: TransactionSchema) -> None:
-        """Validate account and category exist"""
-        account: Optional[Account] = self.account_repo.get_by_id(uid=model.account_id)
-        if not account:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
-        
-        category: Optional[Category] = self.category_repo.get_by_id(uid=model.category_id)
-        if not category:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        return {"account_id": ("accounts", "Account"), "category_id": ("categories", "Category")}
+    
+    def search(self, filters: TransactionFilter, limit: Optional[int] = None, cursor: Optional[str] = None,
+               descending: bool = False, response: Optional[Response] = None) -> list[TransactionResponse]:
+        """Find transactions matching filters, paginated when limit or cursor is given"""
+        self._validate_filters(filters=filters)
+        fetch = partial(self.repository.find, filters=filters, descending=descending)
+        return self.fetch_matching(fetch=fetch, limit=limit, cursor=cursor, response=response)
+    
+    def search_view(self, filters: TransactionFilter, limit: Optional[int] = None, cursor: Optional[str] = None,
+                    descending: bool = False, response: Optional[Response] = None) -> list[TransactionViewResponse]:
+        """Like search, with account and category names"""
+        self._validate_filters(filters=filters)
+        fetch = partial(self.repository.find_view, filters=filters, descending=descending)
+        return self.fetch_matching(fetch=fetch, limit=limit, cursor=cursor, response=response,
+                                   convert=TransactionViewResponse.model_validate)
+    
+    def _validate_filters(self, filters: TransactionFilter) -> None:
+        validate_date_range(date_from=filters.date_from, date_to=filters.date_to)
+        if (filters.min_amount is not None and filters.max_amount is not None
+                and filters.min_amount > filters.max_amount):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_amount must not exceed max_amount")
     
     def model_to_entity(self, uid: str, model: TransactionSchema) -> Transaction:
         return Transaction(
@@ -100,13 +125,22 @@ class TransactionController(BaseController[Transaction, TransactionSchema, Trans
 
 # Initialize controllers and routers
 category_controller: CategoryController = CategoryController()
-categories_router: APIRouter = APIRouter(prefix="/categories", tags=["categories"])
+categories_router: APIRouter = APIRouter(
+    prefix="/categories", tags=["categories"],
+    dependencies=[Depends(conditional_get("categories"))]
+)
 
 account_controller: AccountController = AccountController()
-accounts_router: APIRouter = APIRouter(prefix="/accounts", tags=["accounts"])
+accounts_router: APIRouter = APIRouter(
+    prefix="/accounts", tags=["accounts"],
+    dependencies=[Depends(conditional_get("accounts"))]
+)
 
 transaction_controller: TransactionController = TransactionController()
-transactions_router: APIRouter = APIRouter(prefix="/transactions", tags=["transactions"])
+transactions_router: APIRouter = APIRouter(
+    prefix="/transactions", tags=["transactions"],
+    dependencies=[Depends(conditional_get("transactions"))]
+)
 
 
 # Category Routes
@@ -116,6 +150,12 @@ def create_category(category_data: CategorySchema) -> CategoryResponse:
     return category_controller.create(data=category_data)
 
 
+@categories_router.post("/batch", response_model=BatchResponse[CategoryResponse])
+def batch_categories(batch_data: BatchRequest[CategorySchema]) -> BatchResponse[CategoryResponse]:
+    """Create, update and delete categories in one transaction"""
+    return category_controller.batch(data=batch_data)
+
+
 @categories_router.get("/{uid}", response_model=CategoryResponse)
 def get_category(uid: str) -> CategoryResponse:
     """Get category by ID"""
@@ -123,9 +163,13 @@ def get_category(uid: str) -> CategoryResponse:
 
 
 @categories_router.get("/", response_model=list[CategoryResponse])
-def get_all_categories() -> list[CategoryResponse]:
+def get_all_categories(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[CategoryResponse]:
     """Get all categories"""
-    return category_controller.get_all()
+    return category_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @categories_router.put("/{uid}", response_model=CategoryResponse)
@@ -147,16 +191,35 @@ def create_account(account_data: AccountSchema) -> AccountResponse:
     return account_controller.create(data=account_data)
 
 
+@accounts_router.post("/batch", response_model=BatchResponse[AccountResponse])
+def batch_accounts(batch_data: BatchRequest[AccountSchema]) -> BatchResponse[AccountResponse]:
+    """Create, update and delete accounts in one transaction"""
+    return account_controller.batch(data=batch_data)
+
+
 @accounts_router.get("/{uid}", response_model=AccountResponse)
 def get_account(uid: str) -> AccountResponse:
     """Get account by ID"""
     return account_controller.get_by_id(uid)
 
 
+@accounts_router.get(
+    "/{uid}/balance", response_model=AccountBalanceResponse,
+    dependencies=[Depends(conditional_get("accounts", "transactions", today_param="as_of"))]
+)
+def get_account_balance(uid: str, as_of: Optional[date] = None) -> AccountBalanceResponse:
+    """Account balance at the end of as_of (default today)"""
+    return account_controller.balance(uid, as_of=as_of or date.today())
+
+
 @accounts_router.get("/", response_model=list[AccountResponse])
-def get_all_accounts() -> list[AccountResponse]:
+def get_all_accounts(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> list[AccountResponse]:
     """Get all accounts"""
-    return account_controller.get_all()
+    return account_controller.get_all(limit=limit, cursor=cursor, response=response)
 
 
 @accounts_router.put("/{uid}", response_model=AccountResponse)
@@ -178,6 +241,44 @@ def create_transaction(transaction_data: TransactionSchema) -> TransactionRespon
     return transaction_controller.create(transaction_data)
 
 
+@transactions_router.post("/batch", response_model=BatchResponse[TransactionResponse])
+def batch_transactions(batch_data: BatchRequest[TransactionSchema]) -> BatchResponse[TransactionResponse]:
+    """Create, update and delete transactions in one transaction"""
+    return transaction_controller.batch(data=batch_data)
+
+
+@transactions_router.get(
+    "/view", response_model=list[TransactionViewResponse],
+    dependencies=[Depends(conditional_get("transactions", "accounts", "categories"))]
+)
+def get_transactions_view(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    account_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    name_prefix: Optional[str] = Query(default=None, min_length=1, max_length=100),
+    sort: Literal["date", "-date"] = "date"
+) -> list[TransactionViewResponse]:
+    """Get transactions with account and category names, filtered like the list endpoint"""
+    filters: TransactionFilter = TransactionFilter(
+        date_from=date_from,
+        date_to=date_to,
+        account_id=account_id,
+        category_id=category_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        name_prefix=name_prefix
+    )
+    return transaction_controller.search_view(
+        filters, limit=limit, cursor=cursor, descending=sort == "-date", response=response
+    )
+
+
 @transactions_router.get("/{uid}", response_model=TransactionResponse)
 def get_transaction(uid: str) -> TransactionResponse:
     """Get transaction by ID"""
@@ -185,9 +286,32 @@ def get_transaction(uid: str) -> TransactionResponse:
 
 
 @transactions_router.get("/", response_model=list[TransactionResponse])
-def get_all_transactions() -> list[TransactionResponse]:
-    """Get all transactions"""
-    return transaction_controller.get_all()
+def get_all_transactions(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    account_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    name_prefix: Optional[str] = Query(default=None, min_length=1, max_length=100),
+    sort: Literal["date", "-date"] = "date"
+) -> list[TransactionResponse]:
+    """Get all transactions, optionally filtered and sorted by date"""
+    filters: TransactionFilter = TransactionFilter(
+        date_from=date_from,
+        date_to=date_to,
+        account_id=account_id,
+        category_id=category_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        name_prefix=name_prefix
+    )
+    return transaction_controller.search(
+        filters, limit=limit, cursor=cursor, descending=sort == "-date", response=response
+    )
 
 
 @transactions_router.put("/{uid}", response_model=TransactionResponse)
@@ -8,6 +8,13 @@ from .entities import (
     InvestmentValueSnapshot,
     InvestmentPlan,
     InvestmentPlanInstance,
+    TransactionView,
+    SubscriptionInstanceView,
+    InvestmentValueSnapshotView,
+    TransactionSummary,
+    AccountBalance,
+    InvestmentPerformance,
+    Portfolio,
 )
 from .models import (
     CategorySchema,
@@ -28,6 +35,18 @@ from .models import (
     InvestmentPlanResponse,
     InvestmentPlanInstanceSchema,
     InvestmentPlanInstanceResponse,
+    InstanceGenerationResponse,
+    TransactionViewResponse,
+    SubscriptionInstanceViewResponse,
+    InvestmentValueSnapshotViewResponse,
+    TransactionSummaryResponse,
+    AccountBalanceResponse,
+    InvestmentPerformanceResponse,
+    PortfolioResponse,
+    BatchUpdateItem,
+    BatchRequest,
+    BatchItemResult,
+    BatchResponse,
 )
 
 __all__ = [
@@ -41,6 +60,13 @@ __all__ = [
     "InvestmentValueSnapshot",
     "InvestmentPlan",
     "InvestmentPlanInstance",
+    "TransactionView",
+    "SubscriptionInstanceView",
+    "InvestmentValueSnapshotView",
+    "TransactionSummary",
+    "AccountBalance",
+    "InvestmentPerformance",
+    "Portfolio",
     # Models
     "CategorySchema",
     "CategoryResponse",
@@ -60,6 +86,18 @@ __all__ = [
     "InvestmentPlanResponse",
     "InvestmentPlanInstanceSchema",
     "InvestmentPlanInstanceResponse",
+    "InstanceGenerationResponse",
+    "TransactionViewResponse",
+    "SubscriptionInstanceViewResponse",
+    "InvestmentValueSnapshotViewResponse",
+    "TransactionSummaryResponse",
+    "AccountBalanceResponse",
+    "InvestmentPerformanceResponse",
+    "PortfolioResponse",
+    "BatchUpdateItem",
+    "BatchRequest",
+    "BatchItemResult",
+    "BatchResponse",
 ]
 
 # Made with Bob
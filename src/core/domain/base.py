@@ -32,4 +32,18 @@ class InvestmentPlanInstanceStatus(StrEnum):
     EXECUTED = "executed"
     SKIPPED = "skipped"
 
+
+class SummaryGroup(StrEnum):
+    """Dimensions a transaction summary can be grouped by"""
+    MONTH = "month"
+    WEEK = "week"
+    CATEGORY_ID = "category_id"
+    ACCOUNT_ID = "account_id"
+
+
+class OnDelete(StrEnum):
+    """What happens to instances when their subscription or plan is deleted"""
+    RESTRICT = "restrict"
+    CASCADE = "cascade"
+
 # Made with Bob
@@ -92,3 +92,64 @@ class InvestmentPlanInstance:
     due_date: date
     transaction_id: Optional[str]
     status: InvestmentPlanInstanceStatus
+
+
+# Read-only views: entities with the names of referenced rows joined in
+@dataclass
+class TransactionView(Transaction):
+    account_name: Optional[str]
+    category_name: Optional[str]
+
+
+@dataclass
+class SubscriptionInstanceView(SubscriptionInstance):
+    subscription_name: Optional[str]
+    transaction_name: Optional[str]
+
+
+@dataclass
+class InvestmentValueSnapshotView(InvestmentValueSnapshot):
+    investment_name: Optional[str]
+
+
+@dataclass
+class TransactionSummary:
+    """Count and total of the transactions in one group; only the grouped fields are set"""
+    count: int
+    total: float
+    month: Optional[str] = None
+    week: Optional[date] = None
+    category_id: Optional[str] = None
+    category_name: Optional[str] = None
+    account_id: Optional[str] = None
+    account_name: Optional[str] = None
+
+
+@dataclass
+class AccountBalance:
+    """Sum of an account's transactions dated on or before as_of"""
+    account_id: str
+    as_of: date
+    balance: float
+
+
+@dataclass
+class InvestmentPerformance:
+    """Returns of an investment between its first and last snapshot; gain and returns need two snapshot dates"""
+    investment_id: str
+    investment_name: str
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    start_value: Optional[float] = None
+    current_value: Optional[float] = None
+    contributions: Optional[float] = None
+    absolute_gain: Optional[float] = None
+    twr: Optional[float] = None
+    xirr: Optional[float] = None
+
+
+@dataclass
+class Portfolio:
+    """Latest value of every investment with a snapshot and their sum"""
+    total_value: float
+    holdings: list[InvestmentValueSnapshotView]
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Any, Optional
+from typing import Any, Generic, Literal, Optional, TypeVar
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from .base import (
@@ -191,4 +191,112 @@ class InvestmentPlanInstanceResponse(BaseModel):
     transaction_id: Optional[str]
     status: InvestmentPlanInstanceStatus
 
+
+# Generation Schemas
+class InstanceGenerationResponse(BaseModel):
+    created: int
+    skipped: int
+    schedules: int
+
+
+# View Schemas
+class TransactionViewResponse(TransactionResponse):
+    account_name: Optional[str] = None
+    category_name: Optional[str] = None
+
+
+class SubscriptionInstanceViewResponse(SubscriptionInstanceResponse):
+    subscription_name: Optional[str] = None
+    transaction_name: Optional[str] = None
+
+
+class InvestmentValueSnapshotViewResponse(InvestmentValueSnapshotResponse):
+    investment_name: Optional[str] = None
+
+
+# Report Schemas
+class TransactionSummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    month: Optional[str] = None
+    week: Optional[date] = None
+    category_id: Optional[str] = None
+    category_name: Optional[str] = None
+    account_id: Optional[str] = None
+    account_name: Optional[str] = None
+    count: int
+    total: float
+
+
+class AccountBalanceResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    account_id: str
+    as_of: date
+    balance: float
+
+
+class InvestmentPerformanceResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    investment_id: str
+    investment_name: str
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    start_value: Optional[float] = None
+    current_value: Optional[float] = None
+    contributions: Optional[float] = None
+    absolute_gain: Optional[float] = None
+    twr: Optional[float] = None
+    xirr: Optional[float] = None
+
+
+class PortfolioResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    total_value: float
+    holdings: list[InvestmentValueSnapshotViewResponse]
+
+
+# Batch Schemas
+MAX_BATCH_SIZE: int = 1000
+
+TSchema = TypeVar('TSchema', bound=BaseModel)
+TResponseSchema = TypeVar('TResponseSchema', bound=BaseModel)
+
+
+class BatchUpdateItem(BaseModel, Generic[TSchema]):
+    uid: str
+    data: TSchema
+
+
+class BatchRequest(BaseModel, Generic[TSchema]):
+    create: list[TSchema] = Field(default_factory=list)
+    update: list[BatchUpdateItem[TSchema]] = Field(default_factory=list)
+    delete: list[str] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def validate_size(self) -> Any:
+        total: int = len(self.create) + len(self.update) + len(self.delete)
+        if total == 0:
+            raise ValueError("batch must contain at least one operation")
+        if total > MAX_BATCH_SIZE:
+            raise ValueError(f"batch must not exceed {MAX_BATCH_SIZE} operations")
+        return self
+
+
+class BatchItemResult(BaseModel, Generic[TResponseSchema]):
+    operation: Literal["create", "update", "delete"]
+    index: int
+    uid: Optional[str] = None
+    status_code: int
+    detail: Optional[str] = None
+    data: Optional[TResponseSchema] = None
+
+
+class BatchResponse(BaseModel, Generic[TResponseSchema]):
+    succeeded: int
+    failed: int
+    results: list[BatchItemResult[TResponseSchema]]
+
 # Made with Bob
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from fastapi import FastAPI
 from core.controller import (
@@ -11,14 +13,29 @@ from core.controller import (
     investment_plans_router,
     investment_plan_instances_router,
     transactions_export_router,
-    subscriptions_export_router
+    subscriptions_export_router,
+    reports_router
 )
-from core.storage import init_database
+from core.storage import run_migrations
+from core.repositories import cache_stats, rebuild_monthly_rollup, rebuild_balance_checkpoints
+from core.services import SweepScheduler
+
+sweep_scheduler: SweepScheduler = SweepScheduler.from_env()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the status sweep in the background while the app serves requests"""
+    sweep_scheduler.start()
+    yield
+    await sweep_scheduler.stop()
+
 
 app: FastAPI = FastAPI(
     title="Money Manager API",
     description="REST API for managing personal finances",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 app.include_router(router=categories_router)
@@ -32,6 +49,7 @@ app.include_router(router=investment_plans_router)
 app.include_router(router=investment_plan_instances_router)
 app.include_router(router=transactions_export_router)
 app.include_router(router=subscriptions_export_router)
+app.include_router(router=reports_router)
 
 
 @app.get(path="/")
@@ -50,6 +68,7 @@ def root() -> dict[str, Any]:
             "investment_snapshots": "/investment-snapshots",
             "investment_plans": "/investment-plans",
             "investment_plan_instances": "/investment-plan-instances",
+            "reports": "/reports",
             "docs": "/docs"
         }
     }
@@ -61,20 +80,43 @@ def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get(path="/health/cache")
+def cache_health() -> dict[str, dict[str, int]]:
+    """Hit/miss counters of the reference table caches"""
+    return cache_stats()
+
+
+@app.get(path="/health/scheduler")
+def scheduler_health() -> dict[str, Any]:
+    """Last run, duration and rows changed by the background status sweep"""
+    return sweep_scheduler.status()
+
 
 def main() -> None:
     """Entry point for money-manager command"""
-    print("Initializing database...")
+    print("Applying database migrations...")
     try:
-        init_database()
-        print("Database initialized successfully!")
+        applied: list[int] = run_migrations()
+        print(f"Database is up to date ({len(applied)} migration(s) applied)")
     except Exception as e:
-        print(f"Database initialization failed: {e}")
+        print(f"Database migration failed: {e}")
         return
     
     import uvicorn
     uvicorn.run(app="core.main:app", host="0.0.0.0", port=8000, reload=True)
 
 
+def rebuild_rollup() -> None:
+    """Entry point for money-manager-rebuild-rollup command"""
+    try:
+        run_migrations()
+        rows: int = rebuild_monthly_rollup()
+        print(f"Rebuilt transaction_monthly_rollup ({rows} row(s))")
+        rows = rebuild_balance_checkpoints()
+        print(f"Rebuilt account_balance_checkpoints ({rows} row(s))")
+    except Exception as e:
+        print(f"Rollup rebuild failed: {e}")
+
+
 if __name__ == "__main__":
     main()
@@ -1,9 +1,19 @@
-from .base import IRepository, BaseRepository
-from .transactions import CategoryRepository, AccountRepository, TransactionRepository
-from .subscriptions import SubscriptionRepository, SubscriptionInstanceRepository
+from .base import IRepository, BaseRepository, BulkCreateResult
+from .references import ReferenceChecker
+from .cache import CachedRepository, TableCache, cache_stats, clear_caches, observe_table_versions
+from .versions import TableVersion, bump_table_versions, get_table_versions
+from .schedules import ScheduledInstanceRepository
+from .leases import acquire_lease, release_lease
+from .rollups import (
+    rollup_deltas, apply_rollup_deltas, apply_checkpoint_deltas, rebuild_monthly_rollup, rebuild_balance_checkpoints
+)
+from .transactions import CategoryRepository, AccountRepository, TransactionRepository, TransactionFilter
+from .subscriptions import SubscriptionRepository, SubscriptionInstanceRepository, SubscriptionInstanceFilter
+from .reports import ReportRepository
 from .investments import (
     InvestmentRepository,
     InvestmentValueSnapshotRepository,
+    InvestmentSnapshotFilter,
     InvestmentPlanRepository,
     InvestmentPlanInstanceRepository,
 )
@@ -11,13 +21,35 @@ from .investments import (
 __all__ = [
     'IRepository',
     'BaseRepository',
+    'BulkCreateResult',
+    'ReferenceChecker',
+    'CachedRepository',
+    'TableCache',
+    'cache_stats',
+    'clear_caches',
+    'observe_table_versions',
+    'TableVersion',
+    'bump_table_versions',
+    'get_table_versions',
+    'ScheduledInstanceRepository',
+    'acquire_lease',
+    'release_lease',
+    'rollup_deltas',
+    'apply_rollup_deltas',
+    'apply_checkpoint_deltas',
+    'rebuild_monthly_rollup',
+    'rebuild_balance_checkpoints',
     'CategoryRepository',
     'AccountRepository',
     'TransactionRepository',
+    'TransactionFilter',
     'SubscriptionRepository',
     'SubscriptionInstanceRepository',
+    'SubscriptionInstanceFilter',
     'InvestmentRepository',
     'InvestmentValueSnapshotRepository',
+    'InvestmentSnapshotFilter',
     'InvestmentPlanRepository',
     'InvestmentPlanInstanceRepository',
+    'ReportRepository',
 ]
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Optional, TypeVar, Generic, Any
 import sqlite3
+from dataclasses import dataclass, field
 from datetime import date
-from core.storage.init_db import get_connection
-from core.utils import DuplicateEntityError
+from core.storage.init_db import get_connection, transaction, savepoint, commit
+from core.utils import DuplicateEntityError, ForeignKeyViolationError, encode_cursor, decode_cursor
+from .versions import bump_table_versions
 
 # Register date adapters for SQLite (Python 3.12+ compatibility)
 sqlite3.register_adapter(date, lambda d: d.isoformat())
@@ -12,6 +15,20 @@ sqlite3.register_converter("date", lambda s: date.fromisoformat(s.decode()))
 T = TypeVar(name='T')
 
 
+def _integrity_error(error: sqlite3.IntegrityError) -> Exception:
+    """Translate a SQLite constraint failure into the matching domain exception"""
+    if "FOREIGN KEY" in str(error):
+        return ForeignKeyViolationError("Referenced entity not found")
+    return DuplicateEntityError("Entity already exists")
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of create_many: created uids and (input index, error message) failures"""
+    created: list[str] = field(default_factory=list)
+    failed: list[tuple[int, str]] = field(default_factory=list)
+
+
 class IRepository(ABC, Generic[T]):
     """Base repository interface for CRUD operations"""
     
@@ -20,6 +37,11 @@ class IRepository(ABC, Generic[T]):
         """Create a new entity and return its ID"""
         pass
     
+    @abstractmethod
+    def create_many(self, entities: list[T], batch_size: int = 500) -> BulkCreateResult:
+        """Create entities in one transaction, reporting rows that could not be inserted"""
+        pass
+    
     @abstractmethod
     def get_by_id(self, uid: str) -> Optional[T]:
         """Get entity by ID"""
@@ -30,6 +52,11 @@ class IRepository(ABC, Generic[T]):
         """Get all entities"""
         pass
     
+    @abstractmethod
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> tuple[list[T], Optional[str]]:
+        """Get up to limit entities after cursor, with the cursor of the next page"""
+        pass
+    
     @abstractmethod
     def update(self, entity: T) -> bool:
         """Update entity and return success status"""
@@ -56,6 +83,11 @@ class BaseRepository(IRepository[T], ABC):
         """Return list of column names (excluding uid)"""
         pass
     
+    @property
+    def order_columns(self) -> list[str]:
+        """Return the keyset ordering columns for pagination (must end with uid)"""
+        return ['uid']
+    
     @abstractmethod
     def _entity_to_values(self, entity: T) -> tuple[Any, ...]:
         """Convert entity to tuple of values for database (uid first, then other columns)"""
@@ -79,60 +111,172 @@ class BaseRepository(IRepository[T], ABC):
         all_cols: list[str] = ['uid'] + self.columns
         return f"SELECT {', '.join(all_cols)} FROM {self.table_name}"
     
+    @property
+    def cascade_tables(self) -> list[str]:
+        """Tables whose rows ON DELETE actions may change when a row here is deleted"""
+        return []
+    
+    def _record_change(self, connection: sqlite3.Connection, tables: Optional[list[str]] = None) -> None:
+        bump_table_versions(connection=connection, tables=[self.table_name] + (tables or []))
+    
+    def _after_write(self) -> None:
+        """Hook called after rows of this table were inserted, updated or deleted"""
+        pass
+    
     def create(self, entity: T) -> str:
-        connection: sqlite3.Connection = get_connection()
-        cursor: sqlite3.Cursor = connection.cursor()
+        with get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.cursor()
+            try:
+                values: tuple[Any, ...] = self._entity_to_values(entity)
+                cursor.execute(self._get_insert_sql(), values)
+                self._record_change(connection=connection)
+                commit(connection)
+            except sqlite3.IntegrityError as e:
+                raise _integrity_error(e) from e
+        self._after_write()
+        return values[0]
+    
+    def create_many(self, entities: list[T], batch_size: int = 500) -> BulkCreateResult:
+        result: BulkCreateResult = BulkCreateResult()
+        if not entities:
+            return result
+        
+        sql: str = self._get_insert_sql()
+        with transaction() as connection:
+            for start in range(0, len(entities), batch_size):
+                batch: list[tuple[Any, ...]] = [
+                    self._entity_to_values(entity) for entity in entities[start:start + batch_size]
+                ]
+                self._insert_batch(connection=connection, sql=sql, batch=batch, offset=start, result=result)
+            if result.created:
+                self._record_change(connection=connection)
+        if result.created:
+            self._after_write()
+        return result
+    
+    def _insert_batch(self, connection: sqlite3.Connection, sql: str, batch: list[tuple[Any, ...]],
+                      offset: int, result: BulkCreateResult) -> None:
+        """Insert a batch under a savepoint, retrying row by row to isolate failures"""
         try:
-            values: tuple[Any, ...] = self._entity_to_values(entity)
-            cursor.execute(self._get_insert_sql(), values)
-            connection.commit()
-            return values[0]
-        except sqlite3.IntegrityError as e:
-            raise DuplicateEntityError(f"Entity already exists") from e
-        finally:
-            connection.close()
+            with savepoint(connection=connection, name="batch"):
+                connection.executemany(sql, batch)
+            result.created.extend(values[0] for values in batch)
+            return
+        except sqlite3.IntegrityError:
+            pass
+        
+        for index, values in enumerate(batch):
+            try:
+                with savepoint(connection=connection, name="row"):
+                    connection.execute(sql, values)
+                result.created.append(values[0])
+            except sqlite3.IntegrityError as e:
+                result.failed.append((offset + index, str(_integrity_error(e))))
     
     def get_by_id(self, uid: str) -> Optional[T]:
-        connection: sqlite3.Connection = get_connection()
-        cursor: sqlite3.Cursor = connection.cursor()
-        cursor.execute(f"{self._get_select_sql()} WHERE uid = ?", (uid,))
-        row = cursor.fetchone()
-        connection.close()
+        with get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.cursor()
+            cursor.execute(f"{self._get_select_sql()} WHERE uid = ?", (uid,))
+            row = cursor.fetchone()
         
         if row:
             return self._row_to_entity(row)
         return None
     
     def get_all(self) -> list[T]:
-        connection: sqlite3.Connection = get_connection()
-        cursor: sqlite3.Cursor = connection.cursor()
-        cursor.execute(self._get_select_sql())
-        rows: list[Any] = cursor.fetchall()
-        connection.close()
+        with get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.cursor()
+            cursor.execute(self._get_select_sql())
+            rows: list[Any] = cursor.fetchall()
         
         return [self._row_to_entity(row) for row in rows]
     
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> tuple[list[T], Optional[str]]:
+        return self._select_page(conditions=[], params=[], limit=limit, cursor=cursor)
+    
+    def _select_page(self, conditions: list[str], params: list[Any], limit: Optional[int],
+                     cursor: Optional[str], descending: bool = False, select_sql: Optional[str] = None,
+                     row_mapper: Optional[Callable[[tuple[Any, ...]], Any]] = None) -> tuple[list[Any], Optional[str]]:
+        """Select rows matching conditions in keyset order; limit=None selects every match.
+        
+        select_sql replaces the table's SELECT, e.g. with a joined view whose
+        rows start with the table's own columns; row_mapper then converts them.
+        """
+        conditions = list(conditions)
+        params = list(params)
+        direction: str = "DESC" if descending else "ASC"
+        if cursor is not None:
+            cursor_values: list[Any] = decode_cursor(cursor, size=len(self.order_columns))
+            placeholders: str = ', '.join(['?'] * len(cursor_values))
+            comparison: str = "<" if descending else ">"
+            conditions.append(f"({', '.join(self.order_columns)}) {comparison} ({placeholders})")
+            params.extend(cursor_values)
+        
+        sql: str = select_sql or self._get_select_sql()
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" ORDER BY {', '.join(f'{col} {direction}' for col in self.order_columns)}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit + 1)
+        
+        with get_connection() as connection:
+            rows: list[Any] = connection.execute(sql, params).fetchall()
+        
+        next_cursor: Optional[str] = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(self._order_values(rows[-1]))
+        convert: Callable[[tuple[Any, ...]], Any] = row_mapper or self._row_to_entity
+        return [convert(row) for row in rows], next_cursor
+    
+    def _order_values(self, row: tuple[Any, ...]) -> list[Any]:
+        all_cols: list[str] = ['uid'] + self.columns
+        return [row[all_cols.index(col)] for col in self.order_columns]
+    
     def update(self, entity: T) -> bool:
-        connection: sqlite3.Connection = get_connection()
-        cursor: sqlite3.Cursor = connection.cursor()
-        try:
-            values: tuple[Any, ...] = self._entity_to_values(entity)
-            # Reorder: columns values first, then uid
-            update_values: tuple[Any, ...] = values[1:] + (values[0],)
-            cursor.execute(self._get_update_sql(), update_values)
+        with get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.cursor()
+            try:
+                values: tuple[Any, ...] = self._entity_to_values(entity)
+                # Reorder: columns values first, then uid
+                update_values: tuple[Any, ...] = values[1:] + (values[0],)
+                cursor.execute(self._get_update_sql(), update_values)
+                affected: int = cursor.rowcount
+                if affected > 0:
+                    self._record_change(connection=connection)
+                commit(connection)
+            except sqlite3.IntegrityError as e:
+                raise _integrity_error(e) from e
+        if affected > 0:
+            self._after_write()
+        return affected > 0
+    
+    def _delete_where(self, column: str, value: Any) -> int:
+        """Delete every row whose column equals value and return how many were removed"""
+        with get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                f"DELETE FROM {self.table_name} WHERE {column} = ?", (value,)
+            )
             affected: int = cursor.rowcount
-            connection.commit()
-            return affected > 0
-        except sqlite3.IntegrityError as e:
-            raise DuplicateEntityError(f"Entity already exists") from e
-        finally:
-            connection.close()
+            if affected > 0:
+                self._record_change(connection=connection, tables=self.cascade_tables)
+            commit(connection)
+        if affected > 0:
+            self._after_write()
+        return affected
     
     def delete(self, uid: str) -> bool:
-        connection: sqlite3.Connection = get_connection()
-        cursor: sqlite3.Cursor = connection.cursor()
-        cursor.execute(f"DELETE FROM {self.table_name} WHERE uid = ?", (uid,))
-        affected: int = cursor.rowcount
-        connection.commit()
-        connection.close()
+        with get_connection() as connection:
+            cursor: sqlite3.Cursor = connection.cursor()
+            try:
+                cursor.execute(f"DELETE FROM {self.table_name} WHERE uid = ?", (uid,))
+            except sqlite3.IntegrityError as e:
+                raise ForeignKeyViolationError("Entity is still referenced") from e
+            affected: int = cursor.rowcount
+            if affected > 0:
+                self._record_change(connection=connection, tables=self.cascade_tables)
+            commit(connection)
+        if affected > 0:
+            self._after_write()
         return affected > 0
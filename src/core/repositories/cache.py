@@ -0,0 +1,178 @@
+import os
+import threading
+import time
+from abc import ABC
+from typing import Any, Optional, TypeVar
+from core.storage.init_db import get_connection, get_pool, in_transaction, after_transaction
+from core.storage.pool import ConnectionPool
+from .base import BaseRepository
+from .versions import TableVersion, get_table_versions
+
+T = TypeVar(name='T')
+Row = tuple[Any, ...]
+
+
+class TableCache:
+    """Snapshot of a whole table's rows, keyed by uid, shared by every repository of that table.
+
+    A snapshot loaded while a write was in flight is discarded: every
+    invalidation bumps the generation and stale loads are not stored. The
+    snapshot remembers the table_versions counter read before loading it and
+    is dropped once a newer counter is observed.
+    """
+
+    def __init__(self, ttl: float, check_interval: float) -> None:
+        self.ttl: float = ttl
+        self.check_interval: float = check_interval
+        self.hits: int = 0
+        self.misses: int = 0
+        self._rows: Optional[dict[str, Row]] = None
+        self._loaded_at: float = 0.0
+        self._checked_at: float = 0.0
+        self._version: int = 0
+        self._generation: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self) -> Optional[dict[str, Row]]:
+        """Return the snapshot, counting a hit, or None (a miss) when absent or expired"""
+        with self._lock:
+            if self._rows is not None and time.monotonic() - self._loaded_at <= self.ttl:
+                self.hits += 1
+                return self._rows
+            self.misses += 1
+            return None
+
+    def needs_check(self) -> bool:
+        """Whether a snapshot is held and its version was last compared over check_interval ago"""
+        with self._lock:
+            return self._rows is not None and time.monotonic() - self._checked_at > self.check_interval
+
+    def observe(self, version: int) -> None:
+        """Drop the snapshot if the table's counter has moved past the version it was loaded at"""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if self._rows is not None and version != self._version:
+                self._rows = None
+                self._generation += 1
+
+    def store(self, rows: dict[str, Row], generation: int, version: int) -> None:
+        """Keep a freshly loaded snapshot unless the table was written since loading began"""
+        with self._lock:
+            if generation == self._generation:
+                self._rows = rows
+                self._loaded_at = self._checked_at = time.monotonic()
+                self._version = version
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rows = None
+            self._generation += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            size: int = len(self._rows) if self._rows is not None else 0
+            return {"hits": self.hits, "misses": self.misses, "size": size}
+
+
+_caches: dict[str, TableCache] = {}
+_caches_pool: Optional[ConnectionPool] = None
+_caches_lock: threading.Lock = threading.Lock()
+
+
+def get_table_cache(table: str) -> TableCache:
+    """Return the cache for table, starting over when MONEY_MANAGER_DB points at another database"""
+    global _caches_pool
+    pool: ConnectionPool = get_pool()
+    with _caches_lock:
+        if pool is not _caches_pool:
+            _caches.clear()
+            _caches_pool = pool
+        cache: Optional[TableCache] = _caches.get(table)
+        if cache is None:
+            ttl: float = float(os.getenv(key='MONEY_MANAGER_CACHE_TTL', default='300'))
+            check_interval: float = float(os.getenv(key='MONEY_MANAGER_CACHE_CHECK_INTERVAL', default='1'))
+            cache = _caches[table] = TableCache(ttl=ttl, check_interval=check_interval)
+        return cache
+
+
+def observe_table_versions(versions: list[TableVersion]) -> None:
+    """Drop cached snapshots older than versions, which a caller has just read anyway"""
+    with _caches_lock:
+        caches: list[tuple[TableCache, int]] = [
+            (_caches[version.table_name], version.version) for version in versions if version.table_name in _caches
+        ]
+    for cache, version in caches:
+        cache.observe(version=version)
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Hit/miss counters and snapshot size per cached table"""
+    with _caches_lock:
+        caches: dict[str, TableCache] = dict(_caches)
+    return {table: cache.stats() for table, cache in caches.items()}
+
+
+def clear_caches() -> None:
+    """Drop every cached snapshot and its counters"""
+    global _caches_pool
+    with _caches_lock:
+        _caches.clear()
+        _caches_pool = None
+
+
+class CachedRepository(BaseRepository[T], ABC):
+    """Serve get_by_id and get_all of small, hot tables from an in-process snapshot.
+
+    Any write through a repository invalidates the snapshot, again once the
+    enclosing transaction() finishes. Reads inside transaction() bypass the
+    cache so they see uncommitted changes. Hits are served from memory; at
+    most once per MONEY_MANAGER_CACHE_CHECK_INTERVAL seconds a read compares
+    the table's table_versions counter, so repository writes by other
+    processes show up within that interval. Writes around the repositories
+    are picked up after MONEY_MANAGER_CACHE_TTL seconds (0 disables caching).
+    """
+
+    @property
+    def cache(self) -> TableCache:
+        return get_table_cache(table=self.table_name)
+
+    def _snapshot(self) -> Optional[dict[str, Row]]:
+        cache: TableCache = self.cache
+        if cache.ttl <= 0 or in_transaction():
+            return None
+        if cache.needs_check():
+            cache.observe(version=get_table_versions(tables=[self.table_name])[0].version)
+        rows: Optional[dict[str, Row]] = cache.get()
+        if rows is not None:
+            return rows
+
+        generation: int = cache.generation
+        # Read before the rows: a write landing in between leaves an older version, forcing a reload
+        version: int = get_table_versions(tables=[self.table_name])[0].version
+        with get_connection() as connection:
+            rows = {row[0]: row for row in connection.execute(self._get_select_sql())}
+        cache.store(rows=rows, generation=generation, version=version)
+        return rows
+
+    def get_by_id(self, uid: str) -> Optional[T]:
+        rows: Optional[dict[str, Row]] = self._snapshot()
+        if rows is None:
+            return super().get_by_id(uid=uid)
+        row: Optional[Row] = rows.get(uid)
+        return self._row_to_entity(row) if row is not None else None
+
+    def get_all(self) -> list[T]:
+        rows: Optional[dict[str, Row]] = self._snapshot()
+        if rows is None:
+            return super().get_all()
+        return [self._row_to_entity(row) for row in rows.values()]
+
+    def _after_write(self) -> None:
+        super()._after_write()
+        cache: TableCache = self.cache
+        cache.invalidate()
+        after_transaction(callback=cache.invalidate)
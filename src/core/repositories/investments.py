@@ -1,10 +1,24 @@
-from typing import Any
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
 from core.repositories.base import BaseRepository
-from core.domain import Investment, InvestmentValueSnapshot, InvestmentPlan, InvestmentPlanInstance
+from core.repositories.cache import CachedRepository
+from core.repositories.schedules import ScheduledInstanceRepository
+from core.storage.init_db import get_connection
+from core.domain import (
+    Investment, InvestmentValueSnapshot, InvestmentValueSnapshotView, InvestmentPlan, InvestmentPlanInstance
+)
 from core.domain.base import InvestmentStatus, Frequency, InvestmentPlanStatus, InvestmentPlanInstanceStatus
 
 
-class InvestmentRepository(BaseRepository[Investment]):
+@dataclass
+class InvestmentSnapshotFilter:
+    investment_id: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+
+class InvestmentRepository(CachedRepository[Investment]):
     @property
     def table_name(self) -> str:
         return "investments"
@@ -33,6 +47,16 @@ class InvestmentValueSnapshotRepository(BaseRepository[InvestmentValueSnapshot])
     def columns(self) -> list[str]:
         return ["investment_id", "date", "current_value"]
     
+    @property
+    def order_columns(self) -> list[str]:
+        return ["date", "uid"]
+    
+    VIEW_SQL: str = """
+        SELECT * FROM (
+            SELECT s.uid, s.investment_id, s.date, s.current_value, i.name AS investment_name
+            FROM investment_value_snapshots s
+            LEFT JOIN investments i ON i.uid = s.investment_id)"""
+    
     def _entity_to_values(self, entity: InvestmentValueSnapshot) -> tuple[Any, ...]:
         return (entity.uid, entity.investment_id, entity.date, entity.current_value)
     
@@ -42,6 +66,63 @@ class InvestmentValueSnapshotRepository(BaseRepository[InvestmentValueSnapshot])
             investment_id=row[1],
             date=row[2],
             current_value=row[3])
+    
+    def _row_to_view(self, row: tuple[Any, ...]) -> InvestmentValueSnapshotView:
+        return InvestmentValueSnapshotView(
+            uid=row[0],
+            investment_id=row[1],
+            date=row[2],
+            current_value=row[3],
+            investment_name=row[4])
+    
+    def find_view(self, filters: InvestmentSnapshotFilter, limit: Optional[int] = None,
+                  cursor: Optional[str] = None, descending: bool = False
+                  ) -> tuple[list[InvestmentValueSnapshotView], Optional[str]]:
+        """Find snapshots in (date, uid) order with the investment name joined in SQL"""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if filters.investment_id is not None:
+            conditions.append("investment_id = ?")
+            params.append(filters.investment_id)
+        if filters.date_from is not None:
+            conditions.append("date >= ?")
+            params.append(filters.date_from)
+        if filters.date_to is not None:
+            conditions.append("date <= ?")
+            params.append(filters.date_to)
+        return self._select_page(conditions=conditions, params=params, limit=limit, cursor=cursor,
+                                 descending=descending, select_sql=self.VIEW_SQL, row_mapper=self._row_to_view)
+    
+    def latest_views(self, as_of: Optional[date] = None) -> list[InvestmentValueSnapshotView]:
+        """Most recent snapshot on or before as_of (default: ever) of each investment that has one.
+        
+        The correlated subquery is one backward seek on the (investment_id,
+        date, uid) index per investment rather than a scan of all snapshots.
+        """
+        bound: str = "AND date <= ?" if as_of is not None else ""
+        params: list[Any] = [as_of] if as_of is not None else []
+        with get_connection() as connection:
+            rows: list[tuple[Any, ...]] = connection.execute(f"""
+                SELECT s.uid, s.investment_id, s.date, s.current_value, i.name
+                FROM investments i
+                JOIN investment_value_snapshots s ON s.uid = (
+                    SELECT uid FROM investment_value_snapshots
+                    WHERE investment_id = i.uid {bound}
+                    ORDER BY date DESC, uid DESC LIMIT 1)
+                ORDER BY i.name
+            """, params).fetchall()
+        return [self._row_to_view(row) for row in rows]
+    
+    def value_series(self, as_of: Optional[date] = None) -> list[tuple[str, str, float]]:
+        """(investment_id, date, current_value) of every snapshot up to as_of, by investment and date"""
+        sql: str = "SELECT investment_id, date, current_value FROM investment_value_snapshots"
+        params: list[Any] = []
+        if as_of is not None:
+            sql += " WHERE date <= ?"
+            params.append(as_of)
+        sql += " ORDER BY investment_id, date, uid"
+        with get_connection() as connection:
+            return connection.execute(sql, params).fetchall()
 
 
 class InvestmentPlanRepository(BaseRepository[InvestmentPlan]):
@@ -69,7 +150,7 @@ class InvestmentPlanRepository(BaseRepository[InvestmentPlan]):
             status=InvestmentPlanStatus(value=row[7]))
 
 
-class InvestmentPlanInstanceRepository(BaseRepository[InvestmentPlanInstance]):
+class InvestmentPlanInstanceRepository(ScheduledInstanceRepository[InvestmentPlanInstance]):
     @property
     def table_name(self) -> str:
         return "investment_plan_instances"
@@ -78,6 +159,14 @@ class InvestmentPlanInstanceRepository(BaseRepository[InvestmentPlanInstance]):
     def columns(self) -> list[str]:
         return ["investment_plan_id", "amount", "due_date", "transaction_id", "status"]
     
+    @property
+    def order_columns(self) -> list[str]:
+        return ["due_date", "uid"]
+    
+    @property
+    def parent_column(self) -> str:
+        return "investment_plan_id"
+    
     def _entity_to_values(self, entity: InvestmentPlanInstance) -> tuple[Any, ...]:
         return (entity.uid, entity.investment_plan_id, entity.amount, entity.due_date,
                 entity.transaction_id, entity.status.value)
@@ -90,5 +179,23 @@ class InvestmentPlanInstanceRepository(BaseRepository[InvestmentPlanInstance]):
             due_date=row[3],
             transaction_id=row[4],
             status=InvestmentPlanInstanceStatus(value=row[5]))
+    
+    def executed_contributions(self, as_of: Optional[date] = None) -> list[tuple[str, str, float]]:
+        """(investment_id, due_date, amount) of every EXECUTED instance due up to as_of"""
+        sql: str = """
+            SELECT p.investment_id, i.due_date, i.amount
+            FROM investment_plan_instances i
+            JOIN investment_plans p ON p.uid = i.investment_plan_id
+            WHERE i.status = ?"""
+        params: list[Any] = [InvestmentPlanInstanceStatus.EXECUTED.value]
+        if as_of is not None:
+            sql += " AND i.due_date <= ?"
+            params.append(as_of)
+        with get_connection() as connection:
+            return connection.execute(sql, params).fetchall()
+    
+    def delete_by_plan(self, investment_plan_id: str) -> int:
+        """Delete all instances of an investment plan"""
+        return self._delete_where(column="investment_plan_id", value=investment_plan_id)
 
 # Made with Bob
@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta, timezone
+from core.storage.init_db import get_connection, commit
+
+
+def acquire_lease(name: str, owner: str, ttl: float) -> bool:
+    """Take or renew the lease on name for ttl seconds; False while another owner's lease is unexpired"""
+    now: datetime = datetime.now(tz=timezone.utc)
+    expires_at: str = (now + timedelta(seconds=ttl)).isoformat()
+    with get_connection() as connection:
+        cursor = connection.execute("""
+            INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+            WHERE leases.owner = excluded.owner OR leases.expires_at <= ?
+        """, (name, owner, expires_at, now.isoformat()))
+        acquired: bool = cursor.rowcount > 0
+        commit(connection)
+    return acquired
+
+
+def release_lease(name: str, owner: str) -> None:
+    """Give up the lease on name if owner still holds it"""
+    with get_connection() as connection:
+        connection.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+        commit(connection)
@@ -0,0 +1,39 @@
+import sqlite3
+from collections.abc import Iterable
+from core.storage.init_db import get_connection
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+MAX_IN_PARAMS: int = 900
+
+
+class ReferenceChecker:
+    """Check that referenced uids exist, with one query for every table involved"""
+
+    def find_missing(self, references: dict[str, Iterable[str]]) -> dict[str, set[str]]:
+        """Map each table to the referenced uids that do not exist in it"""
+        pending: dict[str, set[str]] = {table: set(uids) for table, uids in references.items() if uids}
+        found: dict[str, set[str]] = self._select_existing(pending) if pending else {}
+        return {table: uids - found.get(table, set()) for table, uids in pending.items()}
+
+    def _select_existing(self, references: dict[str, set[str]]) -> dict[str, set[str]]:
+        found: dict[str, set[str]] = {table: set() for table in references}
+        chunks: list[tuple[str, list[str]]] = []
+        for table, uids in references.items():
+            ordered: list[str] = sorted(uids)
+            for start in range(0, len(ordered), MAX_IN_PARAMS):
+                chunks.append((table, ordered[start:start + MAX_IN_PARAMS]))
+
+        with get_connection() as connection:
+            # Group chunks into UNION ALL statements that stay under the parameter limit
+            while chunks:
+                selects: list[str] = []
+                params: list[str] = []
+                while chunks and len(params) + len(chunks[0][1]) <= MAX_IN_PARAMS:
+                    table, uids = chunks.pop(0)
+                    placeholders: str = ', '.join('?' * len(uids))
+                    selects.append(f"SELECT '{table}', uid FROM {table} WHERE uid IN ({placeholders})")
+                    params.extend(uids)
+                cursor: sqlite3.Cursor = connection.execute(" UNION ALL ".join(selects), params)
+                for table, uid in cursor.fetchall():
+                    found[table].add(uid)
+        return found
@@ -0,0 +1,127 @@
+import calendar
+from datetime import date
+from typing import Any
+from core.domain import TransactionSummary, AccountBalance
+from core.domain.base import SummaryGroup
+from core.storage.init_db import get_connection
+from .transactions import TransactionRepository, TransactionFilter
+
+# Group key per dimension; a week is keyed by its Monday
+GROUP_EXPRESSIONS: dict[SummaryGroup, str] = {
+    SummaryGroup.MONTH: "substr(date, 1, 7)",
+    SummaryGroup.WEEK: "date(date, '-6 days', 'weekday 1')",
+    SummaryGroup.CATEGORY_ID: "category_id",
+    SummaryGroup.ACCOUNT_ID: "account_id",
+}
+
+# Groups transaction_monthly_rollup can answer, by their column there
+ROLLUP_EXPRESSIONS: dict[SummaryGroup, str] = {
+    SummaryGroup.MONTH: "month",
+    SummaryGroup.CATEGORY_ID: "category_id",
+    SummaryGroup.ACCOUNT_ID: "account_id",
+}
+
+
+def covers_whole_months(filters: TransactionFilter) -> bool:
+    """Whether filters select whole months by account and category only, as stored in the rollup"""
+    if filters.min_amount is not None or filters.max_amount is not None or filters.name_prefix:
+        return False
+    if filters.date_from is not None and filters.date_from.day != 1:
+        return False
+    if filters.date_to is not None:
+        last_day: int = calendar.monthrange(filters.date_to.year, filters.date_to.month)[1]
+        if filters.date_to.day != last_day:
+            return False
+    return True
+
+
+class ReportRepository:
+    """Read-only aggregates computed in SQL"""
+
+    def summarize_transactions(self, group_by: list[SummaryGroup],
+                               filters: TransactionFilter) -> list[TransactionSummary]:
+        """Count and total of transactions matching filters per distinct combination of group_by.
+
+        Month, category and account totals over whole months are summed from
+        transaction_monthly_rollup, one row per month rather than per
+        transaction; other groups and filters scan transactions. Rows are
+        aggregated first and only then joined to accounts and categories for
+        their names, so joins cost one lookup per group.
+        """
+        if all(group in ROLLUP_EXPRESSIONS for group in group_by) and covers_whole_months(filters=filters):
+            sql, params = self._rollup_aggregate(group_by=group_by, filters=filters)
+        else:
+            sql, params = self._transaction_aggregate(group_by=group_by, filters=filters)
+
+        columns: list[str] = ["g.*"]
+        joins: list[str] = []
+        if SummaryGroup.CATEGORY_ID in group_by:
+            columns.append("c.name AS category_name")
+            joins.append("LEFT JOIN categories c ON c.uid = g.category_id")
+        if SummaryGroup.ACCOUNT_ID in group_by:
+            columns.append("a.name AS account_name")
+            joins.append("LEFT JOIN accounts a ON a.uid = g.account_id")
+        order: str = ', '.join(f"g.{group.value}" for group in group_by)
+        sql = f"SELECT {', '.join(columns)} FROM ({sql}) g {' '.join(joins)} ORDER BY {order}"
+
+        with get_connection() as connection:
+            cursor = connection.execute(sql, params)
+            names: list[str] = [description[0] for description in cursor.description]
+            rows: list[tuple[Any, ...]] = cursor.fetchall()
+        summaries: list[TransactionSummary] = []
+        for row in rows:
+            values: dict[str, Any] = dict(zip(names, row))
+            if values.get("week") is not None:
+                values["week"] = date.fromisoformat(values["week"])
+            summaries.append(TransactionSummary(**values))
+        return summaries
+
+    def account_balance(self, account_id: str, as_of: date) -> AccountBalance:
+        """Balance of account_id at the end of as_of.
+
+        The last month-end checkpoint before as_of's month is one index seek;
+        only the transactions from the start of that month to as_of are summed.
+        """
+        month_start: date = as_of.replace(day=1)
+        with get_connection() as connection:
+            row: tuple[float] = connection.execute("""
+                SELECT COALESCE((SELECT balance FROM account_balance_checkpoints
+                                 WHERE account_id = ? AND month < ? ORDER BY month DESC LIMIT 1), 0)
+                     + COALESCE((SELECT SUM(amount) FROM transactions
+                                 WHERE account_id = ? AND date >= ? AND date <= ?), 0)
+            """, (account_id, month_start.isoformat()[:7], account_id, month_start, as_of)).fetchone()
+        return AccountBalance(account_id=account_id, as_of=as_of, balance=row[0])
+
+    @staticmethod
+    def _transaction_aggregate(group_by: list[SummaryGroup],
+                               filters: TransactionFilter) -> tuple[str, list[Any]]:
+        conditions, params = TransactionRepository.filter_conditions(filters=filters)
+        keys: str = ', '.join(f"{GROUP_EXPRESSIONS[group]} AS {group.value}" for group in group_by)
+        sql: str = f"SELECT {keys}, COUNT(*) AS count, SUM(amount) AS total FROM transactions"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" GROUP BY {', '.join(group.value for group in group_by)}"
+        return sql, params
+
+    @staticmethod
+    def _rollup_aggregate(group_by: list[SummaryGroup], filters: TransactionFilter) -> tuple[str, list[Any]]:
+        conditions: list[str] = []
+        params: list[Any] = []
+        if filters.account_id is not None:
+            conditions.append("account_id = ?")
+            params.append(filters.account_id)
+        if filters.category_id is not None:
+            conditions.append("category_id = ?")
+            params.append(filters.category_id)
+        if filters.date_from is not None:
+            conditions.append("month >= ?")
+            params.append(filters.date_from.isoformat()[:7])
+        if filters.date_to is not None:
+            conditions.append("month <= ?")
+            params.append(filters.date_to.isoformat()[:7])
+        keys: str = ', '.join(f"{ROLLUP_EXPRESSIONS[group]} AS {group.value}" for group in group_by)
+        sql: str = f"SELECT {keys}, SUM(count) AS count, SUM(total) AS total FROM transaction_monthly_rollup"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" GROUP BY {', '.join(group.value for group in group_by)}"
+        return sql, params
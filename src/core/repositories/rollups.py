@@ -0,0 +1,93 @@
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterable
+from core.domain import Transaction
+from core.storage.init_db import transaction
+from .versions import bump_table_versions
+
+# (month 'YYYY-MM', account_id, category_id) -> (count, total) change
+RollupDeltas = dict[tuple[str, str, str], tuple[int, float]]
+
+
+def rollup_deltas(added: Iterable[Transaction] = (), removed: Iterable[Transaction] = ()) -> RollupDeltas:
+    """Net rollup change of inserting added and deleting removed transactions"""
+    deltas: defaultdict[tuple[str, str, str], list[float]] = defaultdict(lambda: [0, 0.0])
+    for sign, transactions in ((1, added), (-1, removed)):
+        for txn in transactions:
+            delta: list[float] = deltas[(str(txn.date)[:7], txn.account_id, txn.category_id)]
+            delta[0] += sign
+            delta[1] += sign * txn.amount
+    return {key: (int(count), total) for key, (count, total) in deltas.items() if count or total}
+
+
+def apply_rollup_deltas(connection: sqlite3.Connection, deltas: RollupDeltas) -> None:
+    """Add deltas to transaction_monthly_rollup in the caller's (uncommitted) transaction"""
+    if not deltas:
+        return
+    connection.executemany("""
+        INSERT INTO transaction_monthly_rollup (month, account_id, category_id, count, total)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (month, account_id, category_id) DO UPDATE
+        SET count = count + excluded.count, total = total + excluded.total
+    """, [(*key, count, total) for key, (count, total) in deltas.items()])
+    connection.executemany(
+        "DELETE FROM transaction_monthly_rollup WHERE month = ? AND account_id = ? AND category_id = ? AND count <= 0",
+        list(deltas)
+    )
+
+
+def apply_checkpoint_deltas(connection: sqlite3.Connection, deltas: RollupDeltas) -> None:
+    """Shift account_balance_checkpoints by deltas in the caller's (uncommitted) transaction.
+
+    A change in some month moves that month's and every later month-end
+    balance of the account; a month without a checkpoint first gets one
+    carrying the previous month-end balance forward.
+    """
+    amounts: defaultdict[tuple[str, str], float] = defaultdict(float)
+    for (month, account_id, _), (_, total) in deltas.items():
+        amounts[(account_id, month)] += total
+    for (account_id, month), amount in amounts.items():
+        connection.execute("""
+            INSERT OR IGNORE INTO account_balance_checkpoints (account_id, month, balance)
+            VALUES (?, ?, COALESCE((SELECT balance FROM account_balance_checkpoints
+                                    WHERE account_id = ? AND month < ? ORDER BY month DESC LIMIT 1), 0))
+        """, (account_id, month, account_id, month))
+        connection.execute(
+            "UPDATE account_balance_checkpoints SET balance = balance + ? WHERE account_id = ? AND month >= ?",
+            (amount, account_id, month)
+        )
+
+
+def rebuild_monthly_rollup() -> int:
+    """Recompute transaction_monthly_rollup from transactions and return its row count.
+
+    Incremental updates keep the rollup exact; a rebuild clears floating point
+    drift in totals and repairs rows written around the repository. It bumps
+    the transactions version, which the ETags of reports built on it name.
+    """
+    with transaction() as connection:
+        connection.execute("DELETE FROM transaction_monthly_rollup")
+        bump_table_versions(connection=connection, tables=["transactions"])
+        cursor = connection.execute("""
+            INSERT INTO transaction_monthly_rollup (month, account_id, category_id, count, total)
+            SELECT substr(date, 1, 7), account_id, category_id, COUNT(*), SUM(amount)
+            FROM transactions GROUP BY 1, 2, 3
+        """)
+        return cursor.rowcount
+
+
+def rebuild_balance_checkpoints() -> int:
+    """Recompute account_balance_checkpoints from transactions and return its row count.
+
+    Like rebuild_monthly_rollup, it bumps the transactions version so cached balances revalidate.
+    """
+    with transaction() as connection:
+        connection.execute("DELETE FROM account_balance_checkpoints")
+        bump_table_versions(connection=connection, tables=["transactions"])
+        cursor = connection.execute("""
+            INSERT INTO account_balance_checkpoints (account_id, month, balance)
+            SELECT account_id, month, SUM(total) OVER (PARTITION BY account_id ORDER BY month)
+            FROM (SELECT account_id, substr(date, 1, 7) AS month, SUM(amount) AS total FROM transactions
+                  GROUP BY account_id, month)
+        """)
+        return cursor.rowcount
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional, TypeVar
+from core.storage.init_db import get_connection, commit
+from .base import BaseRepository
+
+T = TypeVar(name='T')
+
+
+class ScheduledInstanceRepository(BaseRepository[T], ABC):
+    """Instances materialized from a recurring parent (subscription or investment plan)"""
+
+    @property
+    @abstractmethod
+    def parent_column(self) -> str:
+        """Column referencing the parent schedule"""
+        pass
+
+    def first_due_dates(self, parent_ids: Optional[list[str]] = None) -> dict[str, date]:
+        """Earliest instance due date per parent, which anchors the parent's series"""
+        sql: str = f"SELECT {self.parent_column}, MIN(due_date) FROM {self.table_name}"
+        params: list[str] = []
+        if parent_ids is not None:
+            sql += f" WHERE {self.parent_column} IN ({', '.join('?' * len(parent_ids))})"
+            params = parent_ids
+        sql += f" GROUP BY {self.parent_column}"
+        with get_connection() as connection:
+            rows: list[tuple[str, str]] = connection.execute(sql, params).fetchall()
+        return {parent_id: date.fromisoformat(due_date) for parent_id, due_date in rows}
+
+    def existing_periods(self, date_from: date, date_to: date) -> set[tuple[str, str]]:
+        """(parent, 'YYYY-MM') pairs that already have an instance between the months of both dates"""
+        with get_connection() as connection:
+            rows: list[tuple[str, str]] = connection.execute(f"""
+                SELECT DISTINCT {self.parent_column}, substr(due_date, 1, 7) FROM {self.table_name}
+                WHERE due_date >= ? AND due_date < date(?, 'start of month', '+1 month')
+            """, (date_from.replace(day=1), date_to)).fetchall()
+        return set(rows)
+
+    def transition_past_due(self, from_status: str, to_status: str, before: date) -> int:
+        """Move every from_status instance due before the given date to to_status in one UPDATE"""
+        with get_connection() as connection:
+            cursor = connection.execute(
+                f"UPDATE {self.table_name} SET status = ? WHERE status = ? AND due_date < ?",
+                (to_status, from_status, before)
+            )
+            affected: int = cursor.rowcount
+            if affected > 0:
+                self._record_change(connection=connection)
+            commit(connection)
+        if affected > 0:
+            self._after_write()
+        return affected
@@ -1,10 +1,21 @@
-from typing import Any
-from core.repositories.base import BaseRepository
-from core.domain import Subscription, SubscriptionInstance
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+from core.repositories.cache import CachedRepository
+from core.repositories.schedules import ScheduledInstanceRepository
+from core.domain import Subscription, SubscriptionInstance, SubscriptionInstanceView
 from core.domain.base import Frequency, SubscriptionStatus, SubscriptionInstanceStatus
 
 
-class SubscriptionRepository(BaseRepository[Subscription]):
+@dataclass
+class SubscriptionInstanceFilter:
+    subscription_id: Optional[str] = None
+    status: Optional[SubscriptionInstanceStatus] = None
+    due_date_from: Optional[date] = None
+    due_date_to: Optional[date] = None
+
+
+class SubscriptionRepository(CachedRepository[Subscription]):
     @property
     def table_name(self) -> str:
         return "subscriptions"
@@ -29,7 +40,7 @@ class SubscriptionRepository(BaseRepository[Subscription]):
             status=SubscriptionStatus(value=row[7]))
 
 
-class SubscriptionInstanceRepository(BaseRepository[SubscriptionInstance]):
+class SubscriptionInstanceRepository(ScheduledInstanceRepository[SubscriptionInstance]):
     @property
     def table_name(self) -> str:
         return "subscription_instances"
@@ -38,6 +49,22 @@ class SubscriptionInstanceRepository(BaseRepository[SubscriptionInstance]):
     def columns(self) -> list[str]:
         return ["subscription_id", "amount", "due_date", "transaction_id", "status"]
     
+    @property
+    def order_columns(self) -> list[str]:
+        return ["due_date", "uid"]
+    
+    @property
+    def parent_column(self) -> str:
+        return "subscription_id"
+    
+    VIEW_SQL: str = """
+        SELECT * FROM (
+            SELECT i.uid, i.subscription_id, i.amount, i.due_date, i.transaction_id, i.status,
+                   s.name AS subscription_name, t.name AS transaction_name
+            FROM subscription_instances i
+            LEFT JOIN subscriptions s ON s.uid = i.subscription_id
+            LEFT JOIN transactions t ON t.uid = i.transaction_id)"""
+    
     def _entity_to_values(self, entity: SubscriptionInstance) -> tuple[Any, ...]:
         return (entity.uid, entity.subscription_id, entity.amount, entity.due_date,
                 entity.transaction_id, entity.status.value)
@@ -50,5 +77,41 @@ class SubscriptionInstanceRepository(BaseRepository[SubscriptionInstance]):
             due_date=row[3],
             transaction_id=row[4],
             status=SubscriptionInstanceStatus(value=row[5]))
+    
+    def _row_to_view(self, row: tuple[Any, ...]) -> SubscriptionInstanceView:
+        return SubscriptionInstanceView(
+            uid=row[0],
+            subscription_id=row[1],
+            amount=row[2],
+            due_date=row[3],
+            transaction_id=row[4],
+            status=SubscriptionInstanceStatus(value=row[5]),
+            subscription_name=row[6],
+            transaction_name=row[7])
+    
+    def find_view(self, filters: SubscriptionInstanceFilter, limit: Optional[int] = None,
+                  cursor: Optional[str] = None, descending: bool = False
+                  ) -> tuple[list[SubscriptionInstanceView], Optional[str]]:
+        """Find instances in (due_date, uid) order with subscription and transaction names joined in SQL"""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if filters.subscription_id is not None:
+            conditions.append("subscription_id = ?")
+            params.append(filters.subscription_id)
+        if filters.status is not None:
+            conditions.append("status = ?")
+            params.append(filters.status.value)
+        if filters.due_date_from is not None:
+            conditions.append("due_date >= ?")
+            params.append(filters.due_date_from)
+        if filters.due_date_to is not None:
+            conditions.append("due_date <= ?")
+            params.append(filters.due_date_to)
+        return self._select_page(conditions=conditions, params=params, limit=limit, cursor=cursor,
+                                 descending=descending, select_sql=self.VIEW_SQL, row_mapper=self._row_to_view)
+    
+    def delete_by_subscription(self, subscription_id: str) -> int:
+        """Delete all instances of a subscription"""
+        return self._delete_where(column="subscription_id", value=subscription_id)
 
 # Made with Bob
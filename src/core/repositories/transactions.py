@@ -1,9 +1,27 @@
-from typing import Any
-from core.repositories.base import BaseRepository
-from core.domain import Category, Account, Transaction
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+from core.repositories.base import BaseRepository, BulkCreateResult
+from core.repositories.cache import CachedRepository
+from core.repositories.rollups import RollupDeltas, rollup_deltas, apply_rollup_deltas, apply_checkpoint_deltas
+from core.storage.init_db import get_connection, transaction
+from core.domain import Category, Account, Transaction, TransactionView
 
 
-class CategoryRepository(BaseRepository[Category]):
+@dataclass
+class TransactionFilter:
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    account_id: Optional[str] = None
+    category_id: Optional[str] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    name_prefix: Optional[str] = None
+
+
+class CategoryRepository(CachedRepository[Category]):
     @property
     def table_name(self) -> str:
         return "categories"
@@ -19,7 +37,7 @@ class CategoryRepository(BaseRepository[Category]):
         return Category(uid=row[0], name=row[1])
 
 
-class AccountRepository(BaseRepository[Account]):
+class AccountRepository(CachedRepository[Account]):
     @property
     def table_name(self) -> str:
         return "accounts"
@@ -44,6 +62,25 @@ class TransactionRepository(BaseRepository[Transaction]):
     def columns(self) -> list[str]:
         return ["name", "amount", "date", "account_id", "category_id"]
     
+    @property
+    def order_columns(self) -> list[str]:
+        return ["date", "uid"]
+    
+    # Outer SELECT keeps unqualified filter and keyset columns unambiguous;
+    # SQLite flattens it, so the transactions indexes still apply
+    VIEW_SQL: str = """
+        SELECT * FROM (
+            SELECT t.uid, t.name, t.amount, t.date, t.account_id, t.category_id,
+                   a.name AS account_name, c.name AS category_name
+            FROM transactions t
+            LEFT JOIN accounts a ON a.uid = t.account_id
+            LEFT JOIN categories c ON c.uid = t.category_id)"""
+    
+    @property
+    def cascade_tables(self) -> list[str]:
+        # Deleting a transaction clears transaction_id on linked instances
+        return ["subscription_instances", "investment_plan_instances"]
+    
     def _entity_to_values(self, entity: Transaction) -> tuple[Any, ...]:
         return (entity.uid, entity.name, entity.amount, entity.date, 
                 entity.account_id, entity.category_id)
@@ -56,5 +93,113 @@ class TransactionRepository(BaseRepository[Transaction]):
             date=row[3],
             account_id=row[4],
             category_id=row[5])
+    
+    def _row_to_view(self, row: tuple[Any, ...]) -> TransactionView:
+        return TransactionView(
+            uid=row[0],
+            name=row[1],
+            amount=row[2],
+            date=row[3],
+            account_id=row[4],
+            category_id=row[5],
+            account_name=row[6],
+            category_name=row[7])
+    
+    # Writes also adjust transaction_monthly_rollup and account_balance_checkpoints in the same transaction
+    def create(self, entity: Transaction) -> str:
+        with transaction() as connection:
+            uid: str = super().create(entity)
+            self._apply_deltas(connection=connection, added=[entity])
+        return uid
+    
+    def create_many(self, entities: list[Transaction], batch_size: int = 500) -> BulkCreateResult:
+        with transaction() as connection:
+            result: BulkCreateResult = super().create_many(entities=entities, batch_size=batch_size)
+            failed: set[int] = {index for index, _ in result.failed}
+            created: list[Transaction] = [entity for index, entity in enumerate(entities) if index not in failed]
+            self._apply_deltas(connection=connection, added=created)
+        return result
+    
+    def update(self, entity: Transaction) -> bool:
+        with transaction() as connection:
+            previous: Optional[Transaction] = self.get_by_id(uid=entity.uid)
+            updated: bool = super().update(entity)
+            if updated and previous is not None:
+                self._apply_deltas(connection=connection, added=[entity], removed=[previous])
+        return updated
+    
+    def delete(self, uid: str) -> bool:
+        with transaction() as connection:
+            previous: Optional[Transaction] = self.get_by_id(uid=uid)
+            deleted: bool = super().delete(uid)
+            if deleted and previous is not None:
+                self._apply_deltas(connection=connection, removed=[previous])
+        return deleted
+    
+    @staticmethod
+    def _apply_deltas(connection: sqlite3.Connection, added: Iterable[Transaction] = (),
+                      removed: Iterable[Transaction] = ()) -> None:
+        deltas: RollupDeltas = rollup_deltas(added=added, removed=removed)
+        apply_rollup_deltas(connection=connection, deltas=deltas)
+        apply_checkpoint_deltas(connection=connection, deltas=deltas)
+    
+    def find(self, filters: TransactionFilter, limit: Optional[int] = None, cursor: Optional[str] = None,
+             descending: bool = False) -> tuple[list[Transaction], Optional[str]]:
+        """Find transactions matching filters in (date, uid) order, optionally one page at a time"""
+        conditions, params = self.filter_conditions(filters=filters)
+        return self._select_page(conditions=conditions, params=params, limit=limit,
+                                 cursor=cursor, descending=descending)
+    
+    def find_view(self, filters: TransactionFilter, limit: Optional[int] = None, cursor: Optional[str] = None,
+                  descending: bool = False) -> tuple[list[TransactionView], Optional[str]]:
+        """Like find, with account and category names joined in SQL"""
+        conditions, params = self.filter_conditions(filters=filters)
+        return self._select_page(conditions=conditions, params=params, limit=limit, cursor=cursor,
+                                 descending=descending, select_sql=self.VIEW_SQL, row_mapper=self._row_to_view)
+    
+    def iter_export_rows(self, batch_size: int = 1000) -> Iterator[list[tuple[Any, ...]]]:
+        """Yield (name, amount, date, account, category) rows in batches, joined in SQL"""
+        with get_connection() as connection:
+            cursor = connection.execute("""
+                SELECT t.name, t.amount, t.date, COALESCE(a.name, ''), COALESCE(c.name, '')
+                FROM transactions t
+                LEFT JOIN accounts a ON a.uid = t.account_id
+                LEFT JOIN categories c ON c.uid = t.category_id
+                ORDER BY t.date, t.uid
+            """)
+            while True:
+                rows: list[tuple[Any, ...]] = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+    
+    @staticmethod
+    def filter_conditions(filters: TransactionFilter) -> tuple[list[str], list[Any]]:
+        """WHERE conditions and parameters over unqualified transactions columns"""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if filters.account_id is not None:
+            conditions.append("account_id = ?")
+            params.append(filters.account_id)
+        if filters.category_id is not None:
+            conditions.append("category_id = ?")
+            params.append(filters.category_id)
+        if filters.date_from is not None:
+            conditions.append("date >= ?")
+            params.append(filters.date_from)
+        if filters.date_to is not None:
+            conditions.append("date <= ?")
+            params.append(filters.date_to)
+        if filters.min_amount is not None:
+            conditions.append("amount >= ?")
+            params.append(filters.min_amount)
+        if filters.max_amount is not None:
+            conditions.append("amount <= ?")
+            params.append(filters.max_amount)
+        if filters.name_prefix:
+            escaped: str = filters.name_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(f"{escaped}%")
+        return conditions, params
 
 # Made with Bob
@@ -0,0 +1,38 @@
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from core.storage.init_db import get_connection
+
+
+@dataclass(frozen=True)
+class TableVersion:
+    """Change counter of a table and the time of its last write"""
+    table_name: str
+    version: int
+    updated_at: Optional[datetime]
+
+
+def bump_table_versions(connection: sqlite3.Connection, tables: list[str]) -> None:
+    """Increment the change counter of tables in the caller's (uncommitted) transaction"""
+    now: str = datetime.now(tz=timezone.utc).isoformat()
+    connection.executemany("""
+        INSERT INTO table_versions (table_name, version, updated_at) VALUES (?, 1, ?)
+        ON CONFLICT (table_name) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at
+    """, [(table, now) for table in tables])
+
+
+def get_table_versions(tables: list[str]) -> list[TableVersion]:
+    """Return the counters of tables in the given order; never-written tables are at version 0"""
+    placeholders: str = ', '.join('?' * len(tables))
+    with get_connection() as connection:
+        rows: list[tuple[str, int, str]] = connection.execute(
+            f"SELECT table_name, version, updated_at FROM table_versions WHERE table_name IN ({placeholders})",
+            tables
+        ).fetchall()
+    found: dict[str, tuple[int, str]] = {row[0]: (row[1], row[2]) for row in rows}
+    return [
+        TableVersion(table_name=table, version=found[table][0], updated_at=datetime.fromisoformat(found[table][1]))
+        if table in found else TableVersion(table_name=table, version=0, updated_at=None)
+        for table in tables
+    ]
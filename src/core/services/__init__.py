@@ -1,8 +1,24 @@
 """Service layer for business logic"""
 from .transaction_service import TransactionService
 from .subscription_service import SubscriptionService
+from .investment_plan_service import InvestmentPlanService
+from .performance_service import InvestmentPerformanceService
+from .scheduler import StatusSweepService, SweepScheduler
+from .recurrence import Schedule, GenerationResult, expand_due_dates, missing_due_dates, generate_instances
+from .performance import compute_performance, batch_xirr
 
 __all__ = [
     "TransactionService",
     "SubscriptionService",
+    "InvestmentPlanService",
+    "InvestmentPerformanceService",
+    "StatusSweepService",
+    "SweepScheduler",
+    "Schedule",
+    "GenerationResult",
+    "expand_due_dates",
+    "missing_due_dates",
+    "generate_instances",
+    "compute_performance",
+    "batch_xirr",
 ]
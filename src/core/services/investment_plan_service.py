@@ -0,0 +1,28 @@
+from datetime import date
+from typing import Optional
+from core.domain import InvestmentPlan, InvestmentPlanInstance
+from core.domain.base import InvestmentPlanStatus, InvestmentPlanInstanceStatus
+from core.repositories import InvestmentPlanRepository, InvestmentPlanInstanceRepository
+from core.utils import generate_uid
+from .recurrence import GenerationResult, generate_instances
+
+
+class InvestmentPlanService:
+    def __init__(self) -> None:
+        self.plan_repo = InvestmentPlanRepository()
+        self.instance_repo = InvestmentPlanInstanceRepository()
+    
+    def generate_instances(self, until: date, start: Optional[date] = None,
+                           plans: Optional[list[InvestmentPlan]] = None) -> GenerationResult:
+        """Create the missing PLANNED instances of active plans from start (default today) to until,
+        one per plan and due month (see recurrence.generate_instances)"""
+        return generate_instances(
+            parent_repo=self.plan_repo, instance_repo=self.instance_repo,
+            make_instance=lambda plan, due_date: InvestmentPlanInstance(
+                uid=generate_uid(), investment_plan_id=plan.uid, amount=plan.amount, due_date=due_date,
+                transaction_id=None, status=InvestmentPlanInstanceStatus.PLANNED
+            ),
+            active_status=InvestmentPlanStatus.ACTIVE, until=until, start=start, parents=plans
+        )
+
+# Made with Bob
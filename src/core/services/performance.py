@@ -0,0 +1,115 @@
+import pandas as pd
+
+# Annual rates searched for XIRR: -99% to +10000%
+XIRR_BRACKET: tuple[float, float] = (-0.99, 100.0)
+XIRR_TOLERANCE: float = 1e-10
+XIRR_MAX_ITERATIONS: int = 100
+DAYS_PER_YEAR: float = 365.0
+
+PERFORMANCE_COLUMNS: list[str] = [
+    "start_date", "end_date", "start_value", "current_value", "contributions", "absolute_gain", "twr", "xirr"
+]
+
+
+def compute_performance(snapshots: pd.DataFrame, contributions: pd.DataFrame) -> pd.DataFrame:
+    """Returns of every investment between its first and last snapshot, in one pass over all of them.
+
+    snapshots has investment_id, date and value columns; contributions has
+    investment_id, date and amount. The first snapshot value is the opening
+    investment, so contributions on or before its date are already in it and
+    contributions after the last snapshot are ignored. The result is indexed
+    by investment_id with PERFORMANCE_COLUMNS; absolute_gain, twr and xirr are
+    NaN for investments with fewer than two snapshot dates.
+    """
+    snapshots = (snapshots.sort_values(["investment_id", "date"], kind="stable")
+                 .drop_duplicates(["investment_id", "date"], keep="last")
+                 .reset_index(drop=True))
+    if snapshots.empty:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS, index=pd.Index([], name="investment_id"))
+    # Categorical ids let every groupby and merge below reuse one set of integer codes
+    ids: pd.CategoricalDtype = pd.CategoricalDtype(snapshots["investment_id"].unique())
+    snapshots = snapshots.astype({"investment_id": ids})
+    contributions = contributions[contributions["investment_id"].isin(ids.categories)].astype({
+        "investment_id": ids, "date": snapshots["date"].dtype
+    })
+    result: pd.DataFrame = snapshots.groupby("investment_id", sort=True, observed=True).agg(
+        start_date=("date", "first"), end_date=("date", "last"),
+        start_value=("value", "first"), current_value=("value", "last"), snapshots=("value", "size"))
+
+    flows: pd.DataFrame = _period_flows(snapshots=snapshots, contributions=contributions, starts=result["start_date"])
+    period_flows: pd.DataFrame = (
+        flows.groupby(["investment_id", "period_end"], as_index=False, observed=True)["amount"].sum()
+        .rename(columns={"period_end": "date", "amount": "flow"})
+    )
+    snapshots = snapshots.merge(period_flows, on=["investment_id", "date"], how="left")
+    snapshots["flow"] = snapshots["flow"].fillna(0.0)
+    groups = snapshots.groupby("investment_id", sort=True, observed=True)
+
+    # Chain-link the return of each period between snapshots, with its contributions made at the period start
+    previous: pd.Series = groups["value"].shift(1)
+    invested: pd.Series = previous + snapshots["flow"]
+    growth: pd.Series = (snapshots["value"] / invested).where(invested > 0, 1.0)
+    result["twr"] = growth.groupby(snapshots["investment_id"], observed=True).prod() - 1.0
+
+    result["contributions"] = groups["flow"].sum()
+    result["absolute_gain"] = result["current_value"] - result["start_value"] - result["contributions"]
+    result["xirr"] = batch_xirr(flows=_cash_flows(result=result, flows=flows))
+
+    measurable: pd.Series = result["snapshots"] > 1
+    result.loc[~measurable, ["absolute_gain", "twr", "xirr"]] = float("nan")
+    result.index = result.index.astype(str)
+    return result[PERFORMANCE_COLUMNS]
+
+
+def _period_flows(snapshots: pd.DataFrame, contributions: pd.DataFrame, starts: pd.Series) -> pd.DataFrame:
+    """Contributions tagged with the date of the snapshot closing their period (period_end)"""
+    ends: pd.DataFrame = (snapshots[["investment_id", "date"]].rename(columns={"date": "period_end"})
+                          .sort_values("period_end", kind="stable"))
+    flows: pd.DataFrame = pd.merge_asof(contributions.sort_values("date", kind="stable"), ends,
+                                        left_on="date", right_on="period_end", by="investment_id",
+                                        direction="forward")
+    start: pd.Series = flows["investment_id"].map(starts)
+    return flows[flows["period_end"].notna() & (flows["period_end"] > start)]
+
+
+def _cash_flows(result: pd.DataFrame, flows: pd.DataFrame) -> pd.DataFrame:
+    """Investor cash flows: opening value and contributions paid in, current value paid out"""
+    opening = pd.DataFrame({"investment_id": result.index, "date": result["start_date"].to_numpy(),
+                            "amount": -result["start_value"].to_numpy()})
+    paid = pd.DataFrame({"investment_id": flows["investment_id"].to_numpy(), "date": flows["date"].to_numpy(),
+                         "amount": -flows["amount"].to_numpy()})
+    closing = pd.DataFrame({"investment_id": result.index, "date": result["end_date"].to_numpy(),
+                            "amount": result["current_value"].to_numpy()})
+    cash_flows: pd.DataFrame = pd.concat([opening, paid, closing], ignore_index=True)
+    start: pd.Series = cash_flows["investment_id"].map(result["start_date"])
+    cash_flows["years"] = (cash_flows["date"] - start).dt.days / DAYS_PER_YEAR
+    return cash_flows
+
+
+def batch_xirr(flows: pd.DataFrame) -> pd.Series:
+    """Annual rate making the net present value of each investment's flows zero.
+    
+    flows has investment_id, years (since the first flow) and signed amount
+    columns. The flows are laid out as one row per investment so every
+    bisection step evaluates all investments at once. Rates outside
+    XIRR_BRACKET, or flows whose value never changes sign in it, give NaN.
+    """
+    flows = flows.assign(position=flows.groupby("investment_id", sort=False, observed=True).cumcount())
+    amounts: pd.DataFrame = flows.pivot(index="investment_id", columns="position", values="amount").fillna(0.0)
+    years: pd.DataFrame = flows.pivot(index="investment_id", columns="position", values="years").fillna(0.0)
+    
+    def npv(rate: pd.Series) -> pd.Series:
+        return (amounts / years.rpow(1.0 + rate, axis=0)).sum(axis=1)
+    
+    low: pd.Series = pd.Series(XIRR_BRACKET[0], index=amounts.index)
+    high: pd.Series = pd.Series(XIRR_BRACKET[1], index=amounts.index)
+    low_sign: pd.Series = npv(low) > 0
+    bracketed: pd.Series = low_sign != (npv(high) > 0)
+    for _ in range(XIRR_MAX_ITERATIONS):
+        middle: pd.Series = (low + high) / 2
+        same_side: pd.Series = (npv(middle) > 0) == low_sign
+        low = low.where(~same_side, middle)
+        high = high.where(same_side, middle)
+        if ((high - low) < XIRR_TOLERANCE).all():
+            break
+    return ((low + high) / 2).where(bracketed)
@@ -0,0 +1,50 @@
+from datetime import date
+from typing import Any, Optional
+import pandas as pd
+from core.domain import InvestmentPerformance
+from core.repositories import InvestmentRepository, InvestmentValueSnapshotRepository, InvestmentPlanInstanceRepository
+from core.storage.init_db import transaction
+from .performance import compute_performance
+
+METRIC_COLUMNS: tuple[str, ...] = ("start_value", "current_value", "contributions", "absolute_gain", "twr", "xirr")
+
+
+class InvestmentPerformanceService:
+    def __init__(self) -> None:
+        self.investment_repo = InvestmentRepository()
+        self.snapshot_repo = InvestmentValueSnapshotRepository()
+        self.plan_instance_repo = InvestmentPlanInstanceRepository()
+    
+    def performance(self, as_of: Optional[date] = None) -> list[InvestmentPerformance]:
+        """Gain, time-weighted return and XIRR of every investment from snapshots and executed plan instances up to as_of.
+        
+        Both inputs are read in one transaction, so they come from the same
+        state of the database, and evaluated together by compute_performance.
+        """
+        with transaction():
+            snapshot_rows: list[tuple[str, str, float]] = self.snapshot_repo.value_series(as_of=as_of)
+            contribution_rows: list[tuple[str, str, float]] = self.plan_instance_repo.executed_contributions(as_of=as_of)
+        snapshots: pd.DataFrame = self._frame(rows=snapshot_rows, value_column="value")
+        contributions: pd.DataFrame = self._frame(rows=contribution_rows, value_column="amount")
+        metrics: pd.DataFrame = compute_performance(snapshots=snapshots, contributions=contributions)
+        
+        rows: dict[str, dict[str, Any]] = metrics.to_dict(orient="index")
+        performances: list[InvestmentPerformance] = []
+        for investment in self.investment_repo.get_all():
+            values: dict[str, Any] = {}
+            if investment.uid in rows:
+                row: dict[str, Any] = rows[investment.uid]
+                values = {column: None if pd.isna(row[column]) else float(row[column]) for column in METRIC_COLUMNS}
+                values.update(start_date=row["start_date"].date(), end_date=row["end_date"].date())
+            performances.append(InvestmentPerformance(
+                investment_id=investment.uid, investment_name=investment.name, **values
+            ))
+        return performances
+    
+    @staticmethod
+    def _frame(rows: list[tuple[str, str, float]], value_column: str) -> pd.DataFrame:
+        frame: pd.DataFrame = pd.DataFrame(rows, columns=["investment_id", "date", value_column])
+        frame["investment_id"] = frame["investment_id"].astype(str)
+        frame["date"] = pd.to_datetime(frame["date"], format="%Y-%m-%d")
+        frame[value_column] = frame[value_column].astype(float)
+        return frame
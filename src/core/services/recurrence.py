@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from typing import Optional, Protocol, TypeVar
+from core.domain.base import Frequency
+from core.repositories import BaseRepository, ScheduledInstanceRepository
+from core.storage.init_db import transaction
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Recurrence fields shared by subscriptions and investment plans"""
+    uid: str
+    frequency: Frequency
+    interval: int
+    due_day: int
+    due_month: Optional[int]
+
+
+class ScheduledParent(Protocol):
+    """Fields of a subscription or investment plan that generating its instances reads"""
+    uid: str
+    amount: float
+    frequency: Frequency
+    interval: int
+    due_day: int
+    due_month: Optional[int]
+    status: Enum
+
+
+P = TypeVar(name='P', bound=ScheduledParent)
+I = TypeVar(name='I')
+
+
+EPOCH: date = date(1970, 1, 1)
+EPOCH_ORDINAL: int = EPOCH.toordinal()
+
+
+@dataclass
+class GenerationResult:
+    """Outcome of materializing instances: rows inserted, dates already covered, schedules expanded"""
+    created: int = 0
+    skipped: int = 0
+    schedules: int = 0
+
+
+def month_index(value: date) -> int:
+    """Months since year 0, so month arithmetic is integer arithmetic"""
+    return value.year * 12 + value.month - 1
+
+
+def _first_days(indexes: np.ndarray) -> np.ndarray:
+    """Days since 1970-01-01 of the first of each month index (proleptic Gregorian)"""
+    months: np.ndarray = indexes % 12 + 1
+    years: np.ndarray = indexes // 12 - (months <= 2)
+    eras: np.ndarray = years // 400
+    year_of_era: np.ndarray = years - eras * 400
+    day_of_year: np.ndarray = (153 * ((months + 9) % 12) + 2) // 5
+    return eras * 146097 + year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year - 719468
+
+
+def _due_days_in(indexes: np.ndarray, due_days: np.ndarray) -> np.ndarray:
+    """Day numbers of the due dates in the months at indexes, clamping due days 29-31 to each month's last day"""
+    firsts: np.ndarray = _first_days(indexes)
+    return firsts + np.minimum(due_days, _first_days(indexes + 1) - firsts) - 1
+
+
+def due_dates(schedules: list[Schedule], start: date, until: date,
+              anchors: Optional[dict[str, date]] = None) -> pd.DataFrame:
+    """Due dates of every schedule within [start, until], computed for all at once.
+
+    Each series runs every interval months (years for yearly schedules)
+    through the month of its anchor (an existing instance), so repeated
+    expansions stay aligned; without an anchor it begins at the first due
+    date on or after start. Yearly schedules fall in due_month, whatever
+    month the anchor is in. Rows hold uid, month (month_index) and
+    due_date, in the order of schedules, then date.
+
+    The arithmetic runs on NumPy arrays rather than Series, whose
+    per-operation overhead would dominate for the usual few schedules.
+    """
+    anchors = anchors or {}
+    yearly: np.ndarray = np.array([schedule.frequency is Frequency.YEARLY for schedule in schedules], dtype=bool)
+    due_day: np.ndarray = np.array([schedule.due_day for schedule in schedules], dtype=np.int64)
+    due_month: np.ndarray = np.array([schedule.due_month or 0 for schedule in schedules], dtype=np.int64)
+    anchored: np.ndarray = np.array([schedule.uid in anchors for schedule in schedules], dtype=bool)
+    start_index, until_index = month_index(start), month_index(until)
+    start_day, until_day = (start - EPOCH).days, (until - EPOCH).days
+    period: np.ndarray = np.where(yearly, 12, 1)
+    step: np.ndarray = np.array([schedule.interval for schedule in schedules], dtype=np.int64) * period
+    in_due_month: np.ndarray = yearly & (due_month > 0)
+
+    # Without an anchor: the first due date on or after start
+    first: np.ndarray = np.where(in_due_month, start.year * 12 + due_month - 1, start_index)
+    first = np.where(first < start_index, first + 12, first)
+    first = np.where(_due_days_in(first, due_day) < start_day, first + period, first)
+    # With one: the anchor's month, moved to due_month for yearly schedules
+    anchor: np.ndarray = np.array([month_index(anchors.get(schedule.uid, start)) for schedule in schedules], dtype=np.int64)
+    anchor = np.where(in_due_month, anchor // 12 * 12 + due_month - 1, anchor)
+    anchor = np.where(anchored, anchor, first)
+
+    # First series month not before start's month, then every step months up to until
+    first_index: np.ndarray = start_index + (anchor - start_index) % step
+    counts: np.ndarray = np.maximum((until_index - first_index) // step + 1, 0)
+    ordinals: np.ndarray = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    indexes: np.ndarray = np.repeat(first_index, counts) + ordinals * np.repeat(step, counts)
+    days: np.ndarray = _due_days_in(indexes, np.repeat(due_day, counts))
+    within: np.ndarray = (days >= start_day) & (days <= until_day)
+    uids: list[str] = [schedule.uid for schedule in schedules]
+    return pd.DataFrame({
+        "uid": np.repeat(np.array(uids, dtype=object), counts)[within].tolist(),
+        "month": indexes[within].tolist(),
+        "due_date": [date.fromordinal(day + EPOCH_ORDINAL) for day in days[within].tolist()],
+    }, columns=["uid", "month", "due_date"])
+
+
+def expand_due_dates(schedule: Schedule, start: date, until: date, anchor: Optional[date] = None) -> list[date]:
+    """Due dates of one schedule within [start, until] (see due_dates)"""
+    anchors: dict[str, date] = {schedule.uid: anchor} if anchor is not None else {}
+    return due_dates([schedule], start=start, until=until, anchors=anchors)["due_date"].tolist()
+
+
+def missing_due_dates(schedules: list[Schedule], start: date, until: date, anchors: dict[str, date],
+                      existing: set[tuple[str, str]]) -> tuple[list[tuple[str, date]], int]:
+    """(schedule uid, due date) pairs in [start, until] whose month has no instance yet, and how many were skipped.
+
+    existing holds (schedule uid, 'YYYY-MM') pairs; anchors the earliest instance per schedule.
+    """
+    dates: pd.DataFrame = due_dates(schedules, start=start, until=until, anchors=anchors)
+    months: set[tuple[str, int]] = {(uid, int(month[:4]) * 12 + int(month[5:7]) - 1) for uid, month in existing}
+    missing: list[tuple[str, date]] = [
+        (uid, due_date)
+        for uid, month, due_date in zip(dates["uid"].tolist(), dates["month"].tolist(), dates["due_date"].tolist())
+        if (uid, month) not in months
+    ]
+    return missing, len(dates) - len(missing)
+
+
+def generate_instances(parent_repo: BaseRepository[P], instance_repo: ScheduledInstanceRepository[I],
+                       make_instance: Callable[[P, date], I], active_status: Enum, until: date,
+                       start: Optional[date] = None, parents: Optional[list[P]] = None) -> GenerationResult:
+    """Create the missing instances of active parents (all, by default) from start (default today) to until.
+
+    Idempotent: a parent gets at most one instance per due month, and months
+    that already have one are skipped, so reruns insert nothing new.
+    make_instance builds the instance of a parent due on a date. All reads
+    and inserts run in one transaction.
+    """
+    start = start or date.today()
+    result: GenerationResult = GenerationResult()
+    with transaction():
+        if parents is None:
+            parents = parent_repo.get_all()
+        active: list[P] = [parent for parent in parents if parent.status is active_status]
+        if not active:
+            return result
+
+        anchors: dict[str, date] = instance_repo.first_due_dates(
+            parent_ids=[parent.uid for parent in active] if len(active) == 1 else None
+        )
+        existing: set[tuple[str, str]] = instance_repo.existing_periods(date_from=start, date_to=until)
+        schedules: list[Schedule] = [
+            Schedule(uid=parent.uid, frequency=parent.frequency, interval=parent.interval,
+                     due_day=parent.due_day, due_month=parent.due_month)
+            for parent in active
+        ]
+        missing, result.skipped = missing_due_dates(schedules, start=start, until=until,
+                                                    anchors=anchors, existing=existing)
+        by_uid: dict[str, P] = {parent.uid: parent for parent in active}
+        instances: list[I] = [make_instance(by_uid[uid], due_date) for uid, due_date in missing]
+        result.schedules = len(active)
+        result.created = len(instance_repo.create_many(entities=instances).created)
+    return result
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Optional
+from core.domain.base import SubscriptionInstanceStatus, InvestmentPlanInstanceStatus
+from core.repositories import (
+    SubscriptionInstanceRepository, InvestmentPlanInstanceRepository, acquire_lease, release_lease
+)
+from core.storage.init_db import transaction
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+SWEEP_LEASE: str = "status_sweep"
+
+
+class StatusSweepService:
+    def __init__(self) -> None:
+        self.subscription_instance_repo = SubscriptionInstanceRepository()
+        self.plan_instance_repo = InvestmentPlanInstanceRepository()
+
+    def sweep(self, as_of: Optional[date] = None) -> dict[str, int]:
+        """Mark DUE subscription instances and PLANNED plan instances due before as_of (default today)
+        as OVERDUE and SKIPPED, each with a single UPDATE, in one transaction"""
+        as_of = as_of or date.today()
+        with transaction():
+            overdue: int = self.subscription_instance_repo.transition_past_due(
+                from_status=SubscriptionInstanceStatus.DUE.value,
+                to_status=SubscriptionInstanceStatus.OVERDUE.value,
+                before=as_of
+            )
+            skipped: int = self.plan_instance_repo.transition_past_due(
+                from_status=InvestmentPlanInstanceStatus.PLANNED.value,
+                to_status=InvestmentPlanInstanceStatus.SKIPPED.value,
+                before=as_of
+            )
+        return {"subscription_instances_overdue": overdue, "plan_instances_skipped": skipped}
+
+
+class SweepScheduler:
+    """Run StatusSweepService.sweep every interval seconds on the event loop.
+
+    With several workers only the holder of the SWEEP_LEASE row sweeps; it
+    renews the lease each run and others take over once it expires. The
+    blocking database work runs in a thread.
+    """
+
+    def __init__(self, interval: float, lease_ttl: Optional[float] = None) -> None:
+        self.interval: float = interval
+        self.lease_ttl: float = lease_ttl if lease_ttl is not None else interval * 2
+        self.owner: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.service: StatusSweepService = StatusSweepService()
+        self.runs: int = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_rows: dict[str, int] = {}
+        self.last_error: Optional[str] = None
+        self.lease_held: bool = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    def from_env(cls) -> "SweepScheduler":
+        """Interval from MONEY_MANAGER_SWEEP_INTERVAL seconds (default 900, 0 disables)"""
+        return cls(interval=float(os.getenv(key='MONEY_MANAGER_SWEEP_INTERVAL', default='900')))
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="status-sweep")
+
+    async def stop(self) -> None:
+        """Cancel the loop and hand the lease to the next worker right away"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.lease_held:
+            await asyncio.to_thread(release_lease, SWEEP_LEASE, self.owner)
+            self.lease_held = False
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> bool:
+        """Sweep if this process holds the lease; return whether it swept"""
+        try:
+            self.lease_held = await asyncio.to_thread(acquire_lease, SWEEP_LEASE, self.owner, self.lease_ttl)
+            if not self.lease_held:
+                return False
+            started: float = time.perf_counter()
+            self.last_rows = await asyncio.to_thread(self.service.sweep)
+            self.last_duration_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.last_run_at = datetime.now(tz=timezone.utc)
+            self.last_error = None
+            self.runs += 1
+            return True
+        except Exception as e:
+            self.last_error = str(e)
+            logger.exception("Status sweep failed")
+            return False
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval,
+            "owner": self.owner,
+            "lease_held": self.lease_held,
+            "runs": self.runs,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_ms": self.last_duration_ms,
+            "last_rows": self.last_rows,
+            "last_error": self.last_error,
+        }
@@ -1,15 +1,31 @@
 import pandas as pd
 import io
+from datetime import date
 from typing import Any, Optional
-from core.domain import Subscription
-from core.domain.base import Frequency, SubscriptionStatus
-from core.repositories import SubscriptionRepository
+from core.domain import Subscription, SubscriptionInstance
+from core.domain.base import Frequency, SubscriptionStatus, SubscriptionInstanceStatus
+from core.repositories import SubscriptionRepository, SubscriptionInstanceRepository, BulkCreateResult
 from core.utils import generate_uid
+from .recurrence import GenerationResult, generate_instances
 
 
 class SubscriptionService:
     def __init__(self) -> None:
         self.subscription_repo = SubscriptionRepository()
+        self.instance_repo = SubscriptionInstanceRepository()
+    
+    def generate_instances(self, until: date, start: Optional[date] = None,
+                           subscriptions: Optional[list[Subscription]] = None) -> GenerationResult:
+        """Create the missing DUE instances of active subscriptions from start (default today) to until,
+        one per subscription and due month (see recurrence.generate_instances)"""
+        return generate_instances(
+            parent_repo=self.subscription_repo, instance_repo=self.instance_repo,
+            make_instance=lambda sub, due_date: SubscriptionInstance(
+                uid=generate_uid(), subscription_id=sub.uid, amount=sub.amount, due_date=due_date,
+                transaction_id=None, status=SubscriptionInstanceStatus.DUE
+            ),
+            active_status=SubscriptionStatus.ACTIVE, until=until, start=start, parents=subscriptions
+        )
     
     def export_to_csv(self) -> str:
         """Export all subscriptions to CSV format"""
@@ -28,34 +44,29 @@ class SubscriptionService:
         return df.to_csv(index=False)
     
     def import_from_csv(self, csv_content: str) -> dict[str, Any]:
-        """Import subscriptions from CSV content"""
+        """Import subscriptions from CSV content in a single bulk insert"""
         valid_rows, errors = self._validate_csv(csv_content)
         
-        created_count = 0
-        failed_count: int = len(errors)
-        
-        for row_data in valid_rows:
-            try:
-                uid: str = generate_uid()
-                subscription: Subscription = Subscription(
-                    uid=uid,
-                    name=row_data['name'],
-                    amount=row_data['amount'],
-                    frequency=Frequency(row_data['frequency']),
-                    interval=row_data['interval'],
-                    due_day=row_data['due_day'],
-                    due_month=row_data['due_month'],
-                    status=SubscriptionStatus(row_data['status'])
-                )
-                self.subscription_repo.create(entity=subscription)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Failed to create subscription '{row_data['name']}': {str(e)}")
-                failed_count += 1
+        subscriptions: list[Subscription] = [
+            Subscription(
+                uid=generate_uid(),
+                name=row_data['name'],
+                amount=row_data['amount'],
+                frequency=Frequency(row_data['frequency']),
+                interval=row_data['interval'],
+                due_day=row_data['due_day'],
+                due_month=row_data['due_month'],
+                status=SubscriptionStatus(row_data['status'])
+            )
+            for row_data in valid_rows
+        ]
+        result: BulkCreateResult = self.subscription_repo.create_many(entities=subscriptions)
+        for index, message in result.failed:
+            errors.append(f"Failed to create subscription '{valid_rows[index]['name']}': {message}")
         
         return {
-            "created": created_count,
-            "failed": failed_count,
+            "created": len(result.created),
+            "failed": len(errors),
             "errors": errors
         }
     
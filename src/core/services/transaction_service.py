@@ -1,9 +1,10 @@
 import pandas as pd
+import csv
 import io
-from datetime import date
-from typing import Any, Optional
-from core.domain import Transaction, Account, Category
-from core.repositories import TransactionRepository, AccountRepository, CategoryRepository
+from collections.abc import Iterator
+from typing import Any
+from core.domain import Transaction
+from core.repositories import TransactionRepository, AccountRepository, CategoryRepository, BulkCreateResult
 from core.utils import generate_uid
 
 
@@ -15,121 +16,129 @@ class TransactionService:
     
     def export_to_csv(self) -> str:
         """Export all transactions to CSV format"""
-        transactions: list[Transaction] = self.transaction_repo.get_all()
-        
-        # Get account and category names
-        accounts = {acc.uid: acc.name for acc in self.account_repo.get_all()}
-        categories = {cat.uid: cat.name for cat in self.category_repo.get_all()}
-        
-        data: list[dict[str, Any]] = [{
-            'name': txn.name,
-            'amount': txn.amount,
-            'date': txn.date.isoformat() if isinstance(txn.date, date) else str(txn.date),
-            'account': accounts.get(txn.account_id, ''),
-            'category': categories.get(txn.category_id, '')
-        } for txn in transactions]
+        return ''.join(self.stream_csv())
+    
+    def stream_csv(self, batch_size: int = 1000) -> Iterator[str]:
+        """Stream all transactions as CSV chunks without materializing the ledger"""
+        buffer: io.StringIO = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['name', 'amount', 'date', 'account', 'category'])
+        yield self._drain(buffer)
         
-        df: pd.DataFrame = pd.DataFrame(data)
-        return df.to_csv(index=False)
+        for rows in self.transaction_repo.iter_export_rows(batch_size=batch_size):
+            writer.writerows(rows)
+            yield self._drain(buffer)
+    
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk: str = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
     
     def import_from_csv(self, csv_content: str) -> dict[str, Any]:
-        """Import transactions from CSV content"""
+        """Import transactions from CSV content in a single bulk insert"""
         valid_rows, errors = self._validate_csv(csv_content)
         
-        created_count = 0
-        failed_count: int = len(errors)
-        
-        for row_data in valid_rows:
-            try:
-                uid: str = generate_uid()
-                transaction: Transaction = Transaction(
-                    uid=uid,
-                    name=row_data['name'],
-                    amount=row_data['amount'],
-                    date=row_data['date'],
-                    account_id=row_data['account_id'],
-                    category_id=row_data['category_id']
-                )
-                self.transaction_repo.create(entity=transaction)
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Failed to create transaction '{row_data['name']}': {str(e)}")
-                failed_count += 1
+        transactions: list[Transaction] = [
+            Transaction(
+                uid=generate_uid(),
+                name=row_data['name'],
+                amount=row_data['amount'],
+                date=row_data['date'],
+                account_id=row_data['account_id'],
+                category_id=row_data['category_id']
+            )
+            for row_data in valid_rows
+        ]
+        result: BulkCreateResult = self.transaction_repo.create_many(entities=transactions)
+        for index, message in result.failed:
+            errors.append(f"Failed to create transaction '{valid_rows[index]['name']}': {message}")
         
         return {
-            "created": created_count,
-            "failed": failed_count,
+            "created": len(result.created),
+            "failed": len(errors),
             "errors": errors
         }
     
     def _validate_csv(self, csv_content: str) -> tuple[list[dict[str, Any]], list[str]]:
-        """Validate CSV content and return valid rows with errors"""
-        errors: list[str] = []
-        valid_rows: list[dict[str, Any]] = []
-
+        """Validate CSV content column-wise and return valid rows with per-row errors"""
         try:
-            df: pd.DataFrame = pd.read_csv(io.StringIO(csv_content))
+            df: pd.DataFrame = pd.read_csv(io.StringIO(csv_content), dtype=str, keep_default_na=False)
         except Exception as e:
             return [], [f"CSV parsing error: {str(e)}"]
 
         required_cols: list[str] = ['name', 'amount', 'date', 'account', 'category']
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
-            errors.append(f"Missing required columns: {', '.join(missing_cols)}")
-            return [], errors
+            return [], [f"Missing required columns: {', '.join(missing_cols)}"]
 
         # Build lookup maps
         accounts = {acc.name: acc.uid for acc in self.account_repo.get_all()}
         categories = {cat.name: cat.uid for cat in self.category_repo.get_all()}
 
-        for idx, row in df.iterrows():
-            row_num: int = int(idx) + 2
+        names: pd.Series = df['name'].fillna('').str.strip()
+        amounts: pd.Series = pd.to_numeric(df['amount'].fillna('').str.strip(), errors='coerce')
+        dates: pd.Series = self._parse_dates(values=df['date'].fillna('').str.strip())
+        account_names: pd.Series = df['account'].fillna('').str.strip()
+        category_names: pd.Series = df['category'].fillna('').str.strip()
+        account_ids: pd.Series = account_names.map(accounts)
+        category_ids: pd.Series = category_names.map(categories)
 
-            # Validate name
-            name = str(row.get('name', '')).strip()
-            if not name:
-                errors.append(f"Row {row_num}: Name is required")
-                continue
+        # First failing check wins, in the same order as the row-wise rules
+        prefix: pd.Series = "Row " + pd.Series(range(2, len(df) + 2), index=df.index).astype(str) + ": "
+        checks: list[tuple[pd.Series, pd.Series]] = [
+            (names == '', prefix + "Name is required"),
+            (amounts.isna(), prefix + "Invalid amount"),
+            (amounts <= 0, prefix + "Amount must be positive"),
+            (dates.isna(), prefix + "Invalid date format (use YYYY-MM-DD)"),
+            (account_ids.isna(), prefix + "Account '" + account_names + "' not found"),
+            (category_ids.isna(), prefix + "Category '" + category_names + "' not found"),
+        ]
+        messages: pd.Series = pd.Series('', index=df.index)
+        for failed, message in reversed(checks):
+            messages = messages.mask(failed, message)
+        is_valid: pd.Series = messages == ''
+        errors: list[str] = messages[~is_valid].tolist()
 
-            # Validate amount
-            try:
-                amount = float(row.get('amount', 0))
-                if amount <= 0:
-                    errors.append(f"Row {row_num}: Amount must be positive")
-                    continue
-            except (TypeError, ValueError):
-                errors.append(f"Row {row_num}: Invalid amount")
-                continue
+        valid: pd.DataFrame = pd.DataFrame({
+            'name': names[is_valid],
+            'amount': amounts[is_valid].astype(float),
+            'date': dates[is_valid].dt.date,
+            'account_id': account_ids[is_valid],
+            'category_id': category_ids[is_valid],
+        })
+        valid_rows: list[dict[str, Any]] = valid.to_dict(orient='records')
 
-            # Validate date
-            try:
-                date_val = pd.to_datetime(row.get('date')).date()
-            except Exception:
-                errors.append(f"Row {row_num}: Invalid date format (use YYYY-MM-DD)")
-                continue
+        return valid_rows, errors
 
-            # Validate account
-            account_name = str(row.get('account', '')).strip()
-            account_id = accounts.get(account_name)
-            if not account_id:
-                errors.append(f"Row {row_num}: Account '{account_name}' not found")
-                continue
+    @staticmethod
+    def _parse_dates(values: pd.Series) -> pd.Series:
+        """Parse ISO dates in one pass, falling back to per-value inference only for the rest"""
+        parsed: pd.Series = TransactionService._to_wall_clock(values=values, format='ISO8601')
+        retry = parsed.isna() & (values != '')
+        if retry.any():
+            parsed[retry] = TransactionService._to_wall_clock(values=values[retry], format='mixed')
+        return parsed
 
-            # Validate category
-            category_name = str(row.get('category', '')).strip()
-            category_id = categories.get(category_name)
-            if not category_id:
-                errors.append(f"Row {row_num}: Category '{category_name}' not found")
-                continue
+    @staticmethod
+    def _to_wall_clock(values: pd.Series, format: str) -> pd.Series:
+        """Naive datetimes of values, keeping the local date and time of values with a UTC offset.
 
-            valid_rows.append({
-                'name': name,
-                'amount': amount,
-                'date': date_val,
-                'account_id': account_id,
-                'category_id': category_id,
-            })
+        pandas refuses to parse a column mixing offsets (or offsets and naive
+        values) into one dtype, so such a column is parsed value by value.
+        """
+        try:
+            parsed: pd.Series = pd.to_datetime(values, errors='coerce', format=format)
+        except ValueError:
+            parsed = pd.to_datetime(values.map(TransactionService._parse_date))
+        if parsed.dt.tz is not None:
+            parsed = parsed.dt.tz_localize(None)
+        return parsed
 
-        return valid_rows, errors
+    @staticmethod
+    def _parse_date(value: str) -> pd.Timestamp:
+        parsed: pd.Timestamp = pd.to_datetime(value, errors='coerce')
+        return parsed.tz_localize(None) if parsed is not pd.NaT and parsed.tz is not None else parsed
 
 # Made with Bob
@@ -1,9 +1,36 @@
-from .init_db import init_database, get_connection, get_db_path
+from .init_db import (
+    init_database,
+    get_connection,
+    get_db_path,
+    get_pool,
+    close_pool,
+    transaction,
+    savepoint,
+    commit,
+    in_transaction,
+    after_transaction,
+)
+from .pool import ConnectionPool
+from .config import StorageProfile, get_storage_profile
+from .migrate import run_migrations, get_schema_version, backfill_in_batches
 
 __all__ = [
     "init_database",
     "get_connection",
     "get_db_path",
+    "get_pool",
+    "close_pool",
+    "transaction",
+    "savepoint",
+    "commit",
+    "in_transaction",
+    "after_transaction",
+    "ConnectionPool",
+    "StorageProfile",
+    "get_storage_profile",
+    "run_migrations",
+    "get_schema_version",
+    "backfill_in_batches",
 ]
 
 # Made with Bob
@@ -0,0 +1,97 @@
+import os
+import sqlite3
+from dataclasses import dataclass, replace
+from typing import Optional
+
+JOURNAL_MODES: tuple[str, ...] = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES: tuple[str, ...] = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORES: tuple[str, ...] = ("DEFAULT", "FILE", "MEMORY")
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """SQLite PRAGMA settings applied to every new connection"""
+    journal_mode: str
+    synchronous: str
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+    busy_timeout: int
+
+    def __post_init__(self) -> None:
+        if self.journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Invalid journal_mode: {self.journal_mode}")
+        if self.synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous: {self.synchronous}")
+        if self.temp_store not in TEMP_STORES:
+            raise ValueError(f"Invalid temp_store: {self.temp_store}")
+        if self.mmap_size < 0:
+            raise ValueError("mmap_size must not be negative")
+        if self.busy_timeout < 0:
+            raise ValueError("busy_timeout must not be negative")
+
+    def apply(self, connection: sqlite3.Connection) -> None:
+        """Apply the profile to a freshly opened connection"""
+        connection.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        connection.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+        connection.execute(f"PRAGMA cache_size = {self.cache_size}")
+        connection.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        connection.execute(f"PRAGMA temp_store = {self.temp_store}")
+        connection.execute("PRAGMA foreign_keys = ON")
+
+
+PROFILES: dict[str, StorageProfile] = {
+    "performance": StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64000,
+        mmap_size=268435456,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+    "durable": StorageProfile(
+        journal_mode="WAL",
+        synchronous="FULL",
+        cache_size=-16000,
+        mmap_size=0,
+        temp_store="DEFAULT",
+        busy_timeout=5000,
+    ),
+    "legacy": StorageProfile(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        cache_size=-2000,
+        mmap_size=0,
+        temp_store="DEFAULT",
+        busy_timeout=5000,
+    ),
+}
+
+
+def _env_int(key: str) -> Optional[int]:
+    value: Optional[str] = os.getenv(key=key)
+    return int(value) if value else None
+
+
+def _env_upper(key: str) -> Optional[str]:
+    value: Optional[str] = os.getenv(key=key)
+    return value.strip().upper() if value else None
+
+
+def get_storage_profile() -> StorageProfile:
+    """Build the storage profile from MONEY_MANAGER_DB_PROFILE and per-PRAGMA overrides"""
+    name: str = os.getenv(key='MONEY_MANAGER_DB_PROFILE', default='performance').strip().lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown storage profile: {name}. Expected one of: {', '.join(PROFILES)}")
+
+    overrides: dict[str, object] = {
+        "journal_mode": _env_upper(key='MONEY_MANAGER_DB_JOURNAL_MODE'),
+        "synchronous": _env_upper(key='MONEY_MANAGER_DB_SYNCHRONOUS'),
+        "cache_size": _env_int(key='MONEY_MANAGER_DB_CACHE_SIZE'),
+        "mmap_size": _env_int(key='MONEY_MANAGER_DB_MMAP_SIZE'),
+        "temp_store": _env_upper(key='MONEY_MANAGER_DB_TEMP_STORE'),
+        "busy_timeout": _env_int(key='MONEY_MANAGER_DB_BUSY_TIMEOUT'),
+    }
+    changes: dict[str, object] = {key: value for key, value in overrides.items() if value is not None}
+    return replace(PROFILES[name], **changes)
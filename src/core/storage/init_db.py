@@ -1,11 +1,23 @@
 import os
 import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
+from .config import get_storage_profile
+from .pool import ConnectionPool
 
 load_dotenv()
 
+_pool: Optional[ConnectionPool] = None
+_pool_key: Optional[str] = None
+_pool_lock: threading.Lock = threading.Lock()
+_active_connection: ContextVar[Optional[sqlite3.Connection]] = ContextVar('active_connection', default=None)
+_after_callbacks: ContextVar[Optional[list[Callable[[], None]]]] = ContextVar('after_callbacks', default=None)
+
 
 def get_db_path() -> Path:
     db_path_str: Optional[str] = os.getenv(key='MONEY_MANAGER_DB')
@@ -20,19 +32,122 @@ def get_db_path() -> Path:
     return db_path
 
 
-def get_connection() -> sqlite3.Connection:
-    db_path: Path = get_db_path()
-    return sqlite3.connect(database=db_path)
+def get_pool() -> ConnectionPool:
+    """Return the connection pool for MONEY_MANAGER_DB, replacing it if the path changed"""
+    global _pool, _pool_key
+    key: Optional[str] = os.getenv(key='MONEY_MANAGER_DB')
+    pool: Optional[ConnectionPool] = _pool
+    if pool is not None and key == _pool_key:
+        return pool
+
+    with _pool_lock:
+        if _pool is not None and key == _pool_key:
+            return _pool
+        db_path: Path = get_db_path()
+        if _pool is not None:
+            _pool.close()
+        _pool = ConnectionPool(
+            database=db_path,
+            max_size=int(os.getenv(key='MONEY_MANAGER_DB_POOL_SIZE', default='10')),
+            idle_timeout=float(os.getenv(key='MONEY_MANAGER_DB_POOL_IDLE_TIMEOUT', default='300')),
+            profile=get_storage_profile(),
+        )
+        _pool_key = key
+        return _pool
+
+
+def close_pool() -> None:
+    """Close the current connection pool, if any"""
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = None
+        _pool_key = None
+
+
+@contextmanager
+def get_connection() -> Iterator[sqlite3.Connection]:
+    """Check out a pooled connection and return it to the pool on exit.
+
+    Inside transaction() the transaction's connection is reused instead.
+    """
+    active: Optional[sqlite3.Connection] = _active_connection.get()
+    if active is not None:
+        yield active
+        return
+    
+    pool: ConnectionPool = get_pool()
+    connection: sqlite3.Connection = pool.acquire()
+    try:
+        yield connection
+    finally:
+        pool.release(connection=connection)
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Run every get_connection() in this context on one connection and commit once at the end"""
+    active: Optional[sqlite3.Connection] = _active_connection.get()
+    if active is not None:
+        yield active
+        return
+    
+    callbacks: list[Callable[[], None]] = []
+    with get_connection() as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        token = _active_connection.set(connection)
+        callbacks_token = _after_callbacks.set(callbacks)
+        try:
+            yield connection
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            _after_callbacks.reset(callbacks_token)
+            _active_connection.reset(token)
+            for callback in callbacks:
+                callback()
+
+
+def in_transaction() -> bool:
+    """Whether the caller runs inside transaction()"""
+    return _active_connection.get() is not None
+
+
+def after_transaction(callback: Callable[[], None]) -> None:
+    """Run callback once the enclosing transaction() commits or rolls back, or right away outside one"""
+    callbacks: Optional[list[Callable[[], None]]] = _after_callbacks.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+@contextmanager
+def savepoint(connection: sqlite3.Connection, name: str = "item") -> Iterator[None]:
+    """Undo only the statements in this block if it raises"""
+    connection.execute(f"SAVEPOINT {name}")
+    try:
+        yield
+    except BaseException:
+        connection.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        connection.execute(f"RELEASE SAVEPOINT {name}")
+        raise
+    connection.execute(f"RELEASE SAVEPOINT {name}")
+
+
+def commit(connection: sqlite3.Connection) -> None:
+    """Commit, unless the connection belongs to an enclosing transaction()"""
+    if _active_connection.get() is not connection:
+        connection.commit()
 
 
 def init_database() -> None:
-    """Initialize all database tables for money_manager"""
-    from .transactions import init_transaction_tables
-    from .subscriptions import init_subscription_tables
-    from .investments import init_investment_tables
+    """Initialize all database tables for money_manager by applying pending migrations"""
+    from .migrate import run_migrations
     
-    init_transaction_tables()
-    init_subscription_tables()
-    init_investment_tables()
+    run_migrations()
 
 # Made with Bob
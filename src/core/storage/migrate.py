@@ -0,0 +1,131 @@
+import sqlite3
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import Any, Optional, Union
+from .init_db import get_connection
+
+
+def _ensure_version_table(connection: sqlite3.Connection) -> None:
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TEXT NOT NULL)
+    """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS schema_backfills (
+            version INTEGER PRIMARY KEY,
+            completed_at TEXT NOT NULL)
+    """)
+
+
+def _validate_order(migrations: list[ModuleType]) -> None:
+    versions: list[int] = [module.VERSION for module in migrations]
+    if versions != sorted(set(versions)):
+        raise ValueError(f"Migration versions must be unique and ascending: {versions}")
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Return the highest applied migration version, or 0 for an unversioned database"""
+    _ensure_version_table(connection=connection)
+    row: Optional[tuple[Any, ...]] = connection.execute(
+        "SELECT MAX(version) FROM schema_version"
+    ).fetchone()
+    return row[0] if row and row[0] is not None else 0
+
+
+def _is_applied(connection: sqlite3.Connection, version: int) -> bool:
+    row = connection.execute("SELECT 1 FROM schema_version WHERE version = ?", (version,)).fetchone()
+    return row is not None
+
+
+def _apply(connection: sqlite3.Connection, module: ModuleType) -> bool:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        if _is_applied(connection=connection, version=module.VERSION):
+            connection.rollback()
+            return False
+        module.upgrade(connection)
+        connection.execute(
+            "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+            (module.VERSION, module.DESCRIPTION, datetime.now(tz=timezone.utc).isoformat())
+        )
+        connection.commit()
+        return True
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _backfill(connection: sqlite3.Connection, module: ModuleType) -> None:
+    """Run module.backfill once its schema change is committed and record that it finished.
+
+    A backfill commits as it goes and must only touch rows still needing it,
+    so one interrupted part way is simply resumed by the next run.
+    """
+    if connection.execute("SELECT 1 FROM schema_backfills WHERE version = ?", (module.VERSION,)).fetchone():
+        return
+    module.backfill(connection)
+    connection.execute(
+        "INSERT INTO schema_backfills (version, completed_at) VALUES (?, ?)",
+        (module.VERSION, datetime.now(tz=timezone.utc).isoformat())
+    )
+    connection.commit()
+
+
+def run_migrations(migrations: Optional[list[ModuleType]] = None) -> list[int]:
+    """Apply pending migrations in order and return the versions that were applied.
+
+    A migration's upgrade() runs in one transaction with its schema_version
+    row. An optional backfill() runs after that commits, outside of it, and
+    is retried on later runs until it completes.
+    """
+    if migrations is None:
+        from .migrations import MIGRATIONS
+        migrations = MIGRATIONS
+    _validate_order(migrations=migrations)
+
+    applied: list[int] = []
+    with get_connection() as connection:
+        _ensure_version_table(connection=connection)
+        current: int = get_schema_version(connection=connection)
+        # Table rebuilds must not trip foreign keys; the pragma is a no-op inside a transaction
+        foreign_keys: int = connection.execute("PRAGMA foreign_keys").fetchone()[0]
+        connection.execute("PRAGMA foreign_keys = OFF")
+        try:
+            for module in migrations:
+                if module.VERSION <= current:
+                    continue
+                if _apply(connection=connection, module=module):
+                    applied.append(module.VERSION)
+            for module in migrations:
+                if hasattr(module, "backfill") and _is_applied(connection=connection, version=module.VERSION):
+                    _backfill(connection=connection, module=module)
+        finally:
+            connection.execute(f"PRAGMA foreign_keys = {'ON' if foreign_keys else 'OFF'}")
+    return applied
+
+
+def backfill_in_batches(connection: sqlite3.Connection, select_sql: str, update_sql: Union[str, list[str]],
+                        batch_size: int = 1000) -> int:
+    """Backfill rows in committed chunks so writers are never blocked for long.
+
+    select_sql must take a single LIMIT parameter and return only rows still needing the
+    backfill; each returned row is passed as the parameters of update_sql, or of each of
+    its statements in order. Each chunk is committed, so call this from a migration's
+    backfill(), never from its upgrade().
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if connection.in_transaction:
+        raise RuntimeError("backfill_in_batches commits each batch and cannot run inside a transaction")
+
+    total: int = 0
+    while True:
+        rows: list[tuple[Any, ...]] = connection.execute(select_sql, (batch_size,)).fetchall()
+        if not rows:
+            return total
+        for statement in ([update_sql] if isinstance(update_sql, str) else update_sql):
+            connection.executemany(statement, rows)
+        connection.commit()
+        total += len(rows)
@@ -0,0 +1,29 @@
+"""Ordered schema migrations; append new modules to MIGRATIONS with the next VERSION"""
+from types import ModuleType
+from . import (
+    m0001_initial_schema,
+    m0002_secondary_indexes,
+    m0003_transaction_filter_indexes,
+    m0004_instance_on_delete,
+    m0005_table_versions,
+    m0006_leases,
+    m0007_transaction_monthly_rollup,
+    m0008_account_balance_checkpoints,
+    m0009_snapshot_investment_date_uid_index,
+)
+
+MIGRATIONS: list[ModuleType] = [
+    m0001_initial_schema,
+    m0002_secondary_indexes,
+    m0003_transaction_filter_indexes,
+    m0004_instance_on_delete,
+    m0005_table_versions,
+    m0006_leases,
+    m0007_transaction_monthly_rollup,
+    m0008_account_balance_checkpoints,
+    m0009_snapshot_investment_date_uid_index,
+]
+
+__all__ = [
+    "MIGRATIONS",
+]
@@ -0,0 +1,110 @@
+import sqlite3
+
+VERSION: int = 1
+DESCRIPTION: str = "Create transaction, subscription and investment tables"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Create the base tables; IF NOT EXISTS adopts databases created before versioning"""
+    cursor: sqlite3.Cursor = connection.cursor()
+    
+    # Categories table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            uid TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE)
+    """)
+    
+    # Accounts table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS accounts (
+            uid TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE)
+    """)
+    
+    # Transactions table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS transactions (
+            uid TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            amount REAL NOT NULL,
+            date TEXT NOT NULL,
+            account_id TEXT NOT NULL,
+            category_id TEXT NOT NULL,
+            FOREIGN KEY (account_id) REFERENCES accounts(uid),
+            FOREIGN KEY (category_id) REFERENCES categories(uid))
+    """)
+    
+    
+    # Subscriptions table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS subscriptions (
+            uid TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            amount REAL NOT NULL,
+            frequency TEXT NOT NULL CHECK (frequency IN ('monthly', 'yearly')),
+            interval INTEGER NOT NULL,
+            due_day INTEGER NOT NULL,
+            due_month INTEGER,
+            status TEXT NOT NULL CHECK (status IN ('active', 'cancelled')))
+    """)
+    
+    # Subscription instances table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS subscription_instances (
+            uid TEXT PRIMARY KEY,
+            subscription_id TEXT NOT NULL,
+            amount REAL NOT NULL,
+            due_date TEXT NOT NULL,
+            transaction_id TEXT,
+            status TEXT NOT NULL CHECK (status IN ('due', 'paid', 'overdue')),
+            FOREIGN KEY (subscription_id) REFERENCES subscriptions(uid),
+            FOREIGN KEY (transaction_id) REFERENCES transactions(uid))
+    """)
+    
+    
+    # Investments table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS investments (
+            uid TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            start_date TEXT NOT NULL,
+            status TEXT NOT NULL CHECK (status IN ('active', 'closed')))
+    """)
+    
+    # Investment value snapshots table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS investment_value_snapshots (
+            uid TEXT PRIMARY KEY,
+            investment_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            current_value REAL NOT NULL,
+            FOREIGN KEY (investment_id) REFERENCES investments(uid))
+    """)
+    
+    # Investment plans table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS investment_plans (
+            uid TEXT PRIMARY KEY,
+            investment_id TEXT NOT NULL,
+            amount REAL NOT NULL,
+            frequency TEXT NOT NULL CHECK (frequency IN ('monthly', 'yearly')),
+            interval INTEGER NOT NULL,
+            due_day INTEGER NOT NULL,
+            due_month INTEGER,
+            status TEXT NOT NULL CHECK (status IN ('active', 'closed')),
+            FOREIGN KEY (investment_id) REFERENCES investments(uid))
+    """)
+    
+    # Investment plan instances table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS investment_plan_instances (
+            uid TEXT PRIMARY KEY,
+            investment_plan_id TEXT NOT NULL,
+            amount REAL NOT NULL,
+            due_date TEXT NOT NULL,
+            transaction_id TEXT,
+            status TEXT NOT NULL CHECK (status IN ('planned', 'executed', 'skipped')),
+            FOREIGN KEY (investment_plan_id) REFERENCES investment_plans(uid),
+            FOREIGN KEY (transaction_id) REFERENCES transactions(uid))
+    """)
@@ -0,0 +1,71 @@
+import sqlite3
+
+VERSION: int = 2
+DESCRIPTION: str = "Index foreign-key and date columns"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Create secondary indexes on foreign-key and date columns"""
+    cursor: sqlite3.Cursor = connection.cursor()
+    
+    # Transaction indexes
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_date
+        ON transactions (date, uid)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_account_date
+        ON transactions (account_id, date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_category_date
+        ON transactions (category_id, date)
+    """)
+    
+    # Subscription instance indexes
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_subscription_instances_subscription_due_date
+        ON subscription_instances (subscription_id, due_date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_subscription_instances_due_date
+        ON subscription_instances (due_date, uid)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_subscription_instances_status_due_date
+        ON subscription_instances (status, due_date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_subscription_instances_transaction
+        ON subscription_instances (transaction_id)
+    """)
+    
+    # Investment indexes
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_value_snapshots_investment_date
+        ON investment_value_snapshots (investment_id, date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_value_snapshots_date
+        ON investment_value_snapshots (date, uid)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_plans_investment
+        ON investment_plans (investment_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_plan_instances_plan_due_date
+        ON investment_plan_instances (investment_plan_id, due_date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_plan_instances_due_date
+        ON investment_plan_instances (due_date, uid)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_plan_instances_status_due_date
+        ON investment_plan_instances (status, due_date)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_plan_instances_transaction
+        ON investment_plan_instances (transaction_id)
+    """)
@@ -0,0 +1,20 @@
+import sqlite3
+
+VERSION: int = 3
+DESCRIPTION: str = "Extend transaction account and category indexes with uid"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Cover (account_id|category_id, date, uid) so filtered keyset pages need no sort step"""
+    cursor: sqlite3.Cursor = connection.cursor()
+    
+    cursor.execute("DROP INDEX IF EXISTS idx_transactions_account_date")
+    cursor.execute("DROP INDEX IF EXISTS idx_transactions_category_date")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_account_date_uid
+        ON transactions (account_id, date, uid)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_category_date_uid
+        ON transactions (category_id, date, uid)
+    """)
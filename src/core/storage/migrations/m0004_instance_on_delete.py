@@ -0,0 +1,57 @@
+import sqlite3
+
+VERSION: int = 4
+DESCRIPTION: str = "Unlink instances from deleted transactions with ON DELETE SET NULL"
+
+INSTANCE_COLUMNS: dict[str, str] = {
+    "subscription_instances": "uid, subscription_id, amount, due_date, transaction_id, status",
+    "investment_plan_instances": "uid, investment_plan_id, amount, due_date, transaction_id, status",
+}
+
+
+def _rebuild(connection: sqlite3.Connection, table: str, create_sql: str) -> None:
+    """Rebuild a table with a new definition, keeping its rows and indexes.
+
+    SQLite cannot alter foreign key clauses in place; run_migrations() turns
+    foreign key enforcement off while this runs.
+    """
+    indexes: list[str] = [
+        row[0] for row in connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,)
+        )
+    ]
+    columns: str = INSTANCE_COLUMNS[table]
+    connection.execute(create_sql.format(table=f"{table}_new"))
+    connection.execute(f"INSERT INTO {table}_new ({columns}) SELECT {columns} FROM {table}")
+    connection.execute(f"DROP TABLE {table}")
+    connection.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    for index_sql in indexes:
+        connection.execute(index_sql)
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Recreate instance tables so deleting a transaction clears transaction_id"""
+    _rebuild(connection, table="subscription_instances", create_sql="""
+        CREATE TABLE {table} (
+            uid TEXT PRIMARY KEY,
+            subscription_id TEXT NOT NULL,
+            amount REAL NOT NULL,
+            due_date TEXT NOT NULL,
+            transaction_id TEXT,
+            status TEXT NOT NULL CHECK (status IN ('due', 'paid', 'overdue')),
+            FOREIGN KEY (subscription_id) REFERENCES subscriptions(uid),
+            FOREIGN KEY (transaction_id) REFERENCES transactions(uid) ON DELETE SET NULL)
+    """)
+
+    _rebuild(connection, table="investment_plan_instances", create_sql="""
+        CREATE TABLE {table} (
+            uid TEXT PRIMARY KEY,
+            investment_plan_id TEXT NOT NULL,
+            amount REAL NOT NULL,
+            due_date TEXT NOT NULL,
+            transaction_id TEXT,
+            status TEXT NOT NULL CHECK (status IN ('planned', 'executed', 'skipped')),
+            FOREIGN KEY (investment_plan_id) REFERENCES investment_plans(uid),
+            FOREIGN KEY (transaction_id) REFERENCES transactions(uid) ON DELETE SET NULL)
+    """)
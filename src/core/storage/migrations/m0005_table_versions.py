@@ -0,0 +1,15 @@
+import sqlite3
+
+VERSION: int = 5
+DESCRIPTION: str = "Track a change counter per table for HTTP validators"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Create table_versions; rows are added on the first write to each table"""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            updated_at TEXT NOT NULL)
+        WITHOUT ROWID
+    """)
@@ -0,0 +1,15 @@
+import sqlite3
+
+VERSION: int = 6
+DESCRIPTION: str = "Add leases so one process at a time runs background jobs"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Create leases; a job's row names its current owner until expires_at"""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS leases (
+            name TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at TEXT NOT NULL)
+        WITHOUT ROWID
+    """)
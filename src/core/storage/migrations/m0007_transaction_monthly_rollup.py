@@ -0,0 +1,52 @@
+import sqlite3
+from ..migrate import backfill_in_batches
+
+VERSION: int = 7
+DESCRIPTION: str = "Add transaction_monthly_rollup with per month, account and category totals"
+
+PENDING_TABLE: str = "transaction_monthly_rollup_pending"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Create the rollup and list the accounts whose transactions backfill() still has to add"""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS transaction_monthly_rollup (
+            month TEXT NOT NULL,
+            account_id TEXT NOT NULL,
+            category_id TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            total REAL NOT NULL,
+            PRIMARY KEY (month, account_id, category_id))
+        WITHOUT ROWID
+    """)
+    connection.execute(f"CREATE TABLE IF NOT EXISTS {PENDING_TABLE} (account_id TEXT PRIMARY KEY) WITHOUT ROWID")
+    connection.execute(f"INSERT OR IGNORE INTO {PENDING_TABLE} (account_id) SELECT uid FROM accounts")
+
+
+def backfill(connection: sqlite3.Connection) -> None:
+    """Sum the transactions of a few accounts per commit into the rollup.
+
+    Writes landing meanwhile already add their deltas to the rollup, so an
+    account's totals are recomputed and overwrite whatever rows it has; no
+    row can be left behind for a group without transactions, as deltas drop
+    rows whose count falls to zero.
+    """
+    exists = connection.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (PENDING_TABLE,)).fetchone()
+    if exists is None:
+        return
+    backfill_in_batches(
+        connection,
+        select_sql=f"SELECT account_id FROM {PENDING_TABLE} LIMIT ?",
+        update_sql=[
+            """
+            INSERT INTO transaction_monthly_rollup (month, account_id, category_id, count, total)
+            SELECT substr(date, 1, 7), account_id, category_id, COUNT(*), SUM(amount)
+            FROM transactions WHERE account_id = ? GROUP BY 1, 2, 3
+            ON CONFLICT (month, account_id, category_id) DO UPDATE
+            SET count = excluded.count, total = excluded.total
+            """,
+            f"DELETE FROM {PENDING_TABLE} WHERE account_id = ?",
+        ],
+        batch_size=10,
+    )
+    connection.execute(f"DROP TABLE {PENDING_TABLE}")
@@ -0,0 +1,48 @@
+import sqlite3
+from ..migrate import backfill_in_batches
+
+VERSION: int = 8
+DESCRIPTION: str = "Add account_balance_checkpoints with each account's balance at every month end"
+
+PENDING_TABLE: str = "account_balance_checkpoints_pending"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Create the checkpoints and list the accounts whose balances backfill() still has to compute"""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS account_balance_checkpoints (
+            account_id TEXT NOT NULL,
+            month TEXT NOT NULL,
+            balance REAL NOT NULL,
+            PRIMARY KEY (account_id, month))
+        WITHOUT ROWID
+    """)
+    connection.execute(f"CREATE TABLE IF NOT EXISTS {PENDING_TABLE} (account_id TEXT PRIMARY KEY) WITHOUT ROWID")
+    connection.execute(f"INSERT OR IGNORE INTO {PENDING_TABLE} (account_id) SELECT uid FROM accounts")
+
+
+def backfill(connection: sqlite3.Connection) -> None:
+    """Replace the checkpoints of a few accounts per commit with running totals of their transactions.
+
+    Writes landing meanwhile may have added checkpoints carried forward from
+    balances not computed yet, so each account's rows are rebuilt as a whole.
+    """
+    exists = connection.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (PENDING_TABLE,)).fetchone()
+    if exists is None:
+        return
+    backfill_in_batches(
+        connection,
+        select_sql=f"SELECT account_id FROM {PENDING_TABLE} LIMIT ?",
+        update_sql=[
+            "DELETE FROM account_balance_checkpoints WHERE account_id = ?",
+            """
+            INSERT INTO account_balance_checkpoints (account_id, month, balance)
+            SELECT account_id, month, SUM(total) OVER (ORDER BY month)
+            FROM (SELECT account_id, substr(date, 1, 7) AS month, SUM(amount) AS total FROM transactions
+                  WHERE account_id = ? GROUP BY month)
+            """,
+            f"DELETE FROM {PENDING_TABLE} WHERE account_id = ?",
+        ],
+        batch_size=10,
+    )
+    connection.execute(f"DROP TABLE {PENDING_TABLE}")
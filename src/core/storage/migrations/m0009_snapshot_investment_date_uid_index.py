@@ -0,0 +1,13 @@
+import sqlite3
+
+VERSION: int = 9
+DESCRIPTION: str = "Extend the snapshot investment index with uid"
+
+
+def upgrade(connection: sqlite3.Connection) -> None:
+    """Cover (investment_id, date, uid) so the latest snapshot of an investment is one index seek"""
+    connection.execute("DROP INDEX IF EXISTS idx_investment_value_snapshots_investment_date")
+    connection.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_value_snapshots_investment_date_uid
+        ON investment_value_snapshots (investment_id, date, uid)
+    """)
@@ -0,0 +1,103 @@
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from core.utils.exceptions import ConnectionPoolTimeoutError
+from .config import StorageProfile
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections for a single database file"""
+
+    def __init__(self, database: Path, max_size: int = 10, idle_timeout: float = 300.0,
+                 acquire_timeout: float = 30.0, profile: Optional[StorageProfile] = None) -> None:
+        if max_size < 1:
+            raise ValueError("Connection pool size must be at least 1")
+        self.database: Path = database
+        self.max_size: int = max_size
+        self.idle_timeout: float = idle_timeout
+        self.acquire_timeout: float = acquire_timeout
+        self.profile: Optional[StorageProfile] = profile
+        self._idle: deque[tuple[sqlite3.Connection, float]] = deque()
+        self._open_count: int = 0
+        self._closed: bool = False
+        self._condition: threading.Condition = threading.Condition()
+
+    @property
+    def open_count(self) -> int:
+        """Number of connections currently open (idle and checked out)"""
+        return self._open_count
+
+    @property
+    def idle_count(self) -> int:
+        """Number of connections waiting in the pool"""
+        return len(self._idle)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection = sqlite3.connect(database=self.database, check_same_thread=False)
+        if self.profile is not None:
+            try:
+                self.profile.apply(connection=connection)
+            except sqlite3.Error:
+                connection.close()
+                raise
+        return connection
+
+    def _discard_expired(self, now: float) -> None:
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            connection, _ = self._idle.popleft()
+            connection.close()
+            self._open_count -= 1
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, opening a new one while below max_size"""
+        deadline: float = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConnectionPoolTimeoutError("Connection pool is closed")
+                self._discard_expired(now=time.monotonic())
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    return connection
+                if self._open_count < self.max_size:
+                    self._open_count += 1
+                    break
+                remaining: float = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionPoolTimeoutError(
+                        f"Timed out waiting for a connection ({self.max_size} in use)"
+                    )
+                self._condition.wait(timeout=remaining)
+
+        try:
+            return self._connect()
+        except sqlite3.Error:
+            with self._condition:
+                self._open_count -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Return a connection to the pool, rolling back any unfinished transaction"""
+        if connection.in_transaction:
+            connection.rollback()
+        with self._condition:
+            if self._closed:
+                connection.close()
+                self._open_count -= 1
+                return
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Close idle connections; checked-out connections are closed when released"""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.popleft()
+                connection.close()
+                self._open_count -= 1
+            self._condition.notify_all()
@@ -1,9 +1,14 @@
-from .exceptions import DuplicateEntityError
-from .helpers import generate_uid
+from .exceptions import DuplicateEntityError, ForeignKeyViolationError, ConnectionPoolTimeoutError, InvalidCursorError
+from .helpers import generate_uid, encode_cursor, decode_cursor
 
 __all__ = [
     "DuplicateEntityError",
+    "ForeignKeyViolationError",
+    "ConnectionPoolTimeoutError",
+    "InvalidCursorError",
     "generate_uid",
+    "encode_cursor",
+    "decode_cursor",
 ]
 
 # Made with Bob
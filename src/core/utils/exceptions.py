@@ -2,4 +2,19 @@ class DuplicateEntityError(Exception):
     """Raised when attempting to create a duplicate entity"""
     pass
 
+
+class ForeignKeyViolationError(Exception):
+    """Raised when a write references a missing entity or deletes a referenced one"""
+    pass
+
+
+class ConnectionPoolTimeoutError(Exception):
+    """Raised when no pooled database connection becomes available in time"""
+    pass
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+    pass
+
 # Made with Bob
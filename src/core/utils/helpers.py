@@ -1,8 +1,33 @@
+import base64
+import binascii
+import json
 import uuid
+from typing import Any
+from .exceptions import InvalidCursorError
 
 
 def generate_uid() -> str:
     """Generate a unique identifier"""
     return str(uuid.uuid4())
 
-# Made with Bob
\ No newline at end of file
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode keyset values into an opaque, URL-safe pagination cursor"""
+    payload: bytes = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a pagination cursor produced by encode_cursor"""
+    try:
+        padded: str = cursor + '=' * (-len(cursor) % 4)
+        values: Any = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("Invalid pagination cursor")
+    if not all(value is None or isinstance(value, (str, int, float)) for value in values):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return values
+
+# Made with Bob
@@ -1,9 +1,139 @@
 """API client for Money Manager backend"""
+import os
+import threading
+from collections.abc import Callable
+from functools import wraps
 import requests
-from typing import Any
-
-
-BASE_URL = "http://localhost:8000"
+import streamlit as st
+from typing import Any, Optional
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+load_dotenv()
+
+BASE_URL: str = os.getenv("MONEY_MANAGER_API_URL", "http://localhost:8000").rstrip("/")
+POOL_SIZE: int = int(os.getenv("MONEY_MANAGER_API_POOL_SIZE", "10"))
+CONNECT_TIMEOUT: float = float(os.getenv("MONEY_MANAGER_API_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT: float = float(os.getenv("MONEY_MANAGER_API_READ_TIMEOUT", "30"))
+RETRIES: int = int(os.getenv("MONEY_MANAGER_API_RETRIES", "3"))
+RETRY_BACKOFF: float = float(os.getenv("MONEY_MANAGER_API_RETRY_BACKOFF", "0.3"))
+CACHE_TTL: int = int(os.getenv("MONEY_MANAGER_UI_CACHE_TTL", "30"))
+
+# POST is not idempotent and is never retried
+RETRY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES: tuple[int, ...] = (502, 503, 504)
+
+
+class ApiSession(requests.Session):
+    """Keep-alive session that applies a default (connect, read) timeout to every request"""
+    
+    def __init__(self, timeout: tuple[float, float]) -> None:
+        super().__init__()
+        self.timeout: tuple[float, float] = timeout
+    
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_session: Optional[ApiSession] = None
+_session_lock: threading.Lock = threading.Lock()
+
+
+def get_session() -> ApiSession:
+    """Return the shared session, creating its connection pool on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=RETRIES,
+                    backoff_factor=RETRY_BACKOFF,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=RETRY_METHODS,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=retry)
+                session = ApiSession(timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+class ApiError(Exception):
+    """Raised inside cached reads so failed responses are never cached"""
+    pass
+
+
+# Resources whose rows can change through writes to the key resource,
+# including views that join in the names of its rows
+DEPENDENT_RESOURCES: dict[str, tuple[str, ...]] = {
+    "accounts": ("transactions/view", "reports/transactions/summary"),
+    "categories": ("transactions/view", "reports/transactions/summary"),
+    "transactions": (
+        "transactions/view", "reports/transactions/summary", "account-balances",
+        "subscription-instances", "subscription-instances/view", "investment-plan-instances"
+    ),
+    "subscriptions": ("subscription-instances", "subscription-instances/view"),
+    "subscription-instances": ("subscription-instances/view",),
+    "investments": ("investment-snapshots/view", "investments/performance", "investments/portfolio"),
+    "investment-snapshots": ("investment-snapshots/view", "investments/performance", "investments/portfolio"),
+    "investment-plans": ("investment-plan-instances", "investments/performance"),
+    "investment-plan-instances": ("investments/performance",),
+}
+
+_generations: dict[str, int] = {}
+_generations_lock: threading.Lock = threading.Lock()
+
+
+def invalidate(*resources: str) -> None:
+    """Make the next read of resources (and their dependents) bypass cached results"""
+    with _generations_lock:
+        for resource in resources:
+            for name in (resource,) + DEPENDENT_RESOURCES.get(resource, ()):
+                _generations[name] = _generations.get(name, 0) + 1
+
+
+def invalidates(*resources: str) -> Callable[[Callable[..., tuple[bool, Any]]], Callable[..., tuple[bool, Any]]]:
+    """Decorate a mutation helper so it invalidates resources once it returns"""
+    def decorator(func: Callable[..., tuple[bool, Any]]) -> Callable[..., tuple[bool, Any]]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> tuple[bool, Any]:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Also after failures: a timed-out write may still have been applied
+                invalidate(*resources)
+        return wrapper
+    return decorator
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=256, show_spinner=False)
+def _cached_get(path: str, params: tuple[tuple[str, Any], ...], generation: int) -> Any:
+    """GET path; generation only keys the cache so invalidate() can retire entries"""
+    response = get_session().get(f"{BASE_URL}/{path}", params=dict(params))
+    success, data = handle_response(response)
+    if not success:
+        raise ApiError(data)
+    return data
+
+
+def fetch(resource: str, params: Optional[dict[str, Any]] = None,
+          cache_group: Optional[str] = None) -> tuple[bool, Any]:
+    """Read a collection, or a view or report such as "transactions/view", through the UI cache.
+    
+    cache_group names the invalidate() resource of per-entity paths such as "accounts/<uid>/balance".
+    """
+    key: tuple[tuple[str, Any], ...] = tuple(sorted((params or {}).items()))
+    path: str = resource if "/" in resource else f"{resource}/"
+    try:
+        return True, _cached_get(path, key, _generations.get(cache_group or resource, 0))
+    except ApiError as e:
+        return False, str(e)
+    except Exception as e:
+        return False, f"Connection error: {str(e)}"
 
 
 def handle_response(response: requests.Response) -> tuple[bool, Any]:
@@ -23,35 +153,39 @@ def handle_response(response: requests.Response) -> tuple[bool, Any]:
 # Accounts API
 def get_accounts() -> tuple[bool, Any]:
     """Get all accounts"""
-    try:
-        response = requests.get(f"{BASE_URL}/accounts")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+    return fetch("accounts")
 
 
+def get_account_balance(uid: str, as_of: str) -> tuple[bool, Any]:
+    """Get the balance of an account at the end of as_of (YYYY-MM-DD)"""
+    return fetch(f"accounts/{uid}/balance", params={"as_of": as_of}, cache_group="account-balances")
+
+
+@invalidates("accounts")
 def create_account(name: str) -> tuple[bool, Any]:
     """Create a new account"""
     try:
-        response = requests.post(f"{BASE_URL}/accounts", json={"name": name})
+        response = get_session().post(f"{BASE_URL}/accounts/", json={"name": name})
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("accounts")
 def update_account(uid: str, name: str) -> tuple[bool, Any]:
     """Update an account"""
     try:
-        response = requests.put(f"{BASE_URL}/accounts/{uid}", json={"name": name})
+        response = get_session().put(f"{BASE_URL}/accounts/{uid}", json={"name": name})
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("accounts")
 def delete_account(uid: str) -> tuple[bool, Any]:
     """Delete an account"""
     try:
-        response = requests.delete(f"{BASE_URL}/accounts/{uid}")
+        response = get_session().delete(f"{BASE_URL}/accounts/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
@@ -60,18 +194,15 @@ def delete_account(uid: str) -> tuple[bool, Any]:
 # Categories API
 def get_categories() -> tuple[bool, Any]:
     """Get all categories"""
-    try:
-        response = requests.get(f"{BASE_URL}/categories")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+    return fetch("categories")
 
 
+@invalidates("categories")
 def create_category(name: str) -> tuple[bool, Any]:
     """Create a new category"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/categories",
+        response = get_session().post(
+            f"{BASE_URL}/categories/",
             json={"name": name}
         )
         return handle_response(response)
@@ -79,10 +210,11 @@ def create_category(name: str) -> tuple[bool, Any]:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("categories")
 def update_category(uid: str, name: str) -> tuple[bool, Any]:
     """Update a category"""
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BASE_URL}/categories/{uid}",
             json={"name": name}
         )
@@ -91,25 +223,37 @@ def update_category(uid: str, name: str) -> tuple[bool, Any]:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("categories")
 def delete_category(uid: str) -> tuple[bool, Any]:
     """Delete a category"""
     try:
-        response = requests.delete(f"{BASE_URL}/categories/{uid}")
+        response = get_session().delete(f"{BASE_URL}/categories/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
 # Transactions API
-def get_transactions() -> tuple[bool, Any]:
-    """Get all transactions"""
-    try:
-        response = requests.get(f"{BASE_URL}/transactions")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+def get_transactions(filters: Optional[dict[str, Any]] = None) -> tuple[bool, Any]:
+    """Get all transactions, optionally filtered server-side"""
+    params = {key: value for key, value in (filters or {}).items() if value not in (None, "")}
+    return fetch("transactions", params=params)
+
+
+def get_transactions_view(filters: Optional[dict[str, Any]] = None) -> tuple[bool, Any]:
+    """Get transactions with account and category names, optionally filtered server-side"""
+    params = {key: value for key, value in (filters or {}).items() if value not in (None, "")}
+    return fetch("transactions/view", params=params)
 
 
+def get_transactions_summary(group_by: list[str], filters: Optional[dict[str, Any]] = None) -> tuple[bool, Any]:
+    """Get transaction counts and totals grouped server-side, e.g. by ["month", "category_id"]"""
+    params = {key: value for key, value in (filters or {}).items() if value not in (None, "")}
+    params["group_by"] = tuple(group_by)
+    return fetch("reports/transactions/summary", params=params)
+
+
+@invalidates("transactions")
 def create_transaction(
     name: str,
     amount: float,
@@ -119,8 +263,8 @@ def create_transaction(
 ) -> tuple[bool, Any]:
     """Create a new transaction"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/transactions",
+        response = get_session().post(
+            f"{BASE_URL}/transactions/",
             json={
                 "name": name,
                 "amount": amount,
@@ -134,6 +278,7 @@ def create_transaction(
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("transactions")
 def update_transaction(
     uid: str,
     name: str,
@@ -144,7 +289,7 @@ def update_transaction(
 ) -> tuple[bool, Any]:
     """Update a transaction"""
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BASE_URL}/transactions/{uid}",
             json={
                 "name": name,
@@ -159,10 +304,11 @@ def update_transaction(
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("transactions")
 def delete_transaction(uid: str) -> tuple[bool, Any]:
     """Delete a transaction"""
     try:
-        response = requests.delete(f"{BASE_URL}/transactions/{uid}")
+        response = get_session().delete(f"{BASE_URL}/transactions/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
@@ -171,13 +317,10 @@ def delete_transaction(uid: str) -> tuple[bool, Any]:
 # Subscriptions API
 def get_subscriptions() -> tuple[bool, Any]:
     """Get all subscriptions"""
-    try:
-        response = requests.get(f"{BASE_URL}/subscriptions")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+    return fetch("subscriptions")
 
 
+@invalidates("subscriptions")
 def create_subscription(
     name: str,
     amount: float,
@@ -187,8 +330,8 @@ def create_subscription(
 ) -> tuple[bool, Any]:
     """Create a new subscription"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/subscriptions",
+        response = get_session().post(
+            f"{BASE_URL}/subscriptions/",
             json={
                 "name": name,
                 "amount": amount,
@@ -202,6 +345,7 @@ def create_subscription(
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("subscriptions")
 def update_subscription(
     uid: str,
     name: str,
@@ -212,7 +356,7 @@ def update_subscription(
 ) -> tuple[bool, Any]:
     """Update a subscription"""
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BASE_URL}/subscriptions/{uid}",
             json={
                 "name": name,
@@ -227,26 +371,39 @@ def update_subscription(
         return False, f"Connection error: {str(e)}"
 
 
-def delete_subscription(uid: str) -> tuple[bool, Any]:
-    """Delete a subscription"""
+@invalidates("subscriptions")
+def delete_subscription(uid: str, on_delete: str = "restrict") -> tuple[bool, Any]:
+    """Delete a subscription; on_delete="cascade" also deletes its instances"""
     try:
-        response = requests.delete(f"{BASE_URL}/subscriptions/{uid}")
+        response = get_session().delete(f"{BASE_URL}/subscriptions/{uid}", params={"on_delete": on_delete})
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
-
-# Subscription Instances API
-def get_subscription_instances() -> tuple[bool, Any]:
-    """Get all subscription instances"""
+@invalidates("subscription-instances")
+def generate_subscription_instances(until: str, uid: str | None = None) -> tuple[bool, Any]:
+    """Create missing due instances up to until for one subscription, or every active one"""
+    path = f"subscriptions/{uid}/generate" if uid else "subscriptions/generate"
     try:
-        response = requests.get(f"{BASE_URL}/subscription-instances")
+        response = get_session().post(f"{BASE_URL}/{path}", params={"until": until})
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+# Subscription Instances API
+def get_subscription_instances() -> tuple[bool, Any]:
+    """Get all subscription instances"""
+    return fetch("subscription-instances")
+
+
+def get_subscription_instances_view() -> tuple[bool, Any]:
+    """Get all subscription instances with subscription and transaction names"""
+    return fetch("subscription-instances/view")
+
+
+@invalidates("subscription-instances")
 def create_subscription_instance(
     subscription_uid: str,
     amount: float,
@@ -264,12 +421,13 @@ def create_subscription_instance(
         }
         if transaction_uid:
             payload["transaction_uid"] = transaction_uid
-        response = requests.post(f"{BASE_URL}/subscription-instances", json=payload)
+        response = get_session().post(f"{BASE_URL}/subscription-instances/", json=payload)
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("subscription-instances")
 def update_subscription_instance(
     uid: str,
     subscription_uid: str,
@@ -288,16 +446,17 @@ def update_subscription_instance(
         }
         if transaction_uid:
             payload["transaction_uid"] = transaction_uid
-        response = requests.put(f"{BASE_URL}/subscription-instances/{uid}", json=payload)
+        response = get_session().put(f"{BASE_URL}/subscription-instances/{uid}", json=payload)
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("subscription-instances")
 def delete_subscription_instance(uid: str) -> tuple[bool, Any]:
     """Delete a subscription instance"""
     try:
-        response = requests.delete(f"{BASE_URL}/subscription-instances/{uid}")
+        response = get_session().delete(f"{BASE_URL}/subscription-instances/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
@@ -306,18 +465,25 @@ def delete_subscription_instance(uid: str) -> tuple[bool, Any]:
 # Investments API
 def get_investments() -> tuple[bool, Any]:
     """Get all investments"""
-    try:
-        response = requests.get(f"{BASE_URL}/investments")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+    return fetch("investments")
+
+
+def get_portfolio(as_of: Optional[str] = None) -> tuple[bool, Any]:
+    """Get the total and per-investment value from each investment's latest snapshot, optionally up to as_of"""
+    return fetch("investments/portfolio", params={"as_of": as_of} if as_of else None)
+
 
+def get_investment_performance(as_of: Optional[str] = None) -> tuple[bool, Any]:
+    """Get gain, time-weighted return and XIRR per investment, optionally up to as_of (YYYY-MM-DD)"""
+    return fetch("investments/performance", params={"as_of": as_of} if as_of else None)
 
+
+@invalidates("investments")
 def create_investment(name: str, start_date: str, status: str = "active") -> tuple[bool, Any]:
     """Create a new investment"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/investments",
+        response = get_session().post(
+            f"{BASE_URL}/investments/",
             json={"name": name, "start_date": start_date, "status": status}
         )
         return handle_response(response)
@@ -325,10 +491,11 @@ def create_investment(name: str, start_date: str, status: str = "active") -> tup
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investments")
 def update_investment(uid: str, name: str, start_date: str, status: str) -> tuple[bool, Any]:
     """Update an investment"""
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BASE_URL}/investments/{uid}",
             json={"name": name, "start_date": start_date, "status": status}
         )
@@ -337,10 +504,11 @@ def update_investment(uid: str, name: str, start_date: str, status: str) -> tupl
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investments")
 def delete_investment(uid: str) -> tuple[bool, Any]:
     """Delete an investment"""
     try:
-        response = requests.delete(f"{BASE_URL}/investments/{uid}")
+        response = get_session().delete(f"{BASE_URL}/investments/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
@@ -349,13 +517,15 @@ def delete_investment(uid: str) -> tuple[bool, Any]:
 # Investment Value Snapshots API
 def get_investment_snapshots() -> tuple[bool, Any]:
     """Get all investment snapshots"""
-    try:
-        response = requests.get(f"{BASE_URL}/investment-snapshots")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+    return fetch("investment-snapshots")
+
 
+def get_investment_snapshots_view() -> tuple[bool, Any]:
+    """Get all investment snapshots with investment names"""
+    return fetch("investment-snapshots/view")
 
+
+@invalidates("investment-snapshots")
 def create_investment_snapshot(
     investment_uid: str,
     date: str,
@@ -363,8 +533,8 @@ def create_investment_snapshot(
 ) -> tuple[bool, Any]:
     """Create a new investment snapshot"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/investment-snapshots",
+        response = get_session().post(
+            f"{BASE_URL}/investment-snapshots/",
             json={
                 "investment_uid": investment_uid,
                 "date": date,
@@ -376,6 +546,7 @@ def create_investment_snapshot(
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investment-snapshots")
 def update_investment_snapshot(
     uid: str,
     investment_uid: str,
@@ -384,7 +555,7 @@ def update_investment_snapshot(
 ) -> tuple[bool, Any]:
     """Update an investment snapshot"""
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BASE_URL}/investment-snapshots/{uid}",
             json={
                 "investment_uid": investment_uid,
@@ -397,10 +568,11 @@ def update_investment_snapshot(
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investment-snapshots")
 def delete_investment_snapshot(uid: str) -> tuple[bool, Any]:
     """Delete an investment snapshot"""
     try:
-        response = requests.delete(f"{BASE_URL}/investment-snapshots/{uid}")
+        response = get_session().delete(f"{BASE_URL}/investment-snapshots/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
@@ -409,13 +581,10 @@ def delete_investment_snapshot(uid: str) -> tuple[bool, Any]:
 # Investment Plans API
 def get_investment_plans() -> tuple[bool, Any]:
     """Get all investment plans"""
-    try:
-        response = requests.get(f"{BASE_URL}/investment-plans")
-        return handle_response(response)
-    except Exception as e:
-        return False, f"Connection error: {str(e)}"
+    return fetch("investment-plans")
 
 
+@invalidates("investment-plans")
 def create_investment_plan(
     investment_uid: str,
     amount: float,
@@ -425,8 +594,8 @@ def create_investment_plan(
 ) -> tuple[bool, Any]:
     """Create a new investment plan"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/investment-plans",
+        response = get_session().post(
+            f"{BASE_URL}/investment-plans/",
             json={
                 "investment_uid": investment_uid,
                 "amount": amount,
@@ -440,6 +609,7 @@ def create_investment_plan(
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investment-plans")
 def update_investment_plan(
     uid: str,
     investment_uid: str,
@@ -450,7 +620,7 @@ def update_investment_plan(
 ) -> tuple[bool, Any]:
     """Update an investment plan"""
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BASE_URL}/investment-plans/{uid}",
             json={
                 "investment_uid": investment_uid,
@@ -465,25 +635,34 @@ def update_investment_plan(
         return False, f"Connection error: {str(e)}"
 
 
-def delete_investment_plan(uid: str) -> tuple[bool, Any]:
-    """Delete an investment plan"""
+@invalidates("investment-plans")
+def delete_investment_plan(uid: str, on_delete: str = "restrict") -> tuple[bool, Any]:
+    """Delete an investment plan; on_delete="cascade" also deletes its instances"""
     try:
-        response = requests.delete(f"{BASE_URL}/investment-plans/{uid}")
+        response = get_session().delete(f"{BASE_URL}/investment-plans/{uid}", params={"on_delete": on_delete})
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
-# Investment Plan Instances API
-def get_investment_plan_instances() -> tuple[bool, Any]:
-    """Get all investment plan instances"""
+@invalidates("investment-plan-instances")
+def generate_investment_plan_instances(until: str, uid: str | None = None) -> tuple[bool, Any]:
+    """Create missing planned instances up to until for one investment plan, or every active one"""
+    path = f"investment-plans/{uid}/generate" if uid else "investment-plans/generate"
     try:
-        response = requests.get(f"{BASE_URL}/investment-plan-instances")
+        response = get_session().post(f"{BASE_URL}/{path}", params={"until": until})
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+# Investment Plan Instances API
+def get_investment_plan_instances() -> tuple[bool, Any]:
+    """Get all investment plan instances"""
+    return fetch("investment-plan-instances")
+
+
+@invalidates("investment-plan-instances")
 def create_investment_plan_instance(
     investment_plan_uid: str,
     amount: float,
@@ -501,12 +680,13 @@ def create_investment_plan_instance(
         }
         if transaction_uid:
             payload["transaction_uid"] = transaction_uid
-        response = requests.post(f"{BASE_URL}/investment-plan-instances", json=payload)
+        response = get_session().post(f"{BASE_URL}/investment-plan-instances/", json=payload)
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investment-plan-instances")
 def update_investment_plan_instance(
     uid: str,
     investment_plan_uid: str,
@@ -525,16 +705,17 @@ def update_investment_plan_instance(
         }
         if transaction_uid:
             payload["transaction_uid"] = transaction_uid
-        response = requests.put(f"{BASE_URL}/investment-plan-instances/{uid}", json=payload)
+        response = get_session().put(f"{BASE_URL}/investment-plan-instances/{uid}", json=payload)
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("investment-plan-instances")
 def delete_investment_plan_instance(uid: str) -> tuple[bool, Any]:
     """Delete an investment plan instance"""
     try:
-        response = requests.delete(f"{BASE_URL}/investment-plan-instances/{uid}")
+        response = get_session().delete(f"{BASE_URL}/investment-plan-instances/{uid}")
         return handle_response(response)
     except Exception as e:
         return False, f"Connection error: {str(e)}"
@@ -544,7 +725,7 @@ def delete_investment_plan_instance(uid: str) -> tuple[bool, Any]:
 def export_subscriptions_csv() -> tuple[bool, Any]:
     """Export subscriptions to CSV"""
     try:
-        response = requests.get(f"{BASE_URL}/subscriptions/export/csv")
+        response = get_session().get(f"{BASE_URL}/subscriptions/export/csv")
         if response.status_code == 200:
             return True, response.text
         else:
@@ -553,10 +734,11 @@ def export_subscriptions_csv() -> tuple[bool, Any]:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("subscriptions")
 def import_subscriptions_csv(csv_content: str) -> tuple[bool, Any]:
     """Import subscriptions from CSV"""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/subscriptions/export/csv",
             json={"file_content": csv_content}
         )
@@ -569,7 +751,7 @@ def import_subscriptions_csv(csv_content: str) -> tuple[bool, Any]:
 def export_transactions_csv() -> tuple[bool, Any]:
     """Export transactions to CSV"""
     try:
-        response = requests.get(f"{BASE_URL}/transactions/export/csv")
+        response = get_session().get(f"{BASE_URL}/transactions/export/csv")
         if response.status_code == 200:
             return True, response.text
         else:
@@ -578,10 +760,11 @@ def export_transactions_csv() -> tuple[bool, Any]:
         return False, f"Connection error: {str(e)}"
 
 
+@invalidates("transactions")
 def import_transactions_csv(csv_content: str) -> tuple[bool, Any]:
     """Import transactions from CSV"""
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{BASE_URL}/transactions/export/csv",
             json={"file_content": csv_content}
         )
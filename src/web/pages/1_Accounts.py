@@ -2,6 +2,7 @@
 import streamlit as st
 import pandas as pd
 import sys
+from datetime import date, timedelta
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -41,6 +42,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_accounts"):
+            api_client.invalidate("accounts")
             load_accounts()
             st.rerun()
     
@@ -58,6 +60,22 @@ with tab1:
             }
         )
         st.info(f"Total accounts: {len(df)}")
+        
+        # Month-end balances over the last year, each answered from the server's checkpoints
+        st.subheader("Balance History")
+        names = dict(zip(df["name"], df["uid"]))
+        account_name = st.selectbox("Account", options=list(names), key="balance_account")
+        month_end = date.today().replace(day=1) - timedelta(days=1)
+        points = []
+        for _ in range(12):
+            success, data = api_client.get_account_balance(names[account_name], month_end.isoformat())
+            if not success:
+                st.error(f"Failed to fetch balance: {data}")
+                break
+            points.append({"date": month_end, "balance": data["balance"]})
+            month_end = month_end.replace(day=1) - timedelta(days=1)
+        else:
+            st.line_chart(pd.DataFrame(points).set_index("date").sort_index())
     else:
         st.info("No accounts found. Create your first account!")
 
@@ -41,6 +41,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_categories"):
+            api_client.invalidate("categories")
             load_categories()
             st.rerun()
     
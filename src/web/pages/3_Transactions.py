@@ -23,9 +23,9 @@ if 'categories_list' not in st.session_state:
     st.session_state.categories_list = []
 
 
-def load_transactions():
+def load_transactions(filters=None):
     """Load transactions from API"""
-    success, data = api_client.get_transactions()
+    success, data = api_client.get_transactions_view(filters)
     if success and data:
         df = pd.DataFrame(data)
         # Date is already in string format from API
@@ -74,13 +74,35 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_transactions"):
+            api_client.invalidate("transactions", "accounts", "categories")
             load_transactions()
             load_accounts()
             load_categories()
             st.rerun()
     
+    # Server-side filters
+    filter_accounts = {"All accounts": None, **{name: uid for name, uid in load_accounts()}}
+    filter_categories = {"All categories": None, **{name: uid for name, uid in load_categories()}}
+    fcol1, fcol2, fcol3, fcol4 = st.columns(4)
+    with fcol1:
+        date_range = st.date_input("Date range", value=(), key="filter_date_range")
+    with fcol2:
+        filter_account = st.selectbox("Account", options=list(filter_accounts.keys()), key="filter_account")
+    with fcol3:
+        filter_category = st.selectbox("Category", options=list(filter_categories.keys()), key="filter_category")
+    with fcol4:
+        filter_name = st.text_input("Name starts with", key="filter_name")
+    
+    filters = {
+        "date_from": date_range[0].isoformat() if len(date_range) > 0 else None,
+        "date_to": date_range[1].isoformat() if len(date_range) > 1 else None,
+        "account_id": filter_accounts[filter_account],
+        "category_id": filter_categories[filter_category],
+        "name_prefix": filter_name.strip() or None,
+    }
+    
     # Load and display transactions
-    df = load_transactions()
+    df = load_transactions(filters)
     
     if not df.empty:
         # Hide UUID columns, show only names
@@ -108,6 +130,15 @@ with tab1:
         with col2:
             total = df['amount'].sum() if 'amount' in df.columns else 0
             st.metric("Total Amount", f"₹{total:.2f}")
+        
+        # Monthly totals per category, aggregated by the API
+        summary_filters = {key: value for key, value in filters.items() if key != "name_prefix"}
+        success, summary = api_client.get_transactions_summary(["month", "category_id"], summary_filters)
+        if success and summary:
+            summary_df = pd.DataFrame(summary)
+            chart_df = summary_df.pivot_table(index="month", columns="category_name", values="total", fill_value=0)
+            st.caption("Monthly totals by category")
+            st.bar_chart(chart_df)
     else:
         st.info("No transactions found. Create your first transaction!")
 
@@ -45,6 +45,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_subscriptions"):
+            api_client.invalidate("subscriptions")
             load_subscriptions()
             st.rerun()
     
@@ -166,6 +167,7 @@ with tab4:
     with st.form("delete_subscription_form"):
         uid = st.text_input("Subscription UID *", placeholder="Enter UID to delete")
         
+        cascade = st.checkbox("Also delete its subscription instances")
         confirm = st.checkbox("I understand this action cannot be undone")
         
         submitted = st.form_submit_button("🗑️ Delete Subscription", type="primary", width='stretch')
@@ -176,7 +178,7 @@ with tab4:
             elif not confirm:
                 st.error("❌ Please confirm deletion")
             else:
-                success, data = api_client.delete_subscription(uid.strip())
+                success, data = api_client.delete_subscription(uid.strip(), on_delete="cascade" if cascade else "restrict")
                 if success:
                     st.success("✅ Subscription deleted successfully")
                     load_subscriptions()
@@ -3,7 +3,7 @@ import streamlit as st
 import pandas as pd
 import sys
 from pathlib import Path
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,7 +25,7 @@ if 'transactions_list' not in st.session_state:
 
 def load_subscription_instances():
     """Load subscription instances from API"""
-    success, data = api_client.get_subscription_instances()
+    success, data = api_client.get_subscription_instances_view()
     if success and data:
         df = pd.DataFrame(data)
         # Date is already in string format from API
@@ -74,6 +74,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_instances"):
+            api_client.invalidate("subscription-instances", "subscriptions", "transactions")
             load_subscription_instances()
             load_subscriptions()
             load_transactions()
@@ -171,6 +172,20 @@ with tab2:
                         st.rerun()
                     else:
                         st.error(f"❌ Failed to create instance: {data}")
+    
+    st.divider()
+    st.subheader("Generate From Schedules")
+    with st.form("generate_instances_form"):
+        generate_until = st.date_input("Generate due instances until *", value=datetime.now() + timedelta(days=90))
+        generate_submitted = st.form_submit_button("📅 Generate Instances", width='stretch')
+        
+        if generate_submitted:
+            success, data = api_client.generate_subscription_instances(generate_until.strftime('%Y-%m-%d'))
+            if success:
+                st.success(f"✅ Created {data['created']} instances ({data['skipped']} already existed)")
+                load_subscription_instances()
+            else:
+                st.error(f"❌ Failed to generate instances: {data}")
 
 with tab3:
     st.subheader("Update Subscription Instance")
@@ -48,6 +48,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_investments"):
+            api_client.invalidate("investments")
             load_investments()
             st.rerun()
     
@@ -82,6 +83,29 @@ with tab1:
         with col2:
             active_count = (df['status'] == 'active').sum() if 'status' in df.columns else 0
             st.metric("Active", active_count)
+        
+        # Returns computed by the API from snapshots and executed plan instances
+        st.subheader("Performance")
+        success, performance = api_client.get_investment_performance()
+        if success and performance:
+            st.dataframe(
+                pd.DataFrame(performance).drop(columns=["investment_id"]),
+                width='stretch',
+                hide_index=True,
+                column_config={
+                    "investment_name": st.column_config.TextColumn("Investment", width="large"),
+                    "start_date": st.column_config.TextColumn("From", width="small"),
+                    "end_date": st.column_config.TextColumn("To", width="small"),
+                    "start_value": st.column_config.NumberColumn("Start Value", format="₹%.2f"),
+                    "current_value": st.column_config.NumberColumn("Current Value", format="₹%.2f"),
+                    "contributions": st.column_config.NumberColumn("Contributions", format="₹%.2f"),
+                    "absolute_gain": st.column_config.NumberColumn("Gain", format="₹%.2f"),
+                    "twr": st.column_config.NumberColumn("TWR", format="percent"),
+                    "xirr": st.column_config.NumberColumn("XIRR", format="percent"),
+                }
+            )
+        elif not success:
+            st.error(f"Failed to fetch performance: {performance}")
     else:
         st.info("No investments found. Create your first investment!")
 
@@ -23,7 +23,7 @@ if 'investments_list' not in st.session_state:
 
 def load_snapshots():
     """Load investment snapshots from API"""
-    success, data = api_client.get_investment_snapshots()
+    success, data = api_client.get_investment_snapshots_view()
     if success and data:
         df = pd.DataFrame(data)
         # Date is already in string format from API
@@ -60,6 +60,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_snapshots"):
+            api_client.invalidate("investment-snapshots", "investments")
             load_snapshots()
             load_investments()
             st.rerun()
@@ -89,9 +90,9 @@ with tab1:
         with col1:
             st.metric("Total Snapshots", len(df))
         with col2:
-            if 'current_value' in df.columns and not df.empty:
-                latest_total = df.groupby('investment_name')['current_value'].last().sum()
-                st.metric("Latest Total Value", f"₹{latest_total:.2f}")
+            success, portfolio = api_client.get_portfolio()
+            if success:
+                st.metric("Latest Total Value", f"₹{portfolio['total_value']:.2f}")
     else:
         st.info("No snapshots found. Create your first snapshot!")
 
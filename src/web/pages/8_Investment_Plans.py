@@ -57,6 +57,7 @@ with tab1:
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", key="refresh_plans"):
+            api_client.invalidate("investment-plans", "investments")
             load_investment_plans()
             load_investments()
             st.rerun()
@@ -201,11 +202,12 @@ with tab3:
 with tab4:
     st.subheader("Delete Investment Plan")
     
-    st.warning("⚠️ Warning: Deleting a plan will also delete all associated plan instances!")
+    st.warning("⚠️ Warning: A plan with instances can only be deleted together with all of them, including executed ones!")
     
     with st.form("delete_plan_form"):
         uid = st.text_input("Plan UID *", placeholder="Enter UID to delete")
         
+        cascade = st.checkbox("Also delete its plan instances")
         confirm = st.checkbox("I understand this action cannot be undone")
         
         submitted = st.form_submit_button("🗑️ Delete Plan", type="primary", width='stretch')
@@ -216,7 +218,7 @@ with tab4:
             elif not confirm:
                 st.error("❌ Please confirm deletion")
             else:
-                success, data = api_client.delete_investment_plan(uid.strip())
+                success, data = api_client.delete_investment_plan(uid.strip(), on_delete="cascade" if cascade else "restrict")
                 if success:
                     st.success("✅ Investment plan deleted successfully")
                     load_investment_plans()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from core.main import app
+from core.storage.init_db import init_database, close_pool, get_connection
+from core.repositories import bump_table_versions
+from core.controller.conditional import etag_matches
+
+
+class TestConditionalGet(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        self.client = TestClient(app)
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def test_not_modified(self) -> None:
+        self.client.post('/accounts/', json={'name': 'Checking'})
+        response = self.client.get('/accounts/')
+        etag = response.headers['ETag']
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response.headers)
+        
+        response = self.client.get('/accounts/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+    
+    def test_write_changes_etag(self) -> None:
+        etag = self.client.get('/categories/').headers['ETag']
+        uid = self.client.post('/categories/', json={'name': 'Food'}).json()['uid']
+        response = self.client.get('/categories/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        
+        etag = response.headers['ETag']
+        self.client.put(f'/categories/{uid}', json={'name': 'Groceries'})
+        response = self.client.get(f'/categories/{uid}', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Groceries')
+    
+    def test_tables_versioned_independently(self) -> None:
+        etag = self.client.get('/accounts/').headers['ETag']
+        self.client.post('/categories/', json={'name': 'Food'})
+        response = self.client.get('/accounts/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+    
+    def test_failed_write_keeps_etag(self) -> None:
+        self.client.post('/accounts/', json={'name': 'Checking'})
+        etag = self.client.get('/accounts/').headers['ETag']
+        self.assertEqual(self.client.post('/accounts/', json={'name': 'Checking'}).status_code, 409)
+        self.assertEqual(self.client.get('/accounts/', headers={'If-None-Match': etag}).status_code, 304)
+    
+    def test_transaction_delete_changes_instance_etag(self) -> None:
+        account_uid = self.client.post('/accounts/', json={'name': 'Checking'}).json()['uid']
+        category_uid = self.client.post('/categories/', json={'name': 'Food'}).json()['uid']
+        transaction_uid = self.client.post('/transactions/', json={
+            'name': 'Lunch', 'amount': 12.0, 'date': '2024-01-01',
+            'account_id': account_uid, 'category_id': category_uid
+        }).json()['uid']
+        etag = self.client.get('/subscription-instances/').headers['ETag']
+        self.client.delete(f'/transactions/{transaction_uid}')
+        response = self.client.get('/subscription-instances/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+    
+    def test_cached_body_matches_etag(self) -> None:
+        uid = self.client.post('/categories/', json={'name': 'Food'}).json()['uid']
+        etag = self.client.get(f'/categories/{uid}').headers['ETag']
+        # Another process renames the category; this process's snapshot is not invalidated
+        with get_connection() as connection:
+            connection.execute("UPDATE categories SET name = 'Groceries' WHERE uid = ?", (uid,))
+            bump_table_versions(connection=connection, tables=['categories'])
+            connection.commit()
+        response = self.client.get(f'/categories/{uid}', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Groceries')
+    
+    def test_default_as_of_changes_etag_daily(self) -> None:
+        account_uid = self.client.post('/accounts/', json={'name': 'Checking'}).json()['uid']
+        etag = self.client.get(f'/accounts/{account_uid}/balance').headers['ETag']
+        self.assertIn(date.today().isoformat(), etag)
+        response = self.client.get(f'/accounts/{account_uid}/balance', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        
+        class Tomorrow(date):
+            @classmethod
+            def today(cls) -> date:
+                return date.today() + timedelta(days=1)
+        
+        with patch('core.controller.conditional.date', Tomorrow):
+            response = self.client.get(f'/accounts/{account_uid}/balance', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        
+        pinned = self.client.get(f'/accounts/{account_uid}/balance', params={'as_of': '2024-01-31'})
+        self.assertNotIn('as_of', pinned.headers['ETag'])
+    
+    def test_etag_matches(self) -> None:
+        self.assertTrue(etag_matches('*', 'W/"accounts.1"'))
+        self.assertTrue(etag_matches('"accounts.1"', 'W/"accounts.1"'))
+        self.assertTrue(etag_matches('W/"accounts.0", W/"accounts.1"', 'W/"accounts.1"'))
+        self.assertFalse(etag_matches('W/"accounts.2"', 'W/"accounts.1"'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,8 @@ import os
 import tempfile
 from fastapi.testclient import TestClient
 from core.main import app
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool
+from core.services import TransactionService
 
 
 class TestTransactionExportImport(unittest.TestCase):
@@ -36,6 +37,7 @@ class TestTransactionExportImport(unittest.TestCase):
         })
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -55,6 +57,24 @@ class TestTransactionExportImport(unittest.TestCase):
         self.assertIn('50.0', csv_content)
         self.assertIn('30.0', csv_content)
     
+    def test_export_transactions_csv_streams_in_batches(self) -> None:
+        """Test the CSV export is produced in chunks with names joined in SQL"""
+        for i in range(5):
+            self.client.post('/transactions/', json={
+                'name': f'Extra {i}', 'amount': 1.0, 'date': '2024-02-01',
+                'account_id': self.account['uid'], 'category_id': self.category['uid']
+            })
+        
+        chunks = TransactionService().stream_csv(batch_size=2)
+        header = next(chunks)
+        rest = list(chunks)
+        
+        self.assertEqual(header, 'name,amount,date,account,category\n')
+        self.assertEqual(len(rest), 4)
+        lines = ''.join(rest).splitlines()
+        self.assertEqual(lines[0], 'Grocery,50.0,2024-01-15,Checking,Food')
+        self.assertEqual(len(lines), 7)
+    
     def test_import_transactions_csv(self) -> None:
         """Test importing transactions from CSV"""
         csv_content = f"""name,amount,date,account,category
@@ -118,6 +138,7 @@ class TestSubscriptionExportImport(unittest.TestCase):
         })
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -155,6 +176,19 @@ Disney+,79.99,yearly,1,15,3,active"""
         all_subs = self.client.get('/subscriptions/').json()
         self.assertEqual(len(all_subs), 4)  # 2 original + 2 imported
     
+    def test_import_subscriptions_csv_duplicate_names(self) -> None:
+        """Test duplicate names are reported per row while other rows are created"""
+        csv_content = """name,amount,frequency,interval,due_day,due_month,status
+Gym,30.0,monthly,1,5,,active
+Gym,35.0,monthly,1,6,,active
+Insurance,400.0,yearly,1,1,3,active"""
+        
+        response = self.client.post('/subscriptions/export/csv', json={'file_content': csv_content})
+        result = response.json()
+        self.assertEqual(result['created'], 2)
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(result['errors'], ["Failed to create subscription 'Gym': Entity already exists"])
+    
     def test_import_subscriptions_csv_with_errors(self) -> None:
         """Test importing subscriptions with validation errors"""
         csv_content = """name,amount,frequency,interval,due_day,due_month,status
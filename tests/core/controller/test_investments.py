@@ -4,7 +4,7 @@ import tempfile
 from datetime import date
 from fastapi.testclient import TestClient
 from core.main import app
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool
 
 
 class TestInvestmentAPI(unittest.TestCase):
@@ -17,6 +17,7 @@ class TestInvestmentAPI(unittest.TestCase):
         self.client = TestClient(app)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -97,6 +98,7 @@ class TestInvestmentSnapshotAPI(unittest.TestCase):
         self.investment_uid = inv_response.json()['uid']
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -112,6 +114,27 @@ class TestInvestmentSnapshotAPI(unittest.TestCase):
         data = response.json()
         self.assertEqual(data['current_value'], 10000.50)
     
+    def test_get_view(self) -> None:
+        other_uid = self.client.post('/investments/', json={
+            'name': 'Bonds', 'start_date': '2024-01-01', 'status': 'active'
+        }).json()['uid']
+        for investment_uid, day in [(self.investment_uid, '2024-01-31'), (other_uid, '2024-02-29'),
+                                    (self.investment_uid, '2024-03-31')]:
+            self.client.post('/investment-snapshots/', json={
+                'investment_id': investment_uid, 'date': day, 'current_value': 100.0
+            })
+        
+        response = self.client.get('/investment-snapshots/view', params={'date_from': '2024-02-01'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(s['date'], s['investment_name']) for s in response.json()],
+                         [('2024-02-29', 'Bonds'), ('2024-03-31', 'Stock Portfolio')])
+        
+        response = self.client.get('/investment-snapshots/view', params={'investment_id': other_uid})
+        self.assertEqual([s['investment_name'] for s in response.json()], ['Bonds'])
+        
+        response = self.client.get('/investment-snapshots/view', params={'date_from': '2024-03-01', 'date_to': '2024-02-01'})
+        self.assertEqual(response.status_code, 400)
+    
     def test_get_by_id(self) -> None:
         create_response = self.client.post('/investment-snapshots/', json={
             'investment_id': self.investment_uid,
@@ -176,6 +199,7 @@ class TestInvestmentPlanAPI(unittest.TestCase):
         self.investment_uid = inv_response.json()['uid']
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -254,6 +278,31 @@ class TestInvestmentPlanAPI(unittest.TestCase):
         
         response = self.client.delete(f'/investment-plans/{uid}')
         self.assertEqual(response.status_code, 204)
+    
+    def test_generate_instances(self) -> None:
+        uid = self.client.post('/investment-plans/', json={
+            'investment_id': self.investment_uid, 'amount': 500.0,
+            'frequency': 'monthly', 'interval': 2, 'due_day': 30,
+            'due_month': None, 'status': 'active'
+        }).json()['uid']
+        self.client.post('/investment-plan-instances/', json={
+            'investment_plan_id': uid, 'amount': 500.0, 'due_date': '2023-12-30',
+            'transaction_id': None, 'status': 'executed'
+        })
+        params = {'start': '2024-01-01', 'until': '2024-06-30'}
+        
+        response = self.client.post(f'/investment-plans/{uid}/generate', params=params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'created': 3, 'skipped': 0, 'schedules': 1})
+        instances = self.client.get('/investment-plan-instances/').json()
+        planned = sorted(i['due_date'] for i in instances if i['status'] == 'planned')
+        self.assertEqual(planned, ['2024-02-29', '2024-04-30', '2024-06-30'])
+        
+        response = self.client.post('/investment-plans/generate', params=params)
+        self.assertEqual(response.json(), {'created': 0, 'skipped': 3, 'schedules': 1})
+        
+        response = self.client.post('/investment-plans/missing/generate', params=params)
+        self.assertEqual(response.status_code, 404)
 
 
 class TestInvestmentPlanInstanceAPI(unittest.TestCase):
@@ -285,6 +334,7 @@ class TestInvestmentPlanInstanceAPI(unittest.TestCase):
         self.plan_uid = plan_response.json()['uid']
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -356,6 +406,80 @@ class TestInvestmentPlanInstanceAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 204)
 
 
+
+class TestInvestmentAnalyticsAPI(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        self.client = TestClient(app)
+        
+        self.fund = self.client.post('/investments/', json={
+            'name': 'Index Fund', 'start_date': '2024-01-01', 'status': 'active'
+        }).json()['uid']
+        self.bond = self.client.post('/investments/', json={
+            'name': 'Bond', 'start_date': '2024-01-01', 'status': 'active'
+        }).json()['uid']
+        plan = self.client.post('/investment-plans/', json={
+            'investment_id': self.fund, 'amount': 100.0, 'frequency': 'monthly',
+            'interval': 1, 'due_day': 1, 'due_month': None, 'status': 'active'
+        }).json()['uid']
+        for due_date, status in [('2024-02-01', 'executed'), ('2024-03-01', 'skipped'), ('2024-04-01', 'executed')]:
+            self.client.post('/investment-plan-instances/', json={
+                'investment_plan_id': plan, 'amount': 100.0, 'due_date': due_date,
+                'transaction_id': None, 'status': status
+            })
+        for day, value in [('2024-01-01', 1000.0), ('2024-03-15', 1150.0), ('2024-06-30', 1300.0)]:
+            self.client.post('/investment-snapshots/', json={
+                'investment_id': self.fund, 'date': day, 'current_value': value
+            })
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def test_performance(self) -> None:
+        response = self.client.get('/investments/performance')
+        self.assertEqual(response.status_code, 200)
+        performance = {row['investment_name']: row for row in response.json()}
+        fund = performance['Index Fund']
+        self.assertEqual((fund['start_date'], fund['end_date']), ('2024-01-01', '2024-06-30'))
+        self.assertEqual(fund['contributions'], 200.0)
+        self.assertEqual(fund['absolute_gain'], 100.0)
+        self.assertAlmostEqual(fund['twr'], 1150 / 1100 * 1300 / 1250 - 1)
+        self.assertGreater(fund['xirr'], fund['twr'])
+        self.assertEqual(performance['Bond'], {
+            'investment_id': self.bond, 'investment_name': 'Bond', 'start_date': None, 'end_date': None,
+            'start_value': None, 'current_value': None, 'contributions': None,
+            'absolute_gain': None, 'twr': None, 'xirr': None
+        })
+    
+    def test_portfolio(self) -> None:
+        self.client.post('/investment-snapshots/', json={
+            'investment_id': self.bond, 'date': '2024-05-01', 'current_value': 250.0
+        })
+        response = self.client.get('/investments/portfolio')
+        self.assertEqual(response.status_code, 200)
+        portfolio = response.json()
+        self.assertEqual(portfolio['total_value'], 1550.0)
+        self.assertEqual([(h['investment_name'], h['date'], h['current_value']) for h in portfolio['holdings']],
+                         [('Bond', '2024-05-01', 250.0), ('Index Fund', '2024-06-30', 1300.0)])
+        
+        portfolio = self.client.get('/investments/portfolio', params={'as_of': '2024-04-30'}).json()
+        self.assertEqual(portfolio['total_value'], 1150.0)
+        self.assertEqual([h['investment_id'] for h in portfolio['holdings']], [self.fund])
+    
+    def test_performance_as_of(self) -> None:
+        response = self.client.get('/investments/performance', params={'as_of': '2024-03-31'})
+        fund = next(row for row in response.json() if row['investment_id'] == self.fund)
+        self.assertEqual((fund['end_date'], fund['current_value'], fund['contributions']), ('2024-03-15', 1150.0, 100.0))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,99 @@
+import unittest
+import os
+import tempfile
+from fastapi.testclient import TestClient
+from core.main import app
+from core.storage.init_db import init_database, close_pool, get_connection
+
+
+class TestTransactionSummaryAPI(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        self.client = TestClient(app)
+        
+        self.food = self.client.post('/categories/', json={'name': 'Food'}).json()['uid']
+        self.rent = self.client.post('/categories/', json={'name': 'Rent'}).json()['uid']
+        self.checking = self.client.post('/accounts/', json={'name': 'Checking'}).json()['uid']
+        self.card = self.client.post('/accounts/', json={'name': 'Card'}).json()['uid']
+        rows = [
+            (10.0, '2024-01-01', self.checking, self.food),
+            (20.0, '2024-01-07', self.card, self.food),
+            (900.0, '2024-01-31', self.checking, self.rent),
+            (15.0, '2024-02-05', self.card, self.food),
+        ]
+        for amount, day, account, category in rows:
+            self.client.post('/transactions/', json={
+                'name': 'Item', 'amount': amount, 'date': day, 'account_id': account, 'category_id': category
+            })
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def test_group_by_month(self) -> None:
+        response = self.client.get('/reports/transactions/summary')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(row['month'], row['count'], row['total']) for row in response.json()],
+                         [('2024-01', 3, 930.0), ('2024-02', 1, 15.0)])
+    
+    def test_group_by_week(self) -> None:
+        response = self.client.get('/reports/transactions/summary', params={'group_by': 'week'})
+        self.assertEqual([(row['week'], row['total']) for row in response.json()],
+                         [('2024-01-01', 30.0), ('2024-01-29', 900.0), ('2024-02-05', 15.0)])
+    
+    def test_group_by_month_and_category(self) -> None:
+        response = self.client.get('/reports/transactions/summary', params={
+            'group_by': ['month', 'category_id'], 'date_to': '2024-01-31'
+        })
+        data = response.json()
+        self.assertEqual({(row['month'], row['category_name'], row['total']) for row in data},
+                         {('2024-01', 'Food', 30.0), ('2024-01', 'Rent', 900.0)})
+        self.assertIsNone(data[0]['account_id'])
+    
+    def test_group_by_account_filtered(self) -> None:
+        response = self.client.get('/reports/transactions/summary', params={
+            'group_by': 'account_id', 'category_id': self.food
+        })
+        self.assertEqual({(row['account_name'], row['count'], row['total']) for row in response.json()},
+                         {('Checking', 1, 10.0), ('Card', 2, 35.0)})
+    
+    def test_whole_months_read_rollup(self) -> None:
+        def summary(**params: str) -> list[tuple]:
+            response = self.client.get('/reports/transactions/summary', params=params)
+            return [(row['month'], row['count'], row['total']) for row in response.json()]
+        
+        self.assertEqual(summary(date_from='2024-01-01', date_to='2024-01-31'), [('2024-01', 3, 930.0)])
+        self.assertEqual(summary(date_from='2024-01-05', date_to='2024-01-31'), [('2024-01', 2, 920.0)])
+        
+        with get_connection() as connection:
+            connection.execute("DELETE FROM transaction_monthly_rollup")
+            connection.commit()
+        self.assertEqual(summary(date_from='2024-01-01', date_to='2024-01-31'), [])
+        self.assertEqual(summary(date_from='2024-01-05', date_to='2024-01-31'), [('2024-01', 2, 920.0)])
+    
+    def test_invalid_parameters(self) -> None:
+        response = self.client.get('/reports/transactions/summary', params={'group_by': 'year'})
+        self.assertEqual(response.status_code, 422)
+        response = self.client.get('/reports/transactions/summary', params={
+            'date_from': '2024-02-01', 'date_to': '2024-01-01'
+        })
+        self.assertEqual(response.status_code, 400)
+    
+    def test_not_modified_until_write(self) -> None:
+        etag = self.client.get('/reports/transactions/summary').headers['ETag']
+        response = self.client.get('/reports/transactions/summary', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.client.put(f'/categories/{self.food}', json={'name': 'Groceries'})
+        response = self.client.get('/reports/transactions/summary', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ import tempfile
 from datetime import date
 from fastapi.testclient import TestClient
 from core.main import app
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool
 
 
 class TestSubscriptionAPI(unittest.TestCase):
@@ -17,6 +17,7 @@ class TestSubscriptionAPI(unittest.TestCase):
         self.client = TestClient(app)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -90,6 +91,41 @@ class TestSubscriptionAPI(unittest.TestCase):
         
         response = self.client.delete(f'/subscriptions/{uid}')
         self.assertEqual(response.status_code, 204)
+    
+    def test_generate_instances(self) -> None:
+        uid = self.client.post('/subscriptions/', json={
+            'name': 'Rent', 'amount': 900.0, 'frequency': 'monthly',
+            'interval': 1, 'due_day': 31, 'due_month': None, 'status': 'active'
+        }).json()['uid']
+        params = {'start': '2024-01-01', 'until': '2024-03-31'}
+        
+        response = self.client.post(f'/subscriptions/{uid}/generate', params=params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'created': 3, 'skipped': 0, 'schedules': 1})
+        instances = self.client.get('/subscription-instances/view', params={'subscription_id': uid}).json()
+        self.assertEqual([i['due_date'] for i in instances], ['2024-01-31', '2024-02-29', '2024-03-31'])
+        self.assertEqual({(i['status'], i['amount']) for i in instances}, {('due', 900.0)})
+        
+        response = self.client.post(f'/subscriptions/{uid}/generate', params=params)
+        self.assertEqual(response.json(), {'created': 0, 'skipped': 3, 'schedules': 1})
+    
+    def test_generate_all_skips_cancelled(self) -> None:
+        for name, status in [('Gym', 'active'), ('Old', 'cancelled')]:
+            self.client.post('/subscriptions/', json={
+                'name': name, 'amount': 30.0, 'frequency': 'yearly',
+                'interval': 1, 'due_day': 1, 'due_month': 6, 'status': status
+            })
+        
+        response = self.client.post('/subscriptions/generate', params={'start': '2024-01-01', 'until': '2026-12-31'})
+        self.assertEqual(response.json(), {'created': 3, 'skipped': 0, 'schedules': 1})
+    
+    def test_generate_invalid_window(self) -> None:
+        response = self.client.post('/subscriptions/missing/generate', params={'until': '2030-01-01'})
+        self.assertEqual(response.status_code, 404)
+        response = self.client.post('/subscriptions/generate', params={'start': '2024-02-01', 'until': '2024-01-01'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/subscriptions/generate', params={'start': '2024-01-01', 'until': '2040-01-01'})
+        self.assertEqual(response.status_code, 400)
 
 
 class TestSubscriptionInstanceAPI(unittest.TestCase):
@@ -114,6 +150,7 @@ class TestSubscriptionInstanceAPI(unittest.TestCase):
         self.subscription_uid = sub_response.json()['uid']
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -132,6 +169,21 @@ class TestSubscriptionInstanceAPI(unittest.TestCase):
         self.assertEqual(data['amount'], 15.99)
         self.assertEqual(data['status'], 'due')
     
+    def test_create_missing_references(self) -> None:
+        response = self.client.post('/subscription-instances/', json={
+            'subscription_id': 'missing', 'amount': 15.99,
+            'due_date': '2024-01-15', 'transaction_id': None, 'status': 'due'
+        })
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['detail'], 'Subscription not found')
+        
+        response = self.client.post('/subscription-instances/', json={
+            'subscription_id': self.subscription_uid, 'amount': 15.99,
+            'due_date': '2024-01-15', 'transaction_id': 'missing', 'status': 'due'
+        })
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['detail'], 'Transaction not found')
+    
     def test_get_by_id(self) -> None:
         create_response = self.client.post('/subscription-instances/', json={
             'subscription_id': self.subscription_uid,
@@ -183,6 +235,59 @@ class TestSubscriptionInstanceAPI(unittest.TestCase):
         
         response = self.client.delete(f'/subscription-instances/{uid}')
         self.assertEqual(response.status_code, 204)
+    
+    def test_get_view(self) -> None:
+        for due_date, status in [('2024-01-15', 'paid'), ('2024-02-15', 'due'), ('2024-03-15', 'due')]:
+            self.client.post('/subscription-instances/', json={
+                'subscription_id': self.subscription_uid, 'amount': 15.99,
+                'due_date': due_date, 'transaction_id': None, 'status': status
+            })
+        
+        response = self.client.get('/subscription-instances/view', params={'status': 'due', 'sort': '-due_date'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([i['due_date'] for i in data], ['2024-03-15', '2024-02-15'])
+        self.assertEqual({(i['subscription_name'], i['transaction_name']) for i in data}, {('Netflix', None)})
+        
+        response = self.client.get('/subscription-instances/view', params={'date_from': '2024-02-01', 'limit': 1})
+        self.assertEqual([i['due_date'] for i in response.json()], ['2024-02-15'])
+        self.assertIn('X-Next-Cursor', response.headers)
+    
+    def test_delete_subscription_with_instances(self) -> None:
+        create_response = self.client.post('/subscription-instances/', json={
+            'subscription_id': self.subscription_uid, 'amount': 15.99,
+            'due_date': '2024-01-15', 'transaction_id': None, 'status': 'due'
+        })
+        instance_uid = create_response.json()['uid']
+        
+        response = self.client.delete(f'/subscriptions/{self.subscription_uid}')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['detail'], 'Subscription is still referenced')
+        
+        response = self.client.delete(f'/subscriptions/{self.subscription_uid}', params={'on_delete': 'cascade'})
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get(f'/subscription-instances/{instance_uid}').status_code, 404)
+    
+    def test_delete_missing_subscription_cascade(self) -> None:
+        response = self.client.delete('/subscriptions/missing', params={'on_delete': 'cascade'})
+        self.assertEqual(response.status_code, 404)
+    
+    def test_delete_transaction_unlinks_instance(self) -> None:
+        category_uid = self.client.post('/categories/', json={'name': 'Streaming'}).json()['uid']
+        account_uid = self.client.post('/accounts/', json={'name': 'Card'}).json()['uid']
+        transaction_uid = self.client.post('/transactions/', json={
+            'name': 'Netflix', 'amount': 15.99, 'date': '2024-01-15',
+            'account_id': account_uid, 'category_id': category_uid
+        }).json()['uid']
+        instance_uid = self.client.post('/subscription-instances/', json={
+            'subscription_id': self.subscription_uid, 'amount': 15.99,
+            'due_date': '2024-01-15', 'transaction_id': transaction_uid, 'status': 'paid'
+        }).json()['uid']
+        
+        response = self.client.delete(f'/transactions/{transaction_uid}')
+        self.assertEqual(response.status_code, 204)
+        instance = self.client.get(f'/subscription-instances/{instance_uid}').json()
+        self.assertIsNone(instance['transaction_id'])
 
 
 if __name__ == '__main__':
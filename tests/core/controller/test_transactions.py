@@ -2,9 +2,12 @@ import unittest
 import os
 import tempfile
 from datetime import date
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 from core.main import app
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool
+from core.controller.transactions import transaction_controller
+from core.utils import encode_cursor
 
 
 class TestCategoryAPI(unittest.TestCase):
@@ -17,6 +20,7 @@ class TestCategoryAPI(unittest.TestCase):
         self.client = TestClient(app)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -53,6 +57,30 @@ class TestCategoryAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()['name'], 'Updated')
     
+    def test_batch(self) -> None:
+        existing = self.client.post('/categories/', json={'name': 'Existing'}).json()['uid']
+        doomed = self.client.post('/categories/', json={'name': 'Doomed'}).json()['uid']
+        
+        response = self.client.post('/categories/batch', json={
+            'create': [{'name': 'Food'}, {'name': 'Existing'}],
+            'update': [{'uid': existing, 'data': {'name': 'Renamed'}},
+                       {'uid': 'missing', 'data': {'name': 'Ghost'}}],
+            'delete': [doomed]
+        })
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['succeeded'], 3)
+        self.assertEqual(body['failed'], 2)
+        self.assertEqual([r['status_code'] for r in body['results']], [201, 409, 200, 404, 204])
+        self.assertEqual(body['results'][0]['data']['name'], 'Food')
+        
+        names = sorted(c['name'] for c in self.client.get('/categories/').json())
+        self.assertEqual(names, ['Food', 'Renamed'])
+    
+    def test_batch_rejects_empty(self) -> None:
+        response = self.client.post('/categories/batch', json={})
+        self.assertEqual(response.status_code, 422)
+    
     def test_delete(self) -> None:
         create_response = self.client.post('/categories/', json={'name': 'Delete Me'})
         uid = create_response.json()['uid']
@@ -71,6 +99,7 @@ class TestAccountAPI(unittest.TestCase):
         self.client = TestClient(app)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -132,6 +161,7 @@ class TestTransactionAPI(unittest.TestCase):
         self.account_uid = account_response.json()['uid']
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -178,6 +208,151 @@ class TestTransactionAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 2)
     
+    def test_get_all_paginated(self) -> None:
+        for day in range(1, 6):
+            self.client.post('/transactions/', json={
+                'name': f'Item {day}', 'amount': 10.0, 'date': f'2024-01-0{6 - day}',
+                'account_id': self.account_uid, 'category_id': self.category_uid
+            })
+        
+        first = self.client.get('/transactions/', params={'limit': 2})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual([t['date'] for t in first.json()], ['2024-01-01', '2024-01-02'])
+        
+        cursor = first.headers['X-Next-Cursor']
+        second = self.client.get('/transactions/', params={'limit': 2, 'cursor': cursor})
+        self.assertEqual([t['date'] for t in second.json()], ['2024-01-03', '2024-01-04'])
+        
+        last = self.client.get('/transactions/', params={'limit': 2, 'cursor': second.headers['X-Next-Cursor']})
+        self.assertEqual([t['date'] for t in last.json()], ['2024-01-05'])
+        self.assertNotIn('X-Next-Cursor', last.headers)
+    
+    def test_get_all_filtered(self) -> None:
+        other_account = self.client.post('/accounts/', json={'name': 'Savings'}).json()['uid']
+        rows = [
+            ('Coffee', 4.5, '2024-01-05', self.account_uid),
+            ('Coffee beans', 18.0, '2024-02-10', self.account_uid),
+            ('Rent', 900.0, '2024-01-31', self.account_uid),
+            ('Coffee', 5.0, '2024-01-20', other_account),
+        ]
+        for name, amount, day, account in rows:
+            self.client.post('/transactions/', json={
+                'name': name, 'amount': amount, 'date': day,
+                'account_id': account, 'category_id': self.category_uid
+            })
+        
+        response = self.client.get('/transactions/', params={
+            'account_id': self.account_uid, 'date_from': '2024-01-01', 'date_to': '2024-01-31'
+        })
+        self.assertEqual([t['name'] for t in response.json()], ['Coffee', 'Rent'])
+        
+        response = self.client.get('/transactions/', params={'name_prefix': 'Coffee', 'sort': '-date'})
+        self.assertEqual([t['date'] for t in response.json()], ['2024-02-10', '2024-01-20', '2024-01-05'])
+        
+        response = self.client.get('/transactions/', params={'min_amount': 5, 'max_amount': 100, 'limit': 1})
+        self.assertEqual([t['name'] for t in response.json()], ['Coffee'])
+        cursor = response.headers['X-Next-Cursor']
+        response = self.client.get('/transactions/', params={
+            'min_amount': 5, 'max_amount': 100, 'limit': 1, 'cursor': cursor
+        })
+        self.assertEqual([t['name'] for t in response.json()], ['Coffee beans'])
+        self.assertNotIn('X-Next-Cursor', response.headers)
+    
+    def test_get_view(self) -> None:
+        other_account = self.client.post('/accounts/', json={'name': 'Savings'}).json()['uid']
+        for name, day, account in [('Rent', '2024-01-01', self.account_uid), ('Coffee', '2024-01-02', other_account),
+                                   ('Lunch', '2024-01-03', self.account_uid)]:
+            self.client.post('/transactions/', json={
+                'name': name, 'amount': 10.0, 'date': day,
+                'account_id': account, 'category_id': self.category_uid
+            })
+        
+        response = self.client.get('/transactions/view', params={'account_id': self.account_uid, 'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([(t['name'], t['account_name'], t['category_name']) for t in data],
+                         [('Rent', 'Checking', 'Groceries')])
+        
+        response = self.client.get('/transactions/view', params={
+            'account_id': self.account_uid, 'limit': 1, 'cursor': response.headers['X-Next-Cursor']
+        })
+        self.assertEqual([t['name'] for t in response.json()], ['Lunch'])
+        self.assertNotIn('X-Next-Cursor', response.headers)
+        
+        response = self.client.get('/transactions/view', params={'name_prefix': 'Co'})
+        self.assertEqual([t['account_name'] for t in response.json()], ['Savings'])
+    
+    def test_view_etag_tracks_joined_tables(self) -> None:
+        first = self.client.get('/transactions/view')
+        self.assertEqual(self.client.get('/transactions/view', headers={'If-None-Match': first.headers['ETag']}).status_code, 304)
+        
+        self.client.put(f'/accounts/{self.account_uid}', json={'name': 'Current'})
+        response = self.client.get('/transactions/view', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], first.headers['ETag'])
+    
+    def test_get_all_invalid_filter_range(self) -> None:
+        response = self.client.get('/transactions/', params={'date_from': '2024-02-01', 'date_to': '2024-01-01'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_batch_validates_dependencies_per_item(self) -> None:
+        response = self.client.post('/transactions/batch', json={'create': [
+            {'name': 'Ok', 'amount': 1.0, 'date': '2024-01-01',
+             'account_id': self.account_uid, 'category_id': self.category_uid},
+            {'name': 'Bad', 'amount': 1.0, 'date': '2024-01-01',
+             'account_id': 'missing', 'category_id': self.category_uid},
+        ]})
+        results = response.json()['results']
+        self.assertEqual([r['status_code'] for r in results], [201, 404])
+        self.assertEqual(results[1]['detail'], 'Account not found')
+        self.assertEqual(len(self.client.get('/transactions/').json()), 1)
+    
+    def test_create_missing_category(self) -> None:
+        response = self.client.post('/transactions/', json={
+            'name': 'Orphan', 'amount': 1.0, 'date': '2024-01-01',
+            'account_id': self.account_uid, 'category_id': 'missing'
+        })
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['detail'], 'Category not found')
+    
+    def test_writes_skip_reference_reads(self) -> None:
+        items = [
+            {'name': f'Item {i}', 'amount': 1.0, 'date': '2024-01-01',
+             'account_id': self.account_uid, 'category_id': self.category_uid}
+            for i in range(20)
+        ]
+        with patch.object(transaction_controller.reference_checker, 'find_missing',
+                          wraps=transaction_controller.reference_checker.find_missing) as spy:
+            response = self.client.post('/transactions/batch', json={'create': items})
+        self.assertEqual(response.json()['succeeded'], 20)
+        spy.assert_not_called()
+    
+    def test_delete_referenced_account_conflict(self) -> None:
+        self.client.post('/transactions/', json={
+            'name': 'Rent', 'amount': 900.0, 'date': '2024-01-01',
+            'account_id': self.account_uid, 'category_id': self.category_uid
+        })
+        response = self.client.delete(f'/accounts/{self.account_uid}')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['detail'], 'Account is still referenced')
+        self.assertEqual(self.client.get(f'/accounts/{self.account_uid}').status_code, 200)
+    
+    def test_update_missing_transaction(self) -> None:
+        response = self.client.put('/transactions/missing', json={
+            'name': 'Ghost', 'amount': 1.0, 'date': '2024-01-01',
+            'account_id': self.account_uid, 'category_id': self.category_uid
+        })
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['detail'], 'Transaction not found')
+    
+    def test_get_all_invalid_cursor(self) -> None:
+        response = self.client.get('/transactions/', params={'limit': 2, 'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+        
+        for values in ([['2024-01-01'], 'uid'], ['2024-01-01', {'uid': 'x'}]):
+            response = self.client.get('/transactions/', params={'limit': 2, 'cursor': encode_cursor(values)})
+            self.assertEqual(response.status_code, 400)
+    
     def test_update(self) -> None:
         create_response = self.client.post('/transactions/', json={
             'name': 'Original', 'amount': 100.0, 'date': '2024-01-01',
@@ -202,6 +377,36 @@ class TestTransactionAPI(unittest.TestCase):
         response = self.client.delete(f'/transactions/{uid}')
         self.assertEqual(response.status_code, 204)
 
+    
+    def test_account_balance_as_of(self) -> None:
+        for amount, day in [(100.0, '2024-01-10'), (30.0, '2024-02-03'), (20.0, '2024-02-20'), (5.0, '2024-04-01')]:
+            self.client.post('/transactions/', json={
+                'name': 'Item', 'amount': amount, 'date': day,
+                'account_id': self.account_uid, 'category_id': self.category_uid
+            })
+        
+        def balance(as_of: str) -> float:
+            response = self.client.get(f'/accounts/{self.account_uid}/balance', params={'as_of': as_of})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['as_of'], as_of)
+            return response.json()['balance']
+        
+        self.assertEqual(balance('2023-12-31'), 0.0)
+        self.assertEqual(balance('2024-01-10'), 100.0)
+        self.assertEqual(balance('2024-02-10'), 130.0)
+        self.assertEqual(balance('2024-03-15'), 150.0)
+        self.assertEqual(balance('2024-04-01'), 155.0)
+        
+        # A backdated write moves every later balance
+        self.client.post('/transactions/', json={
+            'name': 'Refund', 'amount': 10.0, 'date': '2024-01-05',
+            'account_id': self.account_uid, 'category_id': self.category_uid
+        })
+        self.assertEqual(balance('2024-03-15'), 160.0)
+        
+        response = self.client.get('/accounts/missing/balance')
+        self.assertEqual(response.status_code, 404)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from core.storage.init_db import init_database, close_pool, get_connection, transaction
+from core.storage.pool import ConnectionPool
+from core.domain import Category, Account
+from core.repositories import (
+    CategoryRepository, AccountRepository, BaseRepository, bump_table_versions, cache_stats, clear_caches
+)
+
+
+class TestCachedRepository(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        clear_caches()
+        self.repo = CategoryRepository()
+        self.repo.create(Category(uid='cat-1', name='Food'))
+        self.repo.create(Category(uid='cat-2', name='Rent'))
+    
+    def tearDown(self) -> None:
+        clear_caches()
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        for key in ['MONEY_MANAGER_DB', 'MONEY_MANAGER_CACHE_TTL', 'MONEY_MANAGER_CACHE_CHECK_INTERVAL']:
+            if key in os.environ:
+                del os.environ[key]
+    
+    def test_reads_served_from_snapshot(self) -> None:
+        self.assertEqual(len(self.repo.get_all()), 2)
+        with patch.object(ConnectionPool, 'acquire', side_effect=AssertionError("hit touched SQLite")), \
+                patch.object(BaseRepository, 'get_all') as load, patch.object(BaseRepository, 'get_by_id') as lookup:
+            self.assertEqual(self.repo.get_by_id('cat-1').name, 'Food')
+            self.assertIsNone(self.repo.get_by_id('missing'))
+            self.assertEqual(len(CategoryRepository().get_all()), 2)
+        load.assert_not_called()
+        lookup.assert_not_called()
+        self.assertEqual(cache_stats()['categories'], {'hits': 3, 'misses': 1, 'size': 2})
+    
+    def test_write_through_invalidation(self) -> None:
+        self.repo.get_all()
+        self.repo.update(Category(uid='cat-1', name='Groceries'))
+        self.assertEqual(self.repo.get_by_id('cat-1').name, 'Groceries')
+        self.repo.create(Category(uid='cat-3', name='Travel'))
+        self.assertEqual(len(self.repo.get_all()), 3)
+        self.repo.delete('cat-3')
+        self.assertIsNone(self.repo.get_by_id('cat-3'))
+        self.repo.create_many([Category(uid='cat-4', name='Gifts')])
+        self.assertIsNotNone(self.repo.get_by_id('cat-4'))
+    
+    def test_returned_entities_are_copies(self) -> None:
+        self.repo.get_by_id('cat-1').name = 'Mutated'
+        self.assertEqual(self.repo.get_by_id('cat-1').name, 'Food')
+    
+    def test_tables_cached_separately(self) -> None:
+        accounts = AccountRepository()
+        accounts.create(Account(uid='acc-1', name='Bank'))
+        self.repo.get_all()
+        accounts.get_all()
+        self.repo.create(Category(uid='cat-3', name='Travel'))
+        self.assertEqual(len(accounts.get_all()), 1)
+        self.assertEqual(cache_stats()['accounts']['hits'], 1)
+    
+    def test_rolled_back_transaction_not_cached(self) -> None:
+        self.repo.get_all()
+        with self.assertRaises(RuntimeError):
+            with transaction():
+                self.repo.create(Category(uid='cat-tx', name='Pending'))
+                self.assertIsNotNone(self.repo.get_by_id('cat-tx'))
+                raise RuntimeError("rollback")
+        self.assertIsNone(self.repo.get_by_id('cat-tx'))
+        self.assertEqual(len(self.repo.get_all()), 2)
+    
+    def test_versioned_writes_of_other_processes_visible(self) -> None:
+        os.environ['MONEY_MANAGER_CACHE_CHECK_INTERVAL'] = '0'
+        clear_caches()
+        self.repo.get_all()
+        with get_connection() as connection:
+            connection.execute("UPDATE categories SET name = 'Groceries' WHERE uid = 'cat-1'")
+            bump_table_versions(connection=connection, tables=['categories'])
+            connection.commit()
+        self.assertEqual(self.repo.get_by_id('cat-1').name, 'Groceries')
+        self.assertEqual(cache_stats()['categories'], {'hits': 0, 'misses': 2, 'size': 2})
+    
+    def test_external_writes_visible_after_ttl(self) -> None:
+        os.environ['MONEY_MANAGER_CACHE_TTL'] = '0'
+        clear_caches()
+        self.repo.get_all()
+        with get_connection() as connection:
+            connection.execute("INSERT INTO categories VALUES ('cat-x', 'External')")
+            connection.commit()
+        self.assertIsNotNone(self.repo.get_by_id('cat-x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
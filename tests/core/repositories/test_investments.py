@@ -2,7 +2,7 @@ import unittest
 import os
 import tempfile
 from datetime import date
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool
 from core.domain import Investment, InvestmentValueSnapshot, InvestmentPlan, InvestmentPlanInstance
 from core.domain.base import InvestmentStatus, Frequency, InvestmentPlanStatus, InvestmentPlanInstanceStatus
 from core.repositories import (
@@ -23,6 +23,7 @@ class TestInvestmentRepository(unittest.TestCase):
         self.repo = InvestmentRepository()
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -103,6 +104,7 @@ class TestInvestmentValueSnapshotRepository(unittest.TestCase):
         self.inv_repo.create(self.investment)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -183,6 +185,7 @@ class TestInvestmentPlanRepository(unittest.TestCase):
         self.inv_repo.create(self.investment)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -296,6 +299,7 @@ class TestInvestmentPlanInstanceRepository(unittest.TestCase):
         self.plan_repo.create(self.plan)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -0,0 +1,50 @@
+import unittest
+import os
+import tempfile
+from core.storage.init_db import init_database, close_pool
+from core.domain import Category, Account
+from core.repositories import CategoryRepository, AccountRepository, ReferenceChecker
+from core.repositories.references import MAX_IN_PARAMS
+
+
+class TestReferenceChecker(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        self.category_repo = CategoryRepository()
+        self.account_repo = AccountRepository()
+        self.category_repo.create(Category(uid='cat-1', name='Food'))
+        self.account_repo.create(Account(uid='acc-1', name='Bank'))
+
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+
+    def test_find_missing_across_tables(self) -> None:
+        checker = ReferenceChecker()
+        missing = checker.find_missing({
+            'accounts': {'acc-1', 'acc-x'},
+            'categories': {'cat-1', 'cat-x'},
+        })
+        self.assertEqual(missing, {'accounts': {'acc-x'}, 'categories': {'cat-x'}})
+
+    def test_find_missing_empty(self) -> None:
+        checker = ReferenceChecker()
+        self.assertEqual(checker.find_missing({'accounts': set()}), {})
+
+    def test_find_missing_large_id_set(self) -> None:
+        self.category_repo.create_many([Category(uid=f'bulk-{i}', name=f'Bulk {i}') for i in range(2000)])
+        uids = {f'bulk-{i}' for i in range(2000)} | {'bulk-missing'}
+        self.assertGreater(len(uids), MAX_IN_PARAMS)
+        checker = ReferenceChecker()
+        self.assertEqual(checker.find_missing({'categories': uids}), {'categories': {'bulk-missing'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
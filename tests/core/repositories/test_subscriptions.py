@@ -2,7 +2,7 @@ import unittest
 import os
 import tempfile
 from datetime import date
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool
 from core.domain import Subscription, SubscriptionInstance
 from core.domain.base import Frequency, SubscriptionStatus, SubscriptionInstanceStatus
 from core.repositories import SubscriptionRepository, SubscriptionInstanceRepository
@@ -18,6 +18,7 @@ class TestSubscriptionRepository(unittest.TestCase):
         self.repo = SubscriptionRepository()
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -66,6 +67,21 @@ class TestSubscriptionRepository(unittest.TestCase):
         subscriptions = self.repo.get_all()
         self.assertEqual(len(subscriptions), 2)
     
+    def test_create_many_reports_duplicates(self) -> None:
+        self.repo.create(Subscription(uid='sub-x', name='Existing', amount=5.0,
+                                      frequency=Frequency.MONTHLY, interval=1, due_day=1,
+                                      due_month=None, status=SubscriptionStatus.ACTIVE))
+        names = ['A', 'Existing', 'B', 'C', 'A']
+        subscriptions = [
+            Subscription(uid=f'sub-b{i}', name=name, amount=10.0, frequency=Frequency.MONTHLY,
+                         interval=1, due_day=1, due_month=None, status=SubscriptionStatus.ACTIVE)
+            for i, name in enumerate(names)
+        ]
+        result = self.repo.create_many(subscriptions, batch_size=2)
+        self.assertEqual(result.created, ['sub-b0', 'sub-b2', 'sub-b3'])
+        self.assertEqual([index for index, _ in result.failed], [1, 4])
+        self.assertEqual(len(self.repo.get_all()), 4)
+    
     def test_update(self) -> None:
         subscription = Subscription(
             uid='sub-5',
@@ -122,6 +138,7 @@ class TestSubscriptionInstanceRepository(unittest.TestCase):
         self.sub_repo.create(self.subscription)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
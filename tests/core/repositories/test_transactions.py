@@ -2,9 +2,12 @@ import unittest
 import os
 import tempfile
 from datetime import date
-from core.storage.init_db import init_database
+from core.storage.init_db import init_database, close_pool, get_connection
 from core.domain import Category, Account, Transaction
-from core.repositories import CategoryRepository, AccountRepository, TransactionRepository
+from core.repositories import (
+    CategoryRepository, AccountRepository, TransactionRepository, TransactionFilter, rebuild_monthly_rollup,
+    rebuild_balance_checkpoints, get_table_versions
+)
 
 
 class TestCategoryRepository(unittest.TestCase):
@@ -17,6 +20,7 @@ class TestCategoryRepository(unittest.TestCase):
         self.repo = CategoryRepository()
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -67,6 +71,7 @@ class TestAccountRepository(unittest.TestCase):
         self.repo = AccountRepository()
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -123,6 +128,7 @@ class TestTransactionRepository(unittest.TestCase):
         self.account_repo.create(self.account)
     
     def tearDown(self) -> None:
+        close_pool()
         if os.path.exists(self.test_db.name):
             os.unlink(self.test_db.name)
         if 'MONEY_MANAGER_DB' in os.environ:
@@ -165,6 +171,28 @@ class TestTransactionRepository(unittest.TestCase):
         transactions = self.repo.get_all()
         self.assertEqual(len(transactions), 2)
     
+    def test_get_page(self) -> None:
+        for i in range(5):
+            self.repo.create(Transaction(uid=f'txn-p{i}', name=f'Item {i}', amount=10.0,
+                                         date=date(2024, 1, 1), account_id=self.account.uid,
+                                         category_id=self.category.uid))
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page, cursor = self.repo.get_page(limit=2, cursor=cursor)
+            seen.extend(txn.uid for txn in page)
+            if cursor is None:
+                break
+        self.assertEqual(seen, [f'txn-p{i}' for i in range(5)])
+    
+    def test_find_name_prefix_escapes_wildcards(self) -> None:
+        for uid, name in [('txn-w1', '100% refund'), ('txn-w2', '100 coffee')]:
+            self.repo.create(Transaction(uid=uid, name=name, amount=1.0, date=date(2024, 1, 1),
+                                         account_id=self.account.uid, category_id=self.category.uid))
+        found, cursor = self.repo.find(TransactionFilter(name_prefix='100%'))
+        self.assertEqual([txn.uid for txn in found], ['txn-w1'])
+        self.assertIsNone(cursor)
+    
     def test_update(self) -> None:
         transaction = Transaction(
             uid='txn-5',
@@ -193,6 +221,97 @@ class TestTransactionRepository(unittest.TestCase):
         self.assertTrue(result)
 
 
+
+class TestTransactionMonthlyRollup(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        
+        CategoryRepository().create(Category(uid='cat-1', name='Groceries'))
+        CategoryRepository().create(Category(uid='cat-2', name='Rent'))
+        AccountRepository().create(Account(uid='acc-1', name='Checking'))
+        self.repo = TransactionRepository()
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def _rollup(self) -> list[tuple]:
+        with get_connection() as connection:
+            return connection.execute(
+                "SELECT month, account_id, category_id, count, total FROM transaction_monthly_rollup ORDER BY 1, 2, 3"
+            ).fetchall()
+    
+    def _transaction(self, uid: str, amount: float, day: date, category_id: str = 'cat-1') -> Transaction:
+        return Transaction(uid=uid, name=uid, amount=amount, date=day, account_id='acc-1', category_id=category_id)
+    
+    def test_writes_keep_rollup_current(self) -> None:
+        self.repo.create(self._transaction('txn-1', 10.0, date(2024, 1, 5)))
+        self.repo.create(self._transaction('txn-2', 20.0, date(2024, 1, 20)))
+        self.assertEqual(self._rollup(), [('2024-01', 'acc-1', 'cat-1', 2, 30.0)])
+        
+        self.repo.update(self._transaction('txn-2', 25.0, date(2024, 2, 1), category_id='cat-2'))
+        self.assertEqual(self._rollup(), [('2024-01', 'acc-1', 'cat-1', 1, 10.0),
+                                          ('2024-02', 'acc-1', 'cat-2', 1, 25.0)])
+        
+        self.repo.delete('txn-1')
+        self.assertEqual(self._rollup(), [('2024-02', 'acc-1', 'cat-2', 1, 25.0)])
+        self.assertFalse(self.repo.delete('txn-1'))
+        self.assertFalse(self.repo.update(self._transaction('missing', 5.0, date(2024, 2, 1))))
+        self.assertEqual(self._rollup(), [('2024-02', 'acc-1', 'cat-2', 1, 25.0)])
+    
+    def test_create_many_counts_only_created_rows(self) -> None:
+        self.repo.create(self._transaction('txn-1', 10.0, date(2024, 1, 5)))
+        result = self.repo.create_many([
+            self._transaction('txn-1', 99.0, date(2024, 1, 6)),
+            self._transaction('txn-2', 5.0, date(2024, 1, 7)),
+            Transaction(uid='txn-3', name='Bad', amount=1.0, date=date(2024, 1, 8),
+                        account_id='missing', category_id='cat-1'),
+        ])
+        self.assertEqual([index for index, _ in result.failed], [0, 2])
+        self.assertEqual(self._rollup(), [('2024-01', 'acc-1', 'cat-1', 2, 15.0)])
+    
+    def test_rebuild_matches_incremental(self) -> None:
+        self.repo.create_many([self._transaction(f'txn-{i}', 1.5 * i, date(2024, 1 + i % 3, 1 + i))
+                               for i in range(12)])
+        incremental = self._rollup()
+        with get_connection() as connection:
+            connection.execute("DELETE FROM transaction_monthly_rollup")
+            connection.commit()
+        version = get_table_versions(tables=['transactions'])[0].version
+        self.assertEqual(rebuild_monthly_rollup(), 3)
+        self.assertEqual(self._rollup(), incremental)
+        self.assertEqual(rebuild_balance_checkpoints(), 3)
+        self.assertEqual(get_table_versions(tables=['transactions'])[0].version, version + 2)
+    
+    def test_checkpoints_follow_writes(self) -> None:
+        def checkpoints() -> list[tuple]:
+            with get_connection() as connection:
+                return connection.execute(
+                    "SELECT month, balance FROM account_balance_checkpoints WHERE account_id = 'acc-1' ORDER BY month"
+                ).fetchall()
+        
+        self.repo.create(self._transaction('txn-1', 100.0, date(2024, 1, 5)))
+        self.repo.create(self._transaction('txn-2', -40.0, date(2024, 3, 5)))
+        self.assertEqual(checkpoints(), [('2024-01', 100.0), ('2024-03', 60.0)])
+        
+        self.repo.create(self._transaction('txn-3', -10.0, date(2024, 2, 5)))
+        self.repo.update(self._transaction('txn-1', 120.0, date(2024, 1, 5)))
+        self.assertEqual(checkpoints(), [('2024-01', 120.0), ('2024-02', 110.0), ('2024-03', 70.0)])
+        
+        self.repo.delete('txn-3')
+        incremental = checkpoints()
+        self.assertEqual(incremental, [('2024-01', 120.0), ('2024-02', 120.0), ('2024-03', 80.0)])
+        self.assertEqual(rebuild_balance_checkpoints(), 2)
+        self.assertEqual(checkpoints(), [('2024-01', 120.0), ('2024-03', 80.0)])
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,49 @@
+import unittest
+import pandas as pd
+from core.services import compute_performance
+
+
+def frame(rows: list[tuple], value_column: str) -> pd.DataFrame:
+    data = pd.DataFrame(rows, columns=['investment_id', 'date', value_column])
+    data['investment_id'] = data['investment_id'].astype(str)
+    data['date'] = pd.to_datetime(data['date'])
+    data[value_column] = data[value_column].astype(float)
+    return data
+
+
+class TestComputePerformance(unittest.TestCase):
+
+    def test_returns_with_contributions(self) -> None:
+        snapshots = frame([('a', '2023-01-01', 1000.0), ('a', '2023-07-01', 1600.0), ('a', '2024-01-01', 2200.0)], 'value')
+        contributions = frame([('a', '2022-12-01', 999.0),   # part of the opening value
+                               ('a', '2023-03-01', 500.0),
+                               ('a', '2024-06-01', 100.0)],  # after the last snapshot
+                              'amount')
+        result = compute_performance(snapshots, contributions).loc['a']
+        self.assertEqual(result['contributions'], 500.0)
+        self.assertEqual(result['absolute_gain'], 700.0)
+        self.assertAlmostEqual(result['twr'], 1600 / 1500 * 2200 / 1600 - 1)
+        # The rate discounts every flow to a zero net present value
+        years = [0.0, 59 / 365, 1.0]
+        npv = sum(amount / (1 + result['xirr']) ** t for amount, t in zip([-1000.0, -500.0, 2200.0], years))
+        self.assertAlmostEqual(npv, 0.0, places=6)
+
+    def test_investments_evaluated_together(self) -> None:
+        snapshots = frame([('a', '2024-01-01', 100.0), ('a', '2025-01-01', 110.0),
+                           ('b', '2024-01-01', 200.0), ('b', '2024-07-01', 100.0), ('b', '2025-01-01', 150.0),
+                           ('c', '2024-01-01', 50.0)], 'value')
+        result = compute_performance(snapshots, frame([], 'amount'))
+        self.assertAlmostEqual(result.loc['a', 'twr'], 0.1)
+        self.assertAlmostEqual(result.loc['a', 'xirr'], 1.1 ** (365 / 366) - 1)
+        self.assertAlmostEqual(result.loc['b', 'twr'], -0.25)
+        self.assertEqual(result.loc['b', 'absolute_gain'], -50.0)
+        self.assertEqual(result.loc['c', 'current_value'], 50.0)
+        self.assertTrue(pd.isna(result.loc['c', ['absolute_gain', 'twr', 'xirr']]).all())
+
+    def test_no_snapshots(self) -> None:
+        result = compute_performance(frame([], 'value'), frame([('a', '2024-01-01', 5.0)], 'amount'))
+        self.assertTrue(result.empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
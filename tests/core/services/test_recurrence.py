@@ -0,0 +1,40 @@
+import unittest
+from datetime import date
+from core.domain.base import Frequency
+from core.services import Schedule, expand_due_dates
+
+
+class TestExpandDueDates(unittest.TestCase):
+
+    def test_monthly_clamps_month_end(self) -> None:
+        schedule = Schedule(uid='s', frequency=Frequency.MONTHLY, interval=1, due_day=31, due_month=None)
+        dates = expand_due_dates(schedule, start=date(2024, 1, 1), until=date(2024, 4, 30))
+        self.assertEqual(dates, [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)])
+
+    def test_first_date_not_before_start(self) -> None:
+        schedule = Schedule(uid='s', frequency=Frequency.MONTHLY, interval=1, due_day=10, due_month=None)
+        dates = expand_due_dates(schedule, start=date(2024, 1, 15), until=date(2024, 3, 5))
+        self.assertEqual(dates, [date(2024, 2, 10)])
+
+    def test_interval_follows_anchor(self) -> None:
+        schedule = Schedule(uid='s', frequency=Frequency.MONTHLY, interval=3, due_day=1, due_month=None)
+        dates = expand_due_dates(schedule, start=date(2024, 1, 1), until=date(2024, 12, 31), anchor=date(2023, 2, 1))
+        self.assertEqual(dates, [date(2024, 2, 1), date(2024, 5, 1), date(2024, 8, 1), date(2024, 11, 1)])
+
+    def test_yearly_uses_due_month(self) -> None:
+        schedule = Schedule(uid='s', frequency=Frequency.YEARLY, interval=1, due_day=29, due_month=2)
+        dates = expand_due_dates(schedule, start=date(2024, 3, 1), until=date(2028, 12, 31))
+        self.assertEqual(dates, [date(2025, 2, 28), date(2026, 2, 28), date(2027, 2, 28), date(2028, 2, 29)])
+
+    def test_yearly_interval_follows_anchor_year(self) -> None:
+        schedule = Schedule(uid='s', frequency=Frequency.YEARLY, interval=2, due_day=15, due_month=6)
+        dates = expand_due_dates(schedule, start=date(2024, 1, 1), until=date(2029, 12, 31), anchor=date(2021, 6, 15))
+        self.assertEqual(dates, [date(2025, 6, 15), date(2027, 6, 15), date(2029, 6, 15)])
+
+    def test_window_before_first_due_date(self) -> None:
+        schedule = Schedule(uid='s', frequency=Frequency.YEARLY, interval=1, due_day=1, due_month=12)
+        self.assertEqual(expand_due_dates(schedule, start=date(2024, 1, 1), until=date(2024, 6, 30)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
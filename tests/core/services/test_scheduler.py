@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+import os
+import tempfile
+from datetime import date
+from core.storage.init_db import init_database, close_pool
+from core.domain import Subscription, SubscriptionInstance, Investment, InvestmentPlan, InvestmentPlanInstance
+from core.domain.base import (
+    Frequency, SubscriptionStatus, SubscriptionInstanceStatus,
+    InvestmentStatus, InvestmentPlanStatus, InvestmentPlanInstanceStatus
+)
+from core.repositories import (
+    SubscriptionRepository, SubscriptionInstanceRepository,
+    InvestmentRepository, InvestmentPlanRepository, InvestmentPlanInstanceRepository
+)
+from core.services import StatusSweepService, SweepScheduler
+
+
+class TestStatusSweep(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+
+        SubscriptionRepository().create(Subscription(
+            uid='sub-1', name='Netflix', amount=15.99, frequency=Frequency.MONTHLY,
+            interval=1, due_day=15, due_month=None, status=SubscriptionStatus.ACTIVE
+        ))
+        self.instance_repo = SubscriptionInstanceRepository()
+        for uid, due_date, status in [('due-past', date(2024, 1, 15), SubscriptionInstanceStatus.DUE),
+                                      ('paid-past', date(2024, 1, 10), SubscriptionInstanceStatus.PAID),
+                                      ('due-today', date(2024, 2, 15), SubscriptionInstanceStatus.DUE)]:
+            self.instance_repo.create(SubscriptionInstance(
+                uid=uid, subscription_id='sub-1', amount=15.99, due_date=due_date,
+                transaction_id=None, status=status
+            ))
+
+        InvestmentRepository().create(Investment(
+            uid='inv-1', name='Index Fund', start_date=date(2024, 1, 1), status=InvestmentStatus.ACTIVE
+        ))
+        InvestmentPlanRepository().create(InvestmentPlan(
+            uid='plan-1', investment_id='inv-1', amount=500.0, frequency=Frequency.MONTHLY,
+            interval=1, due_day=1, due_month=None, status=InvestmentPlanStatus.ACTIVE
+        ))
+        self.plan_instance_repo = InvestmentPlanInstanceRepository()
+        self.plan_instance_repo.create(InvestmentPlanInstance(
+            uid='planned-past', investment_plan_id='plan-1', amount=500.0, due_date=date(2024, 2, 1),
+            transaction_id=None, status=InvestmentPlanInstanceStatus.PLANNED
+        ))
+
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+
+    def test_sweep_marks_past_due(self) -> None:
+        rows = StatusSweepService().sweep(as_of=date(2024, 2, 15))
+        self.assertEqual(rows, {'subscription_instances_overdue': 1, 'plan_instances_skipped': 1})
+
+        statuses = {instance.uid: instance.status for instance in self.instance_repo.get_all()}
+        self.assertEqual(statuses, {
+            'due-past': SubscriptionInstanceStatus.OVERDUE,
+            'paid-past': SubscriptionInstanceStatus.PAID,
+            'due-today': SubscriptionInstanceStatus.DUE,
+        })
+        self.assertEqual(self.plan_instance_repo.get_by_id('planned-past').status, InvestmentPlanInstanceStatus.SKIPPED)
+
+        rows = StatusSweepService().sweep(as_of=date(2024, 2, 15))
+        self.assertEqual(rows, {'subscription_instances_overdue': 0, 'plan_instances_skipped': 0})
+
+    def test_lease_allows_one_scheduler(self) -> None:
+        first = SweepScheduler(interval=60)
+        second = SweepScheduler(interval=60)
+
+        async def scenario() -> list[bool]:
+            results = [await first.run_once(), await second.run_once(), await first.run_once()]
+            await first.stop()
+            results.append(await second.run_once())
+            return results
+
+        self.assertEqual(asyncio.run(scenario()), [True, False, True, True])
+        self.assertEqual(first.runs, 2)
+        status = second.status()
+        self.assertTrue(status['lease_held'])
+        self.assertEqual(status['runs'], 1)
+        self.assertIsNotNone(status['last_duration_ms'])
+        self.assertIsNone(status['last_error'])
+
+    def test_expired_lease_is_taken_over(self) -> None:
+        first = SweepScheduler(interval=60, lease_ttl=0)
+        second = SweepScheduler(interval=60)
+
+        async def scenario() -> list[bool]:
+            return [await first.run_once(), await second.run_once()]
+
+        self.assertEqual(asyncio.run(scenario()), [True, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import os
+import io
+import tempfile
+import time
+from datetime import date
+from typing import Any
+import pandas as pd
+from core.storage.init_db import init_database, close_pool
+from core.domain import Account, Category
+from core.repositories import AccountRepository, CategoryRepository
+from core.services import TransactionService
+
+
+def legacy_validate(csv_content: str, accounts: dict[str, str],
+                    categories: dict[str, str]) -> tuple[list[dict[str, Any]], list[str]]:
+    """Row-wise reference implementation the vectorized validator must match"""
+    errors: list[str] = []
+    valid_rows: list[dict[str, Any]] = []
+    df = pd.read_csv(io.StringIO(csv_content))
+    for idx, row in df.iterrows():
+        row_num = int(idx) + 2
+        name = str(row.get('name', '')).strip()
+        if not name:
+            errors.append(f"Row {row_num}: Name is required")
+            continue
+        try:
+            amount = float(row.get('amount', 0))
+            if amount <= 0:
+                errors.append(f"Row {row_num}: Amount must be positive")
+                continue
+        except (TypeError, ValueError):
+            errors.append(f"Row {row_num}: Invalid amount")
+            continue
+        try:
+            date_val = pd.to_datetime(row.get('date')).date()
+        except Exception:
+            errors.append(f"Row {row_num}: Invalid date format (use YYYY-MM-DD)")
+            continue
+        account_name = str(row.get('account', '')).strip()
+        account_id = accounts.get(account_name)
+        if not account_id:
+            errors.append(f"Row {row_num}: Account '{account_name}' not found")
+            continue
+        category_name = str(row.get('category', '')).strip()
+        category_id = categories.get(category_name)
+        if not category_id:
+            errors.append(f"Row {row_num}: Category '{category_name}' not found")
+            continue
+        valid_rows.append({'name': name, 'amount': amount, 'date': date_val,
+                           'account_id': account_id, 'category_id': category_id})
+    return valid_rows, errors
+
+
+def synthetic_csv(rows: int) -> str:
+    lines = ['name,amount,date,account,category']
+    for i in range(rows):
+        lines.append(f"Item {i},{(i % 500) + 0.25},2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d},"
+                     f"Checking,{'Food' if i % 2 else 'Rent'}")
+    return '\n'.join(lines)
+
+
+class TestTransactionCsvValidation(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+        AccountRepository().create(Account(uid='acc-1', name='Checking'))
+        CategoryRepository().create(Category(uid='cat-1', name='Food'))
+        CategoryRepository().create(Category(uid='cat-2', name='Rent'))
+        self.accounts = {'Checking': 'acc-1'}
+        self.categories = {'Food': 'cat-1', 'Rent': 'cat-2'}
+        self.service = TransactionService()
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def test_matches_row_wise_validation(self) -> None:
+        csv_content = """name,amount,date,account,category
+Valid,10.5,2024-01-17,Checking,Food
+Negative,-5.0,2024-01-18,Checking,Food
+Zero,0,2024-01-18,Checking,Food
+Text Amount,abc,2024-01-18,Checking,Food
+Bad Date,10.0,not-a-date,Checking,Food
+Other Format,10.0,01/20/2024,Checking,Rent
+Missing Account,10.0,2024-01-19,Savings,Food
+Missing Category,10.0,2024-01-19,Checking,Travel
+  Padded  ,7,2024-02-29, Checking , Food """
+        expected = legacy_validate(csv_content, self.accounts, self.categories)
+        self.assertEqual(self.service._validate_csv(csv_content), expected)
+    
+    def test_blank_fields_are_errors(self) -> None:
+        csv_content = """name,amount,date,account,category
+,10.0,2024-01-17,Checking,Food
+Blank Amount,,2024-01-17,Checking,Food
+Blank Date,10.0,,Checking,Food"""
+        valid_rows, errors = self.service._validate_csv(csv_content)
+        self.assertEqual(valid_rows, [])
+        self.assertEqual(errors, [
+            "Row 2: Name is required",
+            "Row 3: Invalid amount",
+            "Row 4: Invalid date format (use YYYY-MM-DD)",
+        ])
+    
+    def test_mixed_timezones_match_row_wise_validation(self) -> None:
+        csv_content = """name,amount,date,account,category
+Naive,10.0,2024-01-17,Checking,Food
+Offset,10.0,2024-01-18T23:30:00-05:00,Checking,Food
+Other Offset,10.0,2024-01-19T01:00:00+09:00,Checking,Rent
+Other Format,10.0,01/20/2024 10:00 +0200,Checking,Rent
+Bad Date,10.0,not-a-date,Checking,Food"""
+        expected = legacy_validate(csv_content, self.accounts, self.categories)
+        self.assertEqual(self.service._validate_csv(csv_content), expected)
+        self.assertEqual([row['date'] for row in expected[0]],
+                         [date(2024, 1, 17), date(2024, 1, 18), date(2024, 1, 19), date(2024, 1, 20)])
+
+    def test_synthetic_rows_are_valid(self) -> None:
+        csv_content = synthetic_csv(rows=1_000)
+        valid_rows, errors = self.service._validate_csv(csv_content)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(valid_rows), 1_000)
+        self.assertEqual(valid_rows[0]['date'], date(2024, 1, 1))
+        self.assertEqual((valid_rows, errors), legacy_validate(csv_content, self.accounts, self.categories))
+    
+    @unittest.skipUnless(os.getenv('MONEY_MANAGER_BENCHMARKS'), "set MONEY_MANAGER_BENCHMARKS=1 to run benchmarks")
+    def test_benchmark_row_throughput(self) -> None:
+        """Compare vectorized throughput on 200k rows against the row-wise validator"""
+        csv_content = synthetic_csv(rows=200_000)
+        start = time.perf_counter()
+        self.service._validate_csv(csv_content)
+        vectorized = 200_000 / (time.perf_counter() - start)
+        
+        sample = synthetic_csv(rows=5_000)
+        start = time.perf_counter()
+        legacy_validate(sample, self.accounts, self.categories)
+        row_wise = 5_000 / (time.perf_counter() - start)
+        
+        self.assertGreater(vectorized, row_wise * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+import tempfile
+from core.storage.config import PROFILES, get_storage_profile
+from core.storage.init_db import init_database, get_connection, close_pool
+
+PROFILE_ENV_KEYS: list[str] = [
+    'MONEY_MANAGER_DB_PROFILE',
+    'MONEY_MANAGER_DB_JOURNAL_MODE',
+    'MONEY_MANAGER_DB_SYNCHRONOUS',
+    'MONEY_MANAGER_DB_CACHE_SIZE',
+    'MONEY_MANAGER_DB_BUSY_TIMEOUT',
+]
+
+
+class TestStorageProfile(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        for key in ['MONEY_MANAGER_DB'] + PROFILE_ENV_KEYS:
+            if key in os.environ:
+                del os.environ[key]
+    
+    def test_default_profile(self) -> None:
+        self.assertEqual(get_storage_profile(), PROFILES['performance'])
+    
+    def test_env_overrides(self) -> None:
+        os.environ['MONEY_MANAGER_DB_PROFILE'] = 'durable'
+        os.environ['MONEY_MANAGER_DB_SYNCHRONOUS'] = 'normal'
+        os.environ['MONEY_MANAGER_DB_CACHE_SIZE'] = '-1000'
+        profile = get_storage_profile()
+        self.assertEqual(profile.synchronous, 'NORMAL')
+        self.assertEqual(profile.cache_size, -1000)
+        self.assertEqual(profile.journal_mode, PROFILES['durable'].journal_mode)
+    
+    def test_invalid_values_rejected(self) -> None:
+        os.environ['MONEY_MANAGER_DB_JOURNAL_MODE'] = 'wal; DROP TABLE accounts'
+        with self.assertRaises(ValueError):
+            get_storage_profile()
+        del os.environ['MONEY_MANAGER_DB_JOURNAL_MODE']
+        os.environ['MONEY_MANAGER_DB_PROFILE'] = 'unknown'
+        with self.assertRaises(ValueError):
+            get_storage_profile()
+    
+    def test_profile_applied_to_connections(self) -> None:
+        os.environ['MONEY_MANAGER_DB_BUSY_TIMEOUT'] = '1234'
+        init_database()
+        with get_connection() as connection:
+            journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = connection.execute("PRAGMA synchronous").fetchone()[0]
+            busy_timeout = connection.execute("PRAGMA busy_timeout").fetchone()[0]
+            foreign_keys = connection.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.assertEqual(journal_mode, 'wal')
+        self.assertEqual(synchronous, 1)
+        self.assertEqual(busy_timeout, 1234)
+        self.assertEqual(foreign_keys, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import os
+import tempfile
+from core.storage.init_db import init_database, get_connection, close_pool
+
+
+class TestIndexes(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def _query_plan(self, sql: str, params: tuple = ()) -> str:
+        with get_connection() as connection:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return ' | '.join(row[-1] for row in rows)
+    
+    def assertUsesIndex(self, sql: str, index_name: str, params: tuple = ()) -> None:
+        plan = self._query_plan(sql, params)
+        self.assertIn(index_name, plan, msg=f"Expected {index_name} in plan: {plan}")
+        self.assertNotRegex(plan, r'^SCAN \w+$')
+    
+    def _index_count(self) -> int:
+        with get_connection() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+            ).fetchone()[0]
+    
+    def test_init_database_is_idempotent(self) -> None:
+        count = self._index_count()
+        init_database()
+        self.assertGreaterEqual(count, 14)
+        self.assertEqual(self._index_count(), count)
+    
+    def test_transaction_queries(self) -> None:
+        self.assertUsesIndex(
+            "SELECT uid FROM transactions WHERE date BETWEEN ? AND ?",
+            'idx_transactions_date', ('2024-01-01', '2024-01-31'))
+        self.assertUsesIndex(
+            "SELECT uid FROM transactions WHERE account_id = ? AND date >= ?",
+            'idx_transactions_account_date_uid', ('acc-1', '2024-01-01'))
+        self.assertUsesIndex(
+            "SELECT uid FROM transactions WHERE category_id = ?",
+            'idx_transactions_category_date_uid', ('cat-1',))
+        self.assertUsesIndex(
+            "SELECT uid FROM transactions ORDER BY date, uid LIMIT 50",
+            'idx_transactions_date')
+        self.assertUsesIndex(
+            "SELECT uid FROM transactions WHERE (date, uid) > (?, ?) ORDER BY date, uid LIMIT 50",
+            'idx_transactions_date', ('2024-01-01', 'txn-1'))
+    
+    def test_filtered_transaction_page_needs_no_sort(self) -> None:
+        plan = self._query_plan(
+            "SELECT uid FROM transactions WHERE account_id = ? AND date >= ? AND date <= ? "
+            "ORDER BY date DESC, uid DESC LIMIT 51",
+            ('acc-1', '2024-01-01', '2024-01-31'))
+        self.assertIn('idx_transactions_account_date_uid', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    def test_subscription_instance_queries(self) -> None:
+        self.assertUsesIndex(
+            "SELECT uid FROM subscription_instances WHERE subscription_id = ? AND due_date >= ?",
+            'idx_subscription_instances_subscription_due_date', ('sub-1', '2024-01-01'))
+        self.assertUsesIndex(
+            "SELECT uid FROM subscription_instances WHERE status = ? AND due_date < ?",
+            'idx_subscription_instances_status_due_date', ('due', '2024-01-01'))
+        self.assertUsesIndex(
+            "SELECT uid FROM subscription_instances WHERE due_date BETWEEN ? AND ?",
+            'idx_subscription_instances_due_date', ('2024-01-01', '2024-01-31'))
+    
+    def test_investment_queries(self) -> None:
+        self.assertUsesIndex(
+            "SELECT MAX(date) FROM investment_value_snapshots WHERE investment_id = ?",
+            'idx_investment_value_snapshots_investment_date', ('inv-1',))
+        plan = self._query_plan(
+            "SELECT uid FROM investment_value_snapshots WHERE investment_id = ? AND date <= ? "
+            "ORDER BY date DESC, uid DESC LIMIT 1",
+            ('inv-1', '2024-12-31'))
+        self.assertIn('COVERING INDEX idx_investment_value_snapshots_investment_date_uid', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+        self.assertUsesIndex(
+            "SELECT uid FROM investment_plans WHERE investment_id = ?",
+            'idx_investment_plans_investment', ('inv-1',))
+        self.assertUsesIndex(
+            "SELECT uid FROM investment_plan_instances WHERE investment_plan_id = ? AND due_date <= ?",
+            'idx_investment_plan_instances_plan_due_date', ('plan-1', '2024-12-31'))
+        self.assertUsesIndex(
+            "SELECT uid FROM investment_plan_instances WHERE status = ? AND due_date < ?",
+            'idx_investment_plan_instances_status_due_date', ('planned', '2024-01-01'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+from datetime import date
+from types import ModuleType
+from unittest.mock import patch
+from core.storage.init_db import get_connection, close_pool
+from core.storage.migrate import run_migrations, get_schema_version, backfill_in_batches
+from core.storage.migrations import MIGRATIONS, m0007_transaction_monthly_rollup, m0008_account_balance_checkpoints
+from core.domain import Transaction
+from core.repositories import TransactionRepository, rebuild_balance_checkpoints
+
+
+def make_migration(version: int, upgrade, backfill=None) -> ModuleType:
+    module = ModuleType(f"m{version:04d}_test")
+    module.VERSION = version
+    module.DESCRIPTION = f"Test migration {version}"
+    module.upgrade = upgrade
+    if backfill is not None:
+        module.backfill = backfill
+    return module
+
+
+class TestMigrations(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def _schema_version(self) -> int:
+        with get_connection() as connection:
+            return get_schema_version(connection)
+    
+    def test_fresh_database(self) -> None:
+        applied = run_migrations()
+        self.assertEqual(applied, [module.VERSION for module in MIGRATIONS])
+        self.assertEqual(self._schema_version(), MIGRATIONS[-1].VERSION)
+    
+    def test_rerun_is_noop(self) -> None:
+        run_migrations()
+        self.assertEqual(run_migrations(), [])
+    
+    def test_adopts_unversioned_database(self) -> None:
+        connection = sqlite3.connect(self.test_db.name)
+        connection.execute("CREATE TABLE accounts (uid TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+        connection.execute("INSERT INTO accounts VALUES ('acc-1', 'Checking')")
+        connection.commit()
+        connection.close()
+        
+        run_migrations()
+        with get_connection() as connection:
+            names = connection.execute("SELECT name FROM accounts").fetchall()
+        self.assertEqual(names, [('Checking',)])
+    
+    def test_failed_migration_is_rolled_back(self) -> None:
+        def failing(connection: sqlite3.Connection) -> None:
+            connection.execute("CREATE TABLE partial (uid TEXT)")
+            raise RuntimeError("boom")
+        
+        with self.assertRaises(RuntimeError):
+            run_migrations(migrations=MIGRATIONS + [make_migration(100, failing)])
+        self.assertEqual(self._schema_version(), MIGRATIONS[-1].VERSION)
+        with get_connection() as connection:
+            table = connection.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'partial'"
+            ).fetchone()
+        self.assertIsNone(table)
+    
+    def test_instance_rebuild_keeps_rows_and_indexes(self) -> None:
+        run_migrations(migrations=MIGRATIONS[:3])
+        with get_connection() as connection:
+            connection.execute("INSERT INTO subscriptions VALUES ('sub-1', 'Netflix', 15.99, 'monthly', 1, 15, NULL, 'active')")
+            connection.execute("INSERT INTO subscription_instances VALUES ('si-1', 'sub-1', 15.99, '2024-01-15', NULL, 'due')")
+            connection.commit()
+        
+        self.assertEqual(run_migrations(migrations=MIGRATIONS[:4]), [4])
+        with get_connection() as connection:
+            rows = connection.execute("SELECT uid, subscription_id FROM subscription_instances").fetchall()
+            indexes = connection.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = 'subscription_instances' "
+                "AND name LIKE 'idx_%'"
+            ).fetchone()[0]
+            on_delete = {row[3]: row[6] for row in connection.execute("PRAGMA foreign_key_list(subscription_instances)")}
+            foreign_keys = connection.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.assertEqual(rows, [('si-1', 'sub-1')])
+        self.assertEqual(indexes, 4)
+        self.assertEqual(on_delete, {'subscription_id': 'NO ACTION', 'transaction_id': 'SET NULL'})
+        self.assertEqual(foreign_keys, 1)
+    
+    def _rollup(self) -> list[tuple]:
+        with get_connection() as connection:
+            return connection.execute("SELECT * FROM transaction_monthly_rollup ORDER BY 1, 2, 3").fetchall()
+    
+    def test_derived_tables_backfilled_after_upgrade(self) -> None:
+        run_migrations(migrations=MIGRATIONS[:6])
+        with get_connection() as connection:
+            connection.executemany("INSERT INTO accounts VALUES (?, ?)", [('acc-1', 'Checking'), ('acc-2', 'Savings')])
+            connection.execute("INSERT INTO categories VALUES ('cat-1', 'Food')")
+            connection.executemany(
+                "INSERT INTO transactions VALUES (?, 'Item', ?, ?, ?, 'cat-1')",
+                [(f"txn-{i}", 10.0 + i, f"2024-0{1 + i % 3}-05", f"acc-{1 + i % 2}") for i in range(12)]
+            )
+            connection.commit()
+        
+        # A write lands between the upgrade and an interrupted backfill; its delta must not be lost or doubled
+        with patch.object(m0007_transaction_monthly_rollup, 'backfill', side_effect=RuntimeError("boom")), \
+                patch.object(m0008_account_balance_checkpoints, 'backfill', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                run_migrations()
+        TransactionRepository().create(Transaction(uid='txn-new', name='Late', amount=5.0, date=date(2024, 1, 20),
+                                                   account_id='acc-1', category_id='cat-1'))
+        run_migrations()
+        
+        with get_connection() as connection:
+            expected = connection.execute("""
+                SELECT substr(date, 1, 7), account_id, category_id, COUNT(*), SUM(amount) FROM transactions
+                GROUP BY 1, 2, 3 ORDER BY 1, 2, 3
+            """).fetchall()
+            pending = connection.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'transaction_monthly_rollup_pending'"
+            ).fetchone()
+            backfilled = connection.execute("SELECT version FROM schema_backfills").fetchall()
+            checkpoints = connection.execute(
+                "SELECT account_id, month, balance FROM account_balance_checkpoints ORDER BY 1, 2"
+            ).fetchall()
+            connection.execute("DELETE FROM account_balance_checkpoints")
+            connection.commit()
+        self.assertEqual(self._rollup(), expected)
+        self.assertIsNone(pending)
+        self.assertEqual(backfilled, [(7,), (8,)])
+        rebuild_balance_checkpoints()
+        with get_connection() as connection:
+            rebuilt = connection.execute(
+                "SELECT account_id, month, balance FROM account_balance_checkpoints ORDER BY 1, 2"
+            ).fetchall()
+        self.assertEqual(checkpoints, rebuilt)
+    
+    def test_rejects_unordered_migrations(self) -> None:
+        noop = lambda connection: None
+        with self.assertRaises(ValueError):
+            run_migrations(migrations=[make_migration(2, noop), make_migration(1, noop)])
+    
+    def _insert_transactions(self) -> None:
+        run_migrations()
+        with get_connection() as connection:
+            connection.execute("INSERT INTO accounts VALUES ('acc-1', 'Checking')")
+            connection.execute("INSERT INTO categories VALUES ('cat-1', 'Food')")
+            connection.executemany(
+                "INSERT INTO transactions VALUES (?, 'Item', ?, '2024-01-01', 'acc-1', 'cat-1')",
+                [(f"txn-{i}", i + 0.25) for i in range(10)]
+            )
+            connection.commit()
+    
+    @staticmethod
+    def _add_cents(connection: sqlite3.Connection) -> None:
+        connection.execute("ALTER TABLE transactions ADD COLUMN amount_cents INTEGER")
+    
+    @staticmethod
+    def _backfill_cents(connection: sqlite3.Connection) -> int:
+        return backfill_in_batches(
+            connection,
+            select_sql="SELECT CAST(ROUND(amount * 100) AS INTEGER), uid FROM transactions "
+                       "WHERE amount_cents IS NULL LIMIT ?",
+            update_sql="UPDATE transactions SET amount_cents = ? WHERE uid = ?",
+            batch_size=3,
+        )
+    
+    def _missing_cents(self) -> int:
+        with get_connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM transactions WHERE amount_cents IS NULL").fetchone()[0]
+    
+    def test_batched_backfill(self) -> None:
+        commits: list[int] = []
+        self._insert_transactions()
+        
+        migration = make_migration(100, self._add_cents,
+                                   lambda connection: commits.append(self._backfill_cents(connection)))
+        self.assertEqual(run_migrations(migrations=MIGRATIONS + [migration]), [100])
+        self.assertEqual(commits, [10])
+        with get_connection() as connection:
+            cents = connection.execute(
+                "SELECT amount_cents FROM transactions WHERE uid = 'txn-2'"
+            ).fetchone()[0]
+        self.assertEqual(cents, 225)
+        self.assertEqual(self._schema_version(), 100)
+        
+        run_migrations(migrations=MIGRATIONS + [migration])
+        self.assertEqual(commits, [10])
+    
+    def test_backfill_runs_each_statement_per_row(self) -> None:
+        self._insert_transactions()
+        
+        def backfill(connection: sqlite3.Connection) -> None:
+            backfill_in_batches(
+                connection,
+                select_sql="SELECT uid FROM pending LIMIT ?",
+                update_sql=["UPDATE transactions SET amount_cents = 1 WHERE uid = ?",
+                            "DELETE FROM pending WHERE uid = ?"],
+                batch_size=4,
+            )
+        
+        def upgrade(connection: sqlite3.Connection) -> None:
+            self._add_cents(connection)
+            connection.execute("CREATE TABLE pending (uid TEXT PRIMARY KEY)")
+            connection.execute("INSERT INTO pending SELECT uid FROM transactions")
+        
+        run_migrations(migrations=MIGRATIONS + [make_migration(100, upgrade, backfill)])
+        self.assertEqual(self._missing_cents(), 0)
+        with get_connection() as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM pending").fetchone()[0], 0)
+    
+    def test_interrupted_backfill_resumes(self) -> None:
+        self._insert_transactions()
+        
+        def interrupted(connection: sqlite3.Connection) -> None:
+            connection.execute("UPDATE transactions SET amount_cents = 0 WHERE uid IN ('txn-0', 'txn-1', 'txn-2')")
+            connection.commit()
+            raise RuntimeError("boom")
+        
+        with self.assertRaises(RuntimeError):
+            run_migrations(migrations=MIGRATIONS + [make_migration(100, self._add_cents, interrupted)])
+        self.assertEqual(self._schema_version(), 100)
+        self.assertEqual(self._missing_cents(), 7)
+        
+        resumed = make_migration(100, self._add_cents, self._backfill_cents)
+        self.assertEqual(run_migrations(migrations=MIGRATIONS + [resumed]), [])
+        self.assertEqual(self._missing_cents(), 0)
+    
+    def test_backfill_refuses_to_run_in_upgrade(self) -> None:
+        self._insert_transactions()
+        
+        def upgrade(connection: sqlite3.Connection) -> None:
+            self._add_cents(connection)
+            self._backfill_cents(connection)
+        
+        with self.assertRaises(RuntimeError):
+            run_migrations(migrations=MIGRATIONS + [make_migration(100, upgrade)])
+        self.assertEqual(self._schema_version(), MIGRATIONS[-1].VERSION)
+        with get_connection() as connection:
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(transactions)")]
+        self.assertNotIn('amount_cents', columns)
+
+if __name__ == '__main__':
+    unittest.main()
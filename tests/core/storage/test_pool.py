@@ -0,0 +1,154 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from core.storage.init_db import init_database, get_connection, get_pool, close_pool, transaction
+from core.storage.pool import ConnectionPool
+from core.utils.exceptions import ConnectionPoolTimeoutError
+from core.domain import Account, Category, Transaction
+from core.repositories import AccountRepository, CategoryRepository, TransactionRepository
+
+
+class TestConnectionPool(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        self.pool = ConnectionPool(database=Path(self.test_db.name), max_size=2, acquire_timeout=0.1)
+    
+    def tearDown(self) -> None:
+        self.pool.close()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+    
+    def test_reuses_released_connection(self) -> None:
+        first = self.pool.acquire()
+        self.pool.release(first)
+        second = self.pool.acquire()
+        self.assertIs(first, second)
+        self.assertEqual(self.pool.open_count, 1)
+        self.pool.release(second)
+    
+    def test_acquire_times_out_when_exhausted(self) -> None:
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        with self.assertRaises(ConnectionPoolTimeoutError):
+            self.pool.acquire()
+        self.pool.release(first)
+        self.pool.release(second)
+    
+    def test_waiting_thread_gets_released_connection(self) -> None:
+        self.pool.acquire_timeout = 2.0
+        held = [self.pool.acquire(), self.pool.acquire()]
+        acquired: list[sqlite3.Connection] = []
+        worker = threading.Thread(target=lambda: acquired.append(self.pool.acquire()))
+        worker.start()
+        self.pool.release(held[0])
+        worker.join(timeout=2.0)
+        self.assertEqual(acquired, [held[0]])
+        self.pool.release(acquired[0])
+        self.pool.release(held[1])
+    
+    def test_idle_connections_expire(self) -> None:
+        self.pool.idle_timeout = 0.0
+        first = self.pool.acquire()
+        self.pool.release(first)
+        time.sleep(0.01)
+        second = self.pool.acquire()
+        self.assertIsNot(first, second)
+        self.assertEqual(self.pool.open_count, 1)
+        self.pool.release(second)
+    
+    def test_release_rolls_back_open_transaction(self) -> None:
+        connection = self.pool.acquire()
+        connection.execute("CREATE TABLE items (uid TEXT)")
+        connection.commit()
+        connection.execute("INSERT INTO items VALUES ('a')")
+        self.pool.release(connection)
+        connection = self.pool.acquire()
+        count = connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        self.assertEqual(count, 0)
+        self.pool.release(connection)
+
+
+class TestGetConnection(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.test_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.test_db.close()
+        os.environ['MONEY_MANAGER_DB'] = self.test_db.name
+        init_database()
+    
+    def tearDown(self) -> None:
+        close_pool()
+        if os.path.exists(self.test_db.name):
+            os.unlink(self.test_db.name)
+        if 'MONEY_MANAGER_DB' in os.environ:
+            del os.environ['MONEY_MANAGER_DB']
+    
+    def test_connection_returned_to_pool(self) -> None:
+        with get_connection() as connection:
+            self.assertEqual(get_pool().idle_count, 0)
+        self.assertEqual(get_pool().idle_count, 1)
+        with get_connection() as reused:
+            self.assertIs(connection, reused)
+    
+    def test_pool_follows_database_path(self) -> None:
+        pool = get_pool()
+        other_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        other_db.close()
+        try:
+            os.environ['MONEY_MANAGER_DB'] = other_db.name
+            self.assertIsNot(get_pool(), pool)
+        finally:
+            close_pool()
+            os.unlink(other_db.name)
+    
+    def test_transaction_shares_connection_and_rolls_back(self) -> None:
+        repo = CategoryRepository()
+        with self.assertRaises(RuntimeError):
+            with transaction() as outer:
+                repo.create(Category(uid='cat-1', name='Groceries'))
+                with get_connection() as inner:
+                    self.assertIs(inner, outer)
+                raise RuntimeError("abort")
+        self.assertIsNone(repo.get_by_id('cat-1'))
+        
+        with transaction():
+            repo.create(Category(uid='cat-2', name='Rent'))
+        self.assertIsNotNone(repo.get_by_id('cat-2'))
+    
+    @unittest.skipUnless(os.getenv('MONEY_MANAGER_BENCHMARKS'), "set MONEY_MANAGER_BENCHMARKS=1 to run benchmarks")
+    def test_benchmark_get_by_id_latency(self) -> None:
+        """Compare per-lookup latency of connect-per-call against pooled connections (run with pytest -s)"""
+        AccountRepository().create(Account(uid='acc-1', name='Checking'))
+        CategoryRepository().create(Category(uid='cat-1', name='Groceries'))
+        # Transactions are not cached, so every lookup goes to SQLite
+        repo = TransactionRepository()
+        repo.create(Transaction(uid='txn-1', name='Lunch', amount=12.0, date=date(2024, 1, 1),
+                                account_id='acc-1', category_id='cat-1'))
+        sql = f"{repo._get_select_sql()} WHERE uid = ?"
+        iterations = 2000
+        
+        start = time.perf_counter()
+        for _ in range(iterations):
+            connection = sqlite3.connect(database=self.test_db.name)
+            connection.execute(sql, ('txn-1',)).fetchone()
+            connection.close()
+        direct = (time.perf_counter() - start) / iterations
+        
+        start = time.perf_counter()
+        for _ in range(iterations):
+            repo.get_by_id('txn-1')
+        pooled = (time.perf_counter() - start) / iterations
+        
+        print(f"\nget_by_id latency: connect-per-call {direct * 1e6:.1f}us, pooled {pooled * 1e6:.1f}us")
+        self.assertLess(pooled, direct)
+
+
+if __name__ == '__main__':
+    unittest.main()